@@ -5,12 +5,13 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QLineEdit, QComboBox, QLabel, QSpinBox, QTableWidgetItem,
                            QDialog, QDialogButtonBox, QCalendarWidget, QTimeEdit,
                            QMenu, QMenuBar, QMessageBox)
-from PyQt6.QtCore import Qt, QTime, QDate
+from PyQt6.QtCore import Qt, QTime, QDate, QTimer
 from PyQt6.QtGui import QIcon
 from PyQt6 import uic
 from pathlib import Path
 
 from src.database.db_manager import DatabaseManager
+from src.controllers.read_worker import ReadWorker
 from src.controllers import (
     StudentController,
     CourseController,
@@ -31,6 +32,7 @@ from src.views.tabs.settings_tab import SettingsTab
 from src.views.tabs.subject_tab import SubjectTab
 from src.views.calendar_container import CalendarContainer
 from src.views.status_display import StatusDisplay
+from src.views.async_loader import AsyncLoader
 from src.models.holiday_manager import HolidayManager
 
 class SchoolManagement(QMainWindow):
@@ -53,9 +55,13 @@ class SchoolManagement(QMainWindow):
         self.controllers.grading_system = GradingSystemController(self.db)
         self.controllers.assessment_template = AssessmentTemplateController(self.db)
 
-        # Holiday Manager initialisieren und Daten laden
+        # Lesende Abfragen im Hintergrund (eigene Verbindung, eigene Controller)
+        self.db_worker = ReadWorker(self.db.db_file)
+        self.loader = AsyncLoader(self.db_worker, self)
+
+        # Holiday Manager initialisieren (Daten werden nach dem Anzeigen
+        # des Fensters im Hintergrund geladen, siehe start_holiday_sync)
         self.holiday_manager = HolidayManager(self.db)
-        self.holiday_manager.initialize_holidays()
         
         # UI aus .ui Datei laden
         uic.loadUi("school.ui", self)
@@ -159,6 +165,19 @@ class SchoolManagement(QMainWindow):
         self.list_manager.update_all(date)
         self.list_manager.update_day_list(date)
 
+    def start_holiday_sync(self):
+        """Lädt fehlende Ferien/Feiertage im Hintergrund nach"""
+        future = self.holiday_manager.start_background_sync()
+        if future is not None:
+            # Speichern im GUI-Thread; Kalender aktualisiert sich über
+            # die Änderungsmeldungen der Datenbank
+            self.loader.watch(
+                'holidays', future,
+                on_done=self.holiday_manager.store_fetched,
+                on_error=lambda e: self.holiday_manager.logger.error(
+                    f"Fehler beim Laden der Feiertage: {str(e)}")
+            )
+
     def refresh_all(self):
         """Aktualisiert alle relevanten Ansichten"""
         # Refresh various tabs and dialogs
@@ -169,5 +188,10 @@ class SchoolManagement(QMainWindow):
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     school = SchoolManagement()
+    # Verbindung sauber schließen (inkl. PRAGMA optimize)
+    app.aboutToQuit.connect(school.db_worker.shutdown)
+    app.aboutToQuit.connect(school.db.close)
     school.show()
+    # Erst nach dem ersten Zeichnen des Fensters starten
+    QTimer.singleShot(0, school.start_holiday_sync)
     sys.exit(app.exec())
\ No newline at end of file
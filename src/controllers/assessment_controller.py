@@ -8,6 +8,7 @@ Kapselt Business-Logik und Datenaggregation für Noten-bezogene Operationen.
 
 from typing import Dict, List, Any, Optional
 from .base_controller import BaseController
+from src.models.grading_scale import GradingScale
 
 
 class AssessmentController(BaseController):
@@ -55,6 +56,19 @@ class AssessmentController(BaseController):
         """
         self.assessment_repo.delete(student_id, lesson_id)
     
+    def save_lesson_assessments(self, lesson_id: int, assessments: List[Dict[str, Any]],
+                                deleted_student_ids: List[int]) -> None:
+        """Speichert alle Bewertungen einer Stunde in einer Transaktion.
+        
+        Args:
+            lesson_id: ID der Stunde
+            assessments: Zu speichernde Bewertungen (wie bei add_or_update_assessment)
+            deleted_student_ids: Schüler, deren Note in der Stunde gelöscht wird
+        """
+        with self.db.transaction():
+            self.assessment_repo.delete_many(lesson_id, deleted_student_ids)
+            self.assessment_repo.upsert_many(assessments)
+    
     def get_assessment(self, student_id: int, lesson_id: int) -> Optional[Dict[str, Any]]:
         """Holt eine Bewertung.
         
@@ -90,6 +104,38 @@ class AssessmentController(BaseController):
         """
         return self.assessment_repo.calculate_final_grade(student_id, course_id)
     
+    def calculate_course_grades(self, course_id: int,
+                                start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+        """Berechnet End- und Typnoten aller Schüler eines Kurses.
+        
+        Args:
+            course_id: ID des Kurses
+            start_date: Optional, Startdatum (YYYY-MM-DD)
+            end_date: Optional, Enddatum (YYYY-MM-DD)
+            
+        Returns:
+            Schüler-ID -> {'final_grade': float|None, 'type_averages': {Typ-ID: float}}
+        """
+        return self.assessment_repo.calculate_course_grades(course_id, start_date, end_date)
+    
+    def rebuild_grade_aggregates(self) -> None:
+        """Baut die Summentabelle der Noten neu auf."""
+        self.assessment_repo.rebuild_aggregates()
+    
+    def get_gradebook(self, course_id: int,
+                      semester_id: Optional[int] = None) -> Dict[str, Any]:
+        """Holt das Notenbuch eines Kurses (Schüler × Bewertungen).
+        
+        Args:
+            course_id: ID des Kurses
+            semester_id: Optional, ID des Halbjahres
+            
+        Returns:
+            Dictionary mit students, types, columns, grades und final_stats
+        """
+        return self.assessment_repo.get_gradebook(course_id, semester_id)
+    
     def get_student_course_grades(self, student_id: int) -> Dict[int, Dict[str, Any]]:
         """Holt die Gesamtnoten eines Schülers für alle seine Kurse.
         
@@ -141,6 +187,15 @@ class AssessmentController(BaseController):
         """
         self.attendance_repo.mark_present(lesson_id, student_id)
     
+    def set_absent_students(self, lesson_id: int, student_ids: List[int]) -> None:
+        """Setzt die abwesenden Schüler einer Stunde.
+        
+        Args:
+            lesson_id: ID der Stunde
+            student_ids: IDs aller abwesenden Schüler
+        """
+        self.attendance_repo.set_absent_students(lesson_id, student_ids)
+    
     def get_first_assessment_for_lesson(self, lesson_id: int) -> Optional[Dict[str, Any]]:
         """Holt das erste Assessment einer Stunde (für Assessment-Typ-Info).
         
@@ -243,6 +298,17 @@ class AssessmentController(BaseController):
         """
         return self.grading_system_repo.get_by_course(course_id)
 
+    def get_grading_scale_for_course(self, course_id: int) -> Optional[GradingScale]:
+        """Holt die vorberechnete Notenskala für einen Kurs.
+        
+        Args:
+            course_id: ID des Kurses
+            
+        Returns:
+            GradingScale oder None wenn der Kurs kein Notensystem hat
+        """
+        return self.grading_system_repo.get_scale_for_course(course_id)
+
     def validate_assessment_input(self, student_id: int, course_id: int,
                                   assessment_type_id: int, grade: float,
                                   date: str) -> None:
@@ -281,82 +347,128 @@ class AssessmentController(BaseController):
                 f"nicht zum Kurs (ID: {course_id})"
             )
 
-        # 3. Prüfe ob die Note zum Notensystem passt
-        cursor = self.db.execute(
-            """SELECT gs.* 
-               FROM assessment_type_templates att
-               JOIN grading_systems gs ON att.grading_system_id = gs.id
-               WHERE att.id = ?""",
-            (assessment_type_id,)
-        )
-        grading_system = cursor.fetchone()
-        if grading_system:
-            if not self.grading_system_repo.validate_grade(grade, grading_system['id']):
-                raise ValueError(
-                    f"Die Note {grade} ist im Notensystem "
-                    f"'{grading_system['name']}' nicht gültig"
-                )
+        # 3. Prüfe ob die Note zum Notensystem des Kurses passt
+        scale = self.grading_system_repo.get_scale_for_course(course_id)
+        if scale and not scale.is_valid(grade):
+            raise ValueError(
+                f"Die Note {grade} ist im Notensystem "
+                f"'{scale.name}' nicht gültig"
+            )
 
     def get_assessment_statistics(self, course_id: int,
                                   start_date: Optional[str] = None,
                                   end_date: Optional[str] = None) -> Dict[str, Any]:
         """Berechnet verschiedene Statistiken für einen Kurs.
         
+        Kurzform von get_grade_statistics() für einen Kurs (z.B. für den
+        Export): Anzahl, ungewichteter Durchschnitt, beste und schlechteste
+        Note, zusätzlich gewichteter Durchschnitt, Median und
+        Standardabweichung.
+        
         Args:
             course_id: ID des Kurses
             start_date: Optional, Startdatum (YYYY-MM-DD)
             end_date: Optional, Enddatum (YYYY-MM-DD)
             
         Returns:
-            Dict mit statistischen Werten
-        """
-        query = """
-            SELECT 
-                COUNT(*) as total_count,
-                AVG(a.grade) as average_grade,
-                MIN(a.grade) as best_grade,
-                MAX(a.grade) as worst_grade,
-                a.assessment_type_id,
-                t.name as type_name
-            FROM assessments a
-            JOIN assessment_types t ON a.assessment_type_id = t.id
-            WHERE a.course_id = ?
+            Dict mit 'total' und 'by_type' (Typname -> Statistik)
         """
-        params = [course_id]
-        if start_date:
-            query += " AND date >= ?"
-            params.append(start_date)
-        if end_date:
-            query += " AND date <= ?"
-            params.append(end_date)
-        query += " GROUP BY assessment_type_id"
-        cursor = self.db.execute(query, tuple(params))
-        type_stats = {row['type_name']: dict(row) for row in cursor.fetchall()}
+        from src.models.grade_statistics import GradeStatistics
+        
+        stats = GradeStatistics(
+            self.assessment_repo.get_statistics_rows([course_id], start_date, end_date),
+            higher_is_better=self._higher_is_better([course_id])
+        )
+        
+        def as_row(values: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                'total_count': values['count'],
+                'average_grade': values['mean'],
+                'best_grade': values['best'],
+                'worst_grade': values['worst'],
+                'weighted_average': values['weighted_mean'],
+                'median_grade': values['median'],
+                'std_deviation': values['std']
+            }
+        
+        by_type = stats.by_type()
+        type_names = {}
+        if by_type:
+            cursor = self.db.execute(
+                f"""SELECT id, name FROM assessment_types
+                    WHERE id IN ({', '.join('?' * len(by_type))})""",
+                tuple(by_type)
+            )
+            type_names = {row['id']: row['name'] for row in cursor.fetchall()}
+        
+        type_stats = {}
+        for type_id, values in by_type.items():
+            name = type_names.get(type_id, str(type_id))
+            type_stats[name] = dict(as_row(values), assessment_type_id=type_id, type_name=name)
+        
+        return {
+            'total': as_row(stats.summary()),
+            'by_type': type_stats
+        }
 
-        total_query = """
-            SELECT 
-                COUNT(*) as total_count,
-                AVG(a.grade) as average_grade,
-                MIN(a.grade) as best_grade,
-                MAX(a.grade) as worst_grade
-            FROM assessments a
-            WHERE a.course_id = ?
+    def get_grade_statistics(self, course_ids: List[int],
+                             start_date: Optional[str] = None,
+                             end_date: Optional[str] = None,
+                             bins: int = 10) -> Dict[str, Any]:
+        """Berechnet ausführliche Notenstatistiken für einen oder mehrere Kurse.
+        
+        Alle Noten werden mit einer Abfrage geladen und mit NumPy
+        ausgewertet, z.B. für eine ganze Jahrgangsstufe oder ein Archiv
+        mehrerer Schuljahre.
+        
+        Args:
+            course_ids: IDs der Kurse (z.B. alle Kurse eines Jahrgangs)
+            start_date: Optional, Startdatum (YYYY-MM-DD)
+            end_date: Optional, Enddatum (YYYY-MM-DD)
+            bins: Anzahl der Histogrammklassen
+            
+        Returns:
+            Dict mit 'summary', 'distribution', 'histogram', 'by_type'
+            (inkl. 'type_name') und 'by_course'
         """
-        total_params = [course_id]
-        if start_date:
-            total_query += " AND date >= ?"
-            total_params.append(start_date)
-        if end_date:
-            total_query += " AND date <= ?"
-            total_params.append(end_date)
-        cursor = self.db.execute(total_query, tuple(total_params))
-        total_stats = dict(cursor.fetchone())
-
+        from src.models.grade_statistics import GradeStatistics
+        
+        stats = GradeStatistics(
+            self.assessment_repo.get_statistics_rows(course_ids, start_date, end_date),
+            higher_is_better=self._higher_is_better(course_ids)
+        )
+        
+        # Verteilung über alle Noten der Skala, wenn nur ein Kurs ausgewertet wird
+        scale = (self.grading_system_repo.get_scale_for_course(course_ids[0])
+                 if len(course_ids) == 1 else None)
+        
+        by_type = stats.by_type()
+        if by_type:
+            cursor = self.db.execute(
+                f"""SELECT id, name FROM assessment_types
+                    WHERE id IN ({', '.join('?' * len(by_type))})""",
+                tuple(by_type)
+            )
+            for row in cursor.fetchall():
+                by_type[row['id']]['type_name'] = row['name']
+        
         return {
-            'total': total_stats,
-            'by_type': type_stats
+            'summary': stats.summary(),
+            'distribution': stats.distribution(scale.values if scale else None),
+            'histogram': stats.histogram(bins),
+            'by_type': by_type,
+            'by_course': stats.by_course()
         }
 
+    def _higher_is_better(self, course_ids: List[int]) -> bool:
+        """Prüft, ob in allen Kursen die höchste Note die beste ist.
+        
+        Kurse ohne Notensystem und gemischte Skalen zählen wie 1-6.
+        """
+        scales = [self.grading_system_repo.get_scale_for_course(course_id)
+                  for course_id in course_ids]
+        return bool(scales) and all(scale and scale.higher_is_better for scale in scales)
+
     def get_course_grade_export(self, course_id: int) -> Dict[str, Any]:
         """Erstellt eine exportierbare Übersicht aller Noten eines Kurses.
         
@@ -406,5 +518,6 @@ class AssessmentController(BaseController):
             'types': types,
             'students': students,
             'grades': grades,
-            'statistics': statistics
+            'statistics': statistics,
+            'gradebook': self.assessment_repo.get_gradebook(course_id)
         }
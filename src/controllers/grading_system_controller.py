@@ -8,6 +8,7 @@ Kapselt Business-Logik für Notensystem-Verwaltung.
 
 from typing import Dict, Any, Optional, List
 from .base_controller import BaseController
+from src.models.grading_scale import GradingScale
 
 
 class GradingSystemController(BaseController):
@@ -24,6 +25,17 @@ class GradingSystemController(BaseController):
         """
         return self.grading_system_repo.get_by_id(system_id)
     
+    def get_grading_scale(self, system_id: int) -> Optional[GradingScale]:
+        """Holt die vorberechnete Notenskala eines Notensystems.
+        
+        Args:
+            system_id: ID des Notensystems
+            
+        Returns:
+            GradingScale oder None
+        """
+        return self.grading_system_repo.get_scale(system_id)
+    
     def get_all_grading_systems(self) -> List[Dict[str, Any]]:
         """Holt alle Notensysteme.
         
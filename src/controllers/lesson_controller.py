@@ -7,7 +7,7 @@ Kapselt Business-Logik und Datenaggregation für Stunden-bezogene Operationen.
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from .base_controller import BaseController
 
 
@@ -36,6 +36,43 @@ class LessonController(BaseController):
         """
         return self.lesson_repo.get_by_date(date)
     
+    def get_week_schedule(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Holt Stunden und freie Tage eines Zeitraums für die Wochenansicht.
+        
+        Benötigt genau zwei Abfragen: eine für die Stunden, eine für die
+        Feiertage, Ferien und schulfreien Tage.
+        
+        Args:
+            start_date: Startdatum im Format 'YYYY-MM-DD'
+            end_date: Enddatum im Format 'YYYY-MM-DD' (inklusive)
+            
+        Returns:
+            Dictionary mit:
+                - lessons: {Datum: {Uhrzeit: [Stunden]}}, enthält jedes
+                  Datum des Zeitraums (ggf. mit leerem Dictionary)
+                - holidays: {Datum: freier Tag}; bei mehreren Einträgen hat
+                  ein Feiertag Vorrang vor Ferien, diese vor Schulfrei
+        """
+        lessons_by_date = {}
+        current = datetime.strptime(start_date, "%Y-%m-%d").date()
+        last = datetime.strptime(end_date, "%Y-%m-%d").date()
+        while current <= last:
+            lessons_by_date[current.isoformat()] = {}
+            current += timedelta(days=1)
+        
+        for lesson in self.lesson_repo.get_by_date_range(start_date, end_date):
+            lessons_by_date[lesson['date']].setdefault(lesson['time'], []).append(lesson)
+        
+        priority = {'holiday': 0, 'vacation_day': 1, 'school': 2}
+        holidays = {}
+        for holiday in self.holiday_repo.get_by_date_range(start_date, end_date):
+            current_holiday = holidays.get(holiday['date'])
+            if (current_holiday is None or
+                    priority.get(holiday['type'], 1) < priority.get(current_holiday['type'], 1)):
+                holidays[holiday['date']] = holiday
+        
+        return {'lessons': lessons_by_date, 'holidays': holidays}
+    
     def create_lesson(self, course_id: int, date: str, time: str,
                      topic: Optional[str] = None, homework: Optional[str] = None,
                      duration: Optional[int] = None, status: str = "normal",
@@ -110,6 +147,28 @@ class LessonController(BaseController):
         """
         return self.lesson_repo.add(data)
     
+    def add_lessons(self, lessons_data: List[Dict[str, Any]]) -> List[int]:
+        """Fügt mehrere Unterrichtsstunden in einer Transaktion hinzu.
+        
+        Wiederkehrende Stunden aller Slots werden gemeinsam als Serie
+        angelegt (siehe LessonRepository.add_recurring_series).
+        
+        Args:
+            lessons_data: Liste von Dictionaries mit Stundendaten
+            
+        Returns:
+            Liste der IDs aller erstellten Stunden
+        """
+        recurring = [data for data in lessons_data if data.get('is_recurring')]
+        single = [data for data in lessons_data if not data.get('is_recurring')]
+        
+        lesson_ids = []
+        with self.db.transaction():
+            for data in single:
+                lesson_ids.append(self.lesson_repo.add(data))
+            lesson_ids.extend(self.lesson_repo.add_recurring_series(recurring))
+        return lesson_ids
+    
     def get_next_lesson_by_course(self, date: str) -> List[Dict[str, Any]]:
         """Holt für jeden Kurs die nächste anstehende Stunde nach einem Datum.
         
@@ -134,6 +193,19 @@ class LessonController(BaseController):
         """
         return self.lesson_repo.get_previous_homework(course_id, date, time)
     
+    def get_previous_homework_batch(self, lesson_ids: Optional[List[int]] = None,
+                                    date: Optional[str] = None) -> Dict[int, Optional[str]]:
+        """Holt die Hausaufgaben der jeweils vorherigen Stunde für mehrere Stunden.
+        
+        Args:
+            lesson_ids: Optional, IDs der Stunden
+            date: Optional, alle Stunden dieses Datums ('YYYY-MM-DD')
+            
+        Returns:
+            Dictionary lesson_id -> Hausaufgaben-Text oder None
+        """
+        return self.lesson_repo.get_previous_homework_batch(lesson_ids, date)
+    
     def update_lesson(self, lesson_id: int, data: Dict[str, Any], 
                      update_all_following: bool = False) -> List[int]:
         """Aktualisiert eine oder mehrere Unterrichtsstunden.
@@ -157,6 +229,17 @@ class LessonController(BaseController):
         """
         self.lesson_repo.delete(lesson_id, delete_all)
     
+    def get_lesson_roster(self, lesson_id: int) -> List[Dict[str, Any]]:
+        """Holt Schüler, Abwesenheiten, Noten und Kommentare einer Stunde.
+        
+        Args:
+            lesson_id: ID der Stunde
+            
+        Returns:
+            Liste von Dictionaries (siehe LessonRepository.get_roster)
+        """
+        return self.lesson_repo.get_roster(lesson_id)
+    
     def get_competencies_for_lesson(self, lesson_id: int) -> List[Dict[str, Any]]:
         """Holt alle Kompetenzen einer Stunde.
         
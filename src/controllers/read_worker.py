@@ -0,0 +1,190 @@
+# src/controllers/read_worker.py
+
+"""
+Hintergrund-Thread für lesende Controller-Aufrufe.
+
+Der Worker besitzt eine eigene, nur lesende Datenbankverbindung und eigene
+Controller-Instanzen. Aufrufe werden nacheinander in seinem Thread
+ausgeführt und liefern concurrent.futures.Future-Objekte zurück, sodass
+langsame Abfragen den GUI-Thread nicht blockieren.
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+from src.database.db_manager import DatabaseManager
+from .student_controller import StudentController
+from .course_controller import CourseController
+from .lesson_controller import LessonController
+from .assessment_controller import AssessmentController
+from .settings_controller import SettingsController
+from .semester_controller import SemesterController
+from .subject_controller import SubjectController
+from .competency_controller import CompetencyController
+from .grading_system_controller import GradingSystemController
+from .assessment_template_controller import AssessmentTemplateController
+
+
+# Controller-Namen wie in SchoolManagement.controllers
+CONTROLLER_CLASSES = {
+    'student': StudentController,
+    'course': CourseController,
+    'lesson': LessonController,
+    'assessment': AssessmentController,
+    'settings': SettingsController,
+    'semester': SemesterController,
+    'subject': SubjectController,
+    'competency': CompetencyController,
+    'grading_system': GradingSystemController,
+    'assessment_template': AssessmentTemplateController,
+}
+
+
+class _Request:
+    """Ein eingereichter Aufruf (für den Abbruch laufender Abfragen)."""
+    __slots__ = ('future', 'cancelled')
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.cancelled = False
+
+
+class ReadWorker:
+    """Führt lesende Controller-Aufrufe in einem eigenen Thread aus.
+
+    Aufrufe mit demselben Schlüssel ersetzen einander: Wird ein neuer
+    Aufruf eingereicht, bevor der vorherige fertig ist, wird der vorherige
+    abgebrochen (wartend: verworfen, laufend: per sqlite3 interrupt()).
+    """
+
+    def __init__(self, db_file: str, profile: str = 'read'):
+        """Startet den Worker-Thread.
+
+        Die Verbindung wird im Worker-Thread geöffnet. Das Schema muss
+        bereits aktuell sein (Migrationen laufen über die Hauptverbindung).
+
+        Args:
+            db_file: Pfad zur Datenbankdatei
+            profile: Verbindungsprofil des DatabaseManager
+        """
+        self.db_file = db_file
+        self.profile = profile
+        self._db = None
+        self._controllers = None
+        self._lock = threading.RLock()  # cancel() ruft Done-Callbacks synchron auf
+        self._current: Optional[_Request] = None
+        self._latest: Dict[str, _Request] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='db-read',
+            initializer=self._open
+        )
+
+    def _open(self) -> None:
+        """Öffnet Verbindung und Controller im Worker-Thread."""
+        self._db = DatabaseManager(self.db_file, profile=self.profile)
+        self._controllers = SimpleNamespace(**{
+            name: controller_class(self._db)
+            for name, controller_class in CONTROLLER_CLASSES.items()
+        })
+
+    def submit(self, func: Callable[..., Any], *args,
+               key: Optional[str] = None, **kwargs) -> Future:
+        """Führt eine Funktion im Worker-Thread aus.
+
+        Args:
+            func: Wird als func(controllers, *args, **kwargs) aufgerufen;
+                  controllers entspricht SchoolManagement.controllers
+            key: Optional, Schlüssel der Anfrage; eine noch offene Anfrage
+                 mit demselben Schlüssel wird abgebrochen
+
+        Returns:
+            Future mit dem Rückgabewert von func
+        """
+        request = _Request()
+        with self._lock:
+            if key is not None:
+                previous = self._latest.get(key)
+                if previous is not None:
+                    self._cancel_request(previous)
+                self._latest[key] = request
+            request.future = self._executor.submit(self._run, request, func, args, kwargs)
+        if key is not None:
+            request.future.add_done_callback(lambda _: self._forget(key, request))
+        return request.future
+
+    def call(self, controller: str, method: str, *args,
+             key: Optional[str] = None, **kwargs) -> Future:
+        """Ruft eine Controller-Methode im Worker-Thread auf.
+
+        Args:
+            controller: Name des Controllers (z.B. 'student')
+            method: Name der Methode (z.B. 'get_student_course_grades')
+            key: Optional, Schlüssel der Anfrage (siehe submit())
+
+        Returns:
+            Future mit dem Ergebnis der Methode
+        """
+        return self.submit(
+            lambda controllers: getattr(getattr(controllers, controller), method)(*args, **kwargs),
+            key=key
+        )
+
+    def cancel(self, key: str) -> None:
+        """Bricht die offene Anfrage mit diesem Schlüssel ab.
+
+        Args:
+            key: Schlüssel der Anfrage
+        """
+        with self._lock:
+            request = self._latest.pop(key, None)
+            if request is not None:
+                self._cancel_request(request)
+
+    def shutdown(self) -> None:
+        """Bricht offene Anfragen ab und beendet den Worker-Thread."""
+        with self._lock:
+            for request in self._latest.values():
+                self._cancel_request(request)
+            self._latest.clear()
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=True)
+
+    # Hilfsfunktionen
+
+    def _run(self, request: _Request, func, args, kwargs):
+        with self._lock:
+            if request.cancelled:
+                raise CancelledError()
+            self._current = request
+        try:
+            return func(self._controllers, *args, **kwargs)
+        except Exception:
+            # db.execute() verpackt sqlite3.OperationalError('interrupted')
+            if request.cancelled:
+                raise CancelledError()  # durch interrupt() abgebrochen
+            raise
+        finally:
+            with self._lock:
+                self._current = None
+
+    def _cancel_request(self, request: _Request) -> None:
+        """Bricht eine Anfrage ab (Aufrufer hält self._lock)."""
+        request.cancelled = True
+        if request.future is not None and request.future.cancel():
+            return  # Noch nicht gestartet
+        if self._current is request and self._db is not None:
+            # interrupt() darf aus einem anderen Thread aufgerufen werden
+            self._db.conn.interrupt()
+
+    def _forget(self, key: str, request: _Request) -> None:
+        with self._lock:
+            if self._latest.get(key) is request:
+                del self._latest[key]
+
+    def _close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
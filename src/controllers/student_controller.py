@@ -169,15 +169,45 @@ class StudentController(BaseController):
                     }
                 grades_data[course_id]['competencies'][row['comp_area']] = row['avg_grade']
             
+            grades = list(grades_data.values())
             return {
                 'areas': comp_areas,
-                'grades': list(grades_data.values())
+                'grades': grades,
+                'area_averages': self._area_averages(student_id, grades)
             }
             
         except Exception as e:
             print(f"DEBUG: Error in get_student_competency_grades: {str(e)}")
             raise
     
+    @staticmethod
+    def _area_averages(student_id: int, grades: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Mittelt die Kompetenznoten der Kurse je Kompetenzbereich.
+        
+        Jeder Kurs zählt mit seinem Bereichsdurchschnitt einfach.
+        
+        Args:
+            student_id: ID des Schülers
+            grades: 'grades' aus get_student_competency_grades()
+            
+        Returns:
+            Dictionary Kompetenzbereich -> Durchschnitt
+        """
+        from src.models.grade_statistics import GradeStatistics
+        
+        rows, areas = [], []
+        for course in grades:
+            for area, grade in course['competencies'].items():
+                if grade is not None:
+                    rows.append((grade, 1.0, 0, student_id, course['course_id']))
+                    areas.append(area)
+        if not rows:
+            return {}
+        return {
+            area: stats['mean']
+            for area, stats in GradeStatistics(rows).by(areas).items()
+        }
+    
     def get_student_assessment_type_grades(self, student_id: int, course_id: int) -> List[Dict[str, Any]]:
         """Holt die Durchschnittsnoten pro Assessment Type für einen bestimmten Kurs.
         
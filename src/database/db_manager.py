@@ -1,9 +1,12 @@
 # src/database/db_manager.py
 
 import sqlite3
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime, timedelta  # timedelta hier hinzugefügt
 
+from .migrations import migrate
+
 # Repository-Imports
 from .repositories import (
     StudentRepository,
@@ -21,9 +24,41 @@ from .repositories import (
 )
 
 class DatabaseManager:
-    def __init__(self, db_file: str = "school.db"):
+    # Benannte Verbindungsprofile (PRAGMA-Einstellungen für connect())
+    CONNECTION_PROFILES = {
+        # SQLite-Standard: Rollback-Journal, synchronous=FULL
+        'default': {},
+        # WAL + synchronous=NORMAL: kein fsync pro Commit, Leser blockieren Schreiber nicht
+        'performance': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -16000,      # negativ = KiB, also ca. 16 MB
+            'mmap_size': 268435456,    # 256 MB
+            'temp_store': 'MEMORY',
+        },
+        # Lesende Zweitverbindung (z.B. Hintergrund-Thread): wie 'performance',
+        # Schreibzugriffe werden von SQLite abgewiesen
+        'read': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -16000,
+            'mmap_size': 268435456,
+            'temp_store': 'MEMORY',
+            'query_only': 'ON',
+        },
+    }
+
+    def __init__(self, db_file: str = "school.db", profile: str = "performance"):
+        if profile not in self.CONNECTION_PROFILES:
+            raise ValueError(f"Unbekanntes Verbindungsprofil: {profile}")
         self.db_file = db_file
+        self.profile = profile
         self.conn = None
+        # Verschachtelungstiefe offener Transaktionen (0 = Autocommit pro Statement)
+        self._transaction_depth = 0
+        # Listener für Datenänderungen und bis zum Commit gesammelte Meldungen
+        self._change_listeners = []
+        self._pending_changes = []
         self.connect()
         self.setup_tables()
         
@@ -55,359 +90,20 @@ class DatabaseManager:
             cursor = self.execute("PRAGMA foreign_keys = ON")
             cursor = self.execute("PRAGMA foreign_keys")
             fk_enabled = cursor.fetchone()[0]
+
+            # Pragmas des gewählten Verbindungsprofils setzen
+            for pragma, value in self.CONNECTION_PROFILES[self.profile].items():
+                self.conn.execute(f"PRAGMA {pragma} = {value}")
             
         except sqlite3.Error as e:
             raise Exception(f"Datenbankverbindung fehlgeschlagen: {e}")
 
     def setup_tables(self) -> None:
-        """Erstellt alle notwendigen Tabellen falls sie nicht existieren."""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Studenten Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS students (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            # Kompetenzen Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS competencies (
-                    id INTEGER PRIMARY KEY,
-                    subject TEXT NOT NULL,
-                    area TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-        ''')
-            
-            # Einstellungen Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS settings (
-                    id INTEGER PRIMARY KEY,
-                    semester_start TEXT,
-                    semester_end TEXT
-                )
-            ''')
-
-            # Erweiterte Noten-Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS grades (
-                    id INTEGER PRIMARY KEY,
-                    student_id INTEGER NOT NULL,
-                    lesson_id INTEGER NOT NULL,
-                    competency_id INTEGER NOT NULL,
-                    grade INTEGER NOT NULL,
-                    grade_type TEXT NOT NULL DEFAULT 'regular',
-                    weight REAL DEFAULT 1.0,
-                    comment TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE,
-                    FOREIGN KEY (lesson_id) REFERENCES lessons (id) ON DELETE CASCADE,
-                    FOREIGN KEY (competency_id) REFERENCES competencies (id) ON DELETE CASCADE,
-                    CHECK (grade >= 1 AND grade <= 6),
-                    CHECK (weight > 0 AND weight <= 2),
-                    CHECK (grade_type IN ('regular', 'exam', 'oral', 'homework', 'project'))
-                )
-            ''')
-            
-            # Verknüpfungstabelle für Stunden und Kompetenzen
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS lesson_competencies (
-                    lesson_id INTEGER,
-                    competency_id INTEGER,
-                    FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE CASCADE,
-                    FOREIGN KEY (competency_id) REFERENCES competencies(id) ON DELETE CASCADE,
-                    PRIMARY KEY (lesson_id, competency_id)
-                )
-            ''')     
-
-            # Kurse/Klassen Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS courses (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL CHECK(type IN ('class', 'course')),
-                    subject TEXT,
-                    description TEXT,
-                    color TEXT,
-                    template_id INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (subject) REFERENCES subjects(name),
-                    FOREIGN KEY (template_id) REFERENCES assessment_type_templates(id) ON DELETE SET NULL
-                )
-            ''')
-            
-            # Optionale Schüler-Kurs Zuordnung
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS student_courses (
-                    student_id INTEGER,
-                    course_id INTEGER,
-                    semester_id INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (student_id, course_id, semester_id),
-                    FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
-                    FOREIGN KEY (semester_id) REFERENCES semester_history(id) ON DELETE CASCADE
-                )
-            ''')
-            
-            # Neue Tabelle für Halbjahreshistorie
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS semester_history (
-                    id INTEGER PRIMARY KEY,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
-                    name TEXT,  -- Optional für benutzerdefinierten Namen
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT  -- Optional für Anmerkungen
-                )
-            ''')
-            
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS lessons (
-                    id INTEGER PRIMARY KEY,
-                    course_id INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    time TEXT NOT NULL,
-                    subject TEXT NOT NULL,
-                    topic TEXT NOT NULL,
-                    homework TEXT,    
-                    recurring_hash TEXT,
-                    lesson_number INTEGER,
-                    duration INTEGER,
-                    status TEXT CHECK(status IN ('normal', 'cancelled', 'moved', 'substituted')) DEFAULT 'normal',
-                    status_note TEXT,
-                    moved_to_lesson_id INTEGER REFERENCES lessons(id),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
-                )
-            ''')
-
-            try:
-                cursor.execute("ALTER TABLE lessons ADD COLUMN homework TEXT")
-            except sqlite3.Error:
-                # Ignoriere Fehler wenn Spalte bereits existiert
-                pass
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS timetable_settings (
-                    id INTEGER PRIMARY KEY,
-                    first_lesson_start TEXT NOT NULL,  -- z.B. "08:00"
-                    lesson_duration INTEGER NOT NULL,   -- in Minuten
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS breaks (
-                    id INTEGER PRIMARY KEY,
-                    after_lesson INTEGER NOT NULL,      -- nach welcher Stunde
-                    duration INTEGER NOT NULL,          -- in Minuten
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Prüfe ob bereits Einstellungen vorhanden sind
-            cursor.execute("SELECT COUNT(*) as count FROM timetable_settings")
-            if cursor.fetchone()['count'] == 0:
-                # Füge Standardeinstellungen ein
-                cursor.execute(
-                    """INSERT INTO timetable_settings 
-                    (id, first_lesson_start, lesson_duration) 
-                    VALUES (1, '08:00', 45)"""
-                )
-                
-                # Füge Standardpausen ein
-                standard_breaks = [
-                    (1, 5),   # Nach 1. Stunde: 5 Minuten
-                    (2, 15),  # Nach 2. Stunde: 15 Minuten
-                    (3, 5),   # Nach 3. Stunde: 5 Minuten
-                    (4, 20),  # Nach 4. Stunde: 20 Minuten
-                    (5, 5),   # Nach 5. Stunde: 5 Minuten
-                    (6, 10),  # Nach 6. Stunde: 10 Minuten
-                    (7, 5),   # Nach 7. Stunde: 5 Minuten
-                    (8, 5),   # Nach 8. Stunde: 5 Minuten
-                    (9, 5),   # Nach 9. Stunde: 5 Minuten
-                ]
-                
-                cursor.executemany(
-                    "INSERT INTO breaks (after_lesson, duration) VALUES (?, ?)",
-                    standard_breaks
-                )
-
-            # Bemerkungen Tabelle
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS student_remarks (
-                    id INTEGER PRIMARY KEY,
-                    student_id INTEGER NOT NULL,
-                    lesson_id INTEGER,  -- Optional
-                    remark_text TEXT NOT NULL,
-                    type TEXT DEFAULT 'general',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                    FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE SET NULL
-                )
-            ''')
-
-            # Notensysteme (z.B. Unterstufe 1-6, Oberstufe 0-15)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS grading_systems (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    min_grade REAL NOT NULL,
-                    max_grade REAL NOT NULL,
-                    step_size REAL NOT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Beispiel-Notensysteme einfügen
-            cursor.execute("SELECT COUNT(*) as count FROM grading_systems")
-            if cursor.fetchone()['count'] == 0:
-                cursor.execute('''
-                    INSERT INTO grading_systems 
-                    (name, min_grade, max_grade, step_size, description)
-                    VALUES 
-                    ('Unterstufe (1-6)', 1.0, 6.0, 0.33, 'Klassisches Notensystem mit + und -'),
-                    ('Oberstufe (0-15)', 0.0, 15.0, 1.0, 'Punktesystem der gymnasialen Oberstufe')
-                ''')
-
-            # Vorlagen für Bewertungstypen
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS assessment_type_templates (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    subject TEXT NOT NULL,
-                    description TEXT,
-                    grading_system_id INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (grading_system_id) REFERENCES grading_systems(id)
-                )
-            ''')
-
-            # Einzelne Bewertungstypen in Vorlagen
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS template_items (
-                    id INTEGER PRIMARY KEY,
-                    template_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    parent_item_id INTEGER,
-                    default_weight REAL DEFAULT 1.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (template_id) REFERENCES assessment_type_templates(id) ON DELETE CASCADE,
-                    FOREIGN KEY (parent_item_id) REFERENCES template_items(id) ON DELETE CASCADE
-                )
-            ''')
-
-            # Konkrete Bewertungstypen für Kurse
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS assessment_types (
-                    id INTEGER PRIMARY KEY,
-                    course_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    parent_type_id INTEGER,
-                    weight REAL DEFAULT 1.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
-                    FOREIGN KEY (parent_type_id) REFERENCES assessment_types(id) ON DELETE CASCADE
-                )
-            ''')
-
-            # Konkrete Bewertungen/Noten
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS assessments (
-                    id INTEGER PRIMARY KEY,
-                    student_id INTEGER NOT NULL,
-                    course_id INTEGER NOT NULL,
-                    assessment_type_id INTEGER NOT NULL,
-                    lesson_id INTEGER,
-                    grade REAL NOT NULL,
-                    weight REAL DEFAULT 1.0,
-                    date TEXT NOT NULL,
-                    topic TEXT,
-                    comment TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
-                    FOREIGN KEY (assessment_type_id) REFERENCES assessment_types(id) ON DELETE CASCADE,
-                    FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE SET NULL
-                )
-            ''')
-
-            # Tabelle für Abwesenheiten
-            cursor.execute('''    
-                CREATE TABLE IF NOT EXISTS student_attendance (
-                    id INTEGER PRIMARY KEY,
-                    student_id INTEGER NOT NULL,
-                    lesson_id INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
-                    FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE CASCADE,
-                    UNIQUE(student_id, lesson_id)
-                )
-            ''')
-
-            # Tabelle für Fächer
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS subjects (
-                    name TEXT PRIMARY KEY,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Feiertage und Ferientage (automatisch über API)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS public_holidays (
-                    id INTEGER PRIMARY KEY,
-                    date TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    type TEXT CHECK(type IN ('holiday', 'vacation_day')) NOT NULL,
-                    state TEXT NOT NULL,  -- Bundesland 
-                    year INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Zusätzliche schulspezifische freie Tage (manuell)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS school_holidays (
-                    id INTEGER PRIMARY KEY,
-                    date TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # # Prüfe ob die template_id Spalte existiert, wenn nicht füge sie hinzu
-            # try:
-            #     cursor.execute("ALTER TABLE courses ADD COLUMN template_id INTEGER REFERENCES assessment_type_templates(id)")
-            # except sqlite3.OperationalError as e:
-            #     if "duplicate column name" not in str(e).lower():
-            #         raise e
-
-            self.conn.commit()               
-        except sqlite3.Error as e:
-            raise Exception(f"Fehler beim Erstellen der Tabellen: {e}")                 
-
-            # Indizes für bessere Performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_student ON grades(student_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_lesson ON grades(lesson_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_competency ON grades(competency_id)')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_remarks_student 
-            ON student_remarks(student_id)
-        ''')
+        """Bringt das Datenbankschema über die Migrationen auf den neuesten Stand.
         
+        Ist das Schema aktuell (PRAGMA user_version), wird kein DDL ausgeführt.
+        """
+        migrate(self)
 
     # DEPRECATED: Legacy-Methoden für Kompatibilität mit Models
     # Diese werden nur noch von Models verwendet und sollten langfristig entfernt werden.
@@ -459,23 +155,153 @@ class DatabaseManager:
 
     # Hilfsmethode für Datenbankoperationen
     def execute(self, query: str, params: tuple = None):
-        """Führt eine SQL-Query aus und handled Fehler."""
+        """Führt eine SQL-Query aus und handled Fehler.
+        
+        Außerhalb von transaction() wird jedes Statement sofort committet.
+        Innerhalb einer Transaktion wird der Commit bis zum Ende des
+        äußersten transaction()-Blocks aufgeschoben.
+        """
         try:
             cursor = self.conn.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            self.conn.commit()
+            if not self.in_transaction:
+                self.conn.commit()
+            return cursor
+        except sqlite3.Error as e:
+            # Innerhalb einer Transaktion übernimmt transaction() den Rollback
+            if not self.in_transaction:
+                self.conn.rollback()
+            raise Exception(f"Datenbankfehler: {e}")
+
+    def executemany(self, query: str, seq_of_params) -> sqlite3.Cursor:
+        """Führt eine SQL-Query für mehrere Parametersätze aus.
+        
+        Commit- und Fehlerverhalten entsprechen execute(): außerhalb von
+        transaction() wird einmal am Ende committet.
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany(query, seq_of_params)
+            if not self.in_transaction:
+                self.conn.commit()
             return cursor
         except sqlite3.Error as e:
-            self.conn.rollback()
+            if not self.in_transaction:
+                self.conn.rollback()
             raise Exception(f"Datenbankfehler: {e}")
 
+    @property
+    def in_transaction(self) -> bool:
+        """True, solange ein transaction()-Block geöffnet ist."""
+        return self._transaction_depth > 0
+
+    @contextmanager
+    def transaction(self):
+        """Fasst mehrere Statements zu einer Transaktion zusammen (Unit of Work).
+        
+        Alle execute()-Aufrufe innerhalb des Blocks werden gemeinsam mit
+        einem einzigen Commit abgeschlossen. Tritt eine Exception auf, wird
+        alles zurückgerollt. Verschachtelte Aufrufe verwenden SAVEPOINTs,
+        so dass ein innerer Block separat zurückgerollt werden kann, ohne die
+        äußere Transaktion abzubrechen.
+        
+        Beispiel:
+            with db.transaction():
+                db.execute("INSERT ...")
+                db.execute("UPDATE ...")
+        
+        Yields:
+            Den DatabaseManager selbst
+        """
+        savepoint = None
+        if self._transaction_depth == 0:
+            self.conn.execute("BEGIN")
+        else:
+            savepoint = f"sp_{self._transaction_depth}"
+            self.conn.execute(f"SAVEPOINT {savepoint}")
+        self._transaction_depth += 1
+        
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if savepoint:
+                self.conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                self.conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                self.conn.rollback()
+                self._pending_changes.clear()
+            raise
+        else:
+            self._transaction_depth -= 1
+            if savepoint:
+                self.conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                self.conn.commit()
+                self._dispatch_pending_changes()
+
+    def add_change_listener(self, listener: Callable[[str, Optional[str], Optional[str]], None]) -> None:
+        """Registriert einen Listener für Datenänderungen.
+        
+        Der Listener wird mit (Tabelle, Startdatum, Enddatum) aufgerufen,
+        sobald eine Änderung festgeschrieben ist. Innerhalb von
+        transaction() erfolgt der Aufruf erst nach dem Commit; bei einem
+        Rollback entfällt er. Ein Datum None bedeutet einen offenen
+        Zeitraum.
+        
+        Args:
+            listener: Aufrufbares Objekt (table, start_date, end_date)
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener) -> None:
+        """Entfernt einen mit add_change_listener() registrierten Listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def notify_change(self, table: str, start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> None:
+        """Meldet eine Änderung an einer Tabelle in einem Datumsbereich.
+        
+        Args:
+            table: Name der geänderten Tabelle (z.B. 'lessons')
+            start_date: Optional, erstes betroffenes Datum ("YYYY-MM-DD")
+            end_date: Optional, letztes betroffenes Datum ("YYYY-MM-DD")
+        """
+        self._pending_changes.append((table, start_date, end_date))
+        if not self.in_transaction:
+            self._dispatch_pending_changes()
+
+    def _dispatch_pending_changes(self) -> None:
+        """Leitet gesammelte Änderungsmeldungen an die Listener weiter."""
+        changes, self._pending_changes = self._pending_changes, []
+        for change in dict.fromkeys(changes):
+            for listener in list(self._change_listeners):
+                listener(*change)
+
+    def close(self) -> None:
+        """Schließt die Datenbankverbindung.
+        
+        Führt vorher PRAGMA optimize aus, damit SQLite die Statistiken
+        für den Query-Planer aktualisieren kann.
+        """
+        if not getattr(self, 'conn', None):
+            return
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            # Optimierung ist optional, Schließen darf daran nicht scheitern
+            pass
+        self.conn.close()
+        self.conn = None
+
     def __del__(self):
         """Schließt die Datenbankverbindung beim Beenden."""
-        if self.conn:
-            self.conn.close()
+        self.close()
 
     # def add_grade(self, data: dict) -> int:
     #     """Fügt eine neue Note hinzu mit erweiterten Eigenschaften."""
@@ -535,10 +361,12 @@ class DatabaseManager:
 
 
 # Holiday-Methoden (behalten für Kompatibilität)
-    def update_lesson_status_for_holidays(self):
+    def update_lesson_status_for_holidays(self, start_date: Optional[str] = None,
+                                          end_date: Optional[str] = None,
+                                          lesson_ids: Optional[List[int]] = None) -> int:
         """Aktualisiert den Status von Stunden, die in Ferien/an Feiertagen liegen.
         
         DEPRECATED: Verwende self.holidays.update_lesson_status_for_holidays() stattdessen.
         Wird noch in Models verwendet (HolidayManager).
         """
-        self.holidays.update_lesson_status_for_holidays()
\ No newline at end of file
+        return self.holidays.update_lesson_status_for_holidays(start_date, end_date, lesson_ids)
\ No newline at end of file
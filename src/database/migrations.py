@@ -0,0 +1,687 @@
+# src/database/migrations.py
+
+"""
+Versionierte Schema-Migrationen für Schulfreund.
+
+Die Schema-Version wird in PRAGMA user_version gespeichert. Jede Migration
+hat eine fortlaufende Versionsnummer und wird genau einmal in einer eigenen
+Transaktion ausgeführt. Ist die Datenbank bereits auf dem neuesten Stand,
+wird beim Start keinerlei DDL ausgeführt.
+
+Neue Migrationen werden mit dem @migration-Decorator registriert:
+
+    @migration(2, "Beschreibung")
+    def _add_something(cursor):
+        cursor.execute("CREATE INDEX ...")
+"""
+
+import logging
+import sqlite3
+from typing import Callable, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    """Ein einzelner Migrationsschritt."""
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+
+# Alle registrierten Migrationen, aufsteigend nach Version sortiert
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    """Registriert eine Funktion als Migrationsschritt.
+    
+    Args:
+        version: Zielversion nach Ausführung (fortlaufend ab 1)
+        description: Kurzbeschreibung der Änderung
+    """
+    def decorator(func: Callable[[sqlite3.Cursor], None]):
+        if any(m.version == version for m in MIGRATIONS):
+            raise ValueError(f"Migration {version} ist bereits registriert")
+        MIGRATIONS.append(Migration(version, description, func))
+        MIGRATIONS.sort(key=lambda m: m.version)
+        return func
+    return decorator
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Liest die aktuelle Schema-Version aus PRAGMA user_version."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def latest_version() -> int:
+    """Gibt die Version der neuesten registrierten Migration zurück."""
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def migrate(db) -> List[int]:
+    """Bringt das Schema auf den neuesten Stand.
+    
+    Args:
+        db: DatabaseManager-Instanz
+        
+    Returns:
+        Liste der ausgeführten Migrationsversionen (leer, wenn aktuell)
+        
+    Raises:
+        Exception: Wenn eine Migration fehlschlägt (diese wird zurückgerollt)
+    """
+    current = get_schema_version(db.conn)
+    if current >= latest_version():
+        return []
+
+    applied = []
+    for step in MIGRATIONS:
+        if step.version <= current:
+            continue
+        try:
+            with db.transaction():
+                cursor = db.conn.cursor()
+                step.apply(cursor)
+                # user_version ist Teil der Transaktion und wird mit zurückgerollt
+                cursor.execute(f"PRAGMA user_version = {int(step.version)}")
+        except sqlite3.Error as e:
+            raise Exception(
+                f"Fehler bei Schema-Migration {step.version} "
+                f"({step.description}): {e}"
+            )
+        applied.append(step.version)
+    return applied
+
+
+@migration(1, "Basisschema")
+def _create_base_schema(cursor: sqlite3.Cursor) -> None:
+    """Erstellt das Basisschema.
+    
+    Verwendet IF NOT EXISTS, damit bestehende Datenbanken aus der Zeit vor
+    den Migrationen (user_version = 0) ohne Datenverlust übernommen werden.
+    """
+    # Studenten Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    # Kompetenzen Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS competencies (
+            id INTEGER PRIMARY KEY,
+            subject TEXT NOT NULL,
+            area TEXT NOT NULL,
+            description TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Einstellungen Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS settings (
+            id INTEGER PRIMARY KEY,
+            semester_start TEXT,
+            semester_end TEXT
+        )
+    ''')
+
+    # Erweiterte Noten-Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS grades (
+            id INTEGER PRIMARY KEY,
+            student_id INTEGER NOT NULL,
+            lesson_id INTEGER NOT NULL,
+            competency_id INTEGER NOT NULL,
+            grade INTEGER NOT NULL,
+            grade_type TEXT NOT NULL DEFAULT 'regular',
+            weight REAL DEFAULT 1.0,
+            comment TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students (id) ON DELETE CASCADE,
+            FOREIGN KEY (lesson_id) REFERENCES lessons (id) ON DELETE CASCADE,
+            FOREIGN KEY (competency_id) REFERENCES competencies (id) ON DELETE CASCADE,
+            CHECK (grade >= 1 AND grade <= 6),
+            CHECK (weight > 0 AND weight <= 2),
+            CHECK (grade_type IN ('regular', 'exam', 'oral', 'homework', 'project'))
+        )
+    ''')
+    
+    # Verknüpfungstabelle für Stunden und Kompetenzen
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS lesson_competencies (
+            lesson_id INTEGER,
+            competency_id INTEGER,
+            FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE CASCADE,
+            FOREIGN KEY (competency_id) REFERENCES competencies(id) ON DELETE CASCADE,
+            PRIMARY KEY (lesson_id, competency_id)
+        )
+    ''')     
+
+    # Kurse/Klassen Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS courses (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL CHECK(type IN ('class', 'course')),
+            subject TEXT,
+            description TEXT,
+            color TEXT,
+            template_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (subject) REFERENCES subjects(name),
+            FOREIGN KEY (template_id) REFERENCES assessment_type_templates(id) ON DELETE SET NULL
+        )
+    ''')
+    
+    # Optionale Schüler-Kurs Zuordnung
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS student_courses (
+            student_id INTEGER,
+            course_id INTEGER,
+            semester_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (student_id, course_id, semester_id),
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+            FOREIGN KEY (semester_id) REFERENCES semester_history(id) ON DELETE CASCADE
+        )
+    ''')
+    
+    # Neue Tabelle für Halbjahreshistorie
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS semester_history (
+            id INTEGER PRIMARY KEY,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            name TEXT,  -- Optional für benutzerdefinierten Namen
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            notes TEXT  -- Optional für Anmerkungen
+        )
+    ''')
+    
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS lessons (
+            id INTEGER PRIMARY KEY,
+            course_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            time TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            homework TEXT,    
+            recurring_hash TEXT,
+            lesson_number INTEGER,
+            duration INTEGER,
+            status TEXT CHECK(status IN ('normal', 'cancelled', 'moved', 'substituted')) DEFAULT 'normal',
+            status_note TEXT,
+            moved_to_lesson_id INTEGER REFERENCES lessons(id),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Ältere Datenbanken ohne Hausaufgaben-Spalte nachrüsten
+    cursor.execute("PRAGMA table_info(lessons)")
+    if 'homework' not in [row['name'] for row in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE lessons ADD COLUMN homework TEXT")
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS timetable_settings (
+            id INTEGER PRIMARY KEY,
+            first_lesson_start TEXT NOT NULL,  -- z.B. "08:00"
+            lesson_duration INTEGER NOT NULL,   -- in Minuten
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS breaks (
+            id INTEGER PRIMARY KEY,
+            after_lesson INTEGER NOT NULL,      -- nach welcher Stunde
+            duration INTEGER NOT NULL,          -- in Minuten
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Prüfe ob bereits Einstellungen vorhanden sind
+    cursor.execute("SELECT COUNT(*) as count FROM timetable_settings")
+    if cursor.fetchone()['count'] == 0:
+        # Füge Standardeinstellungen ein
+        cursor.execute(
+            """INSERT INTO timetable_settings 
+            (id, first_lesson_start, lesson_duration) 
+            VALUES (1, '08:00', 45)"""
+        )
+        
+        # Füge Standardpausen ein
+        standard_breaks = [
+            (1, 5),   # Nach 1. Stunde: 5 Minuten
+            (2, 15),  # Nach 2. Stunde: 15 Minuten
+            (3, 5),   # Nach 3. Stunde: 5 Minuten
+            (4, 20),  # Nach 4. Stunde: 20 Minuten
+            (5, 5),   # Nach 5. Stunde: 5 Minuten
+            (6, 10),  # Nach 6. Stunde: 10 Minuten
+            (7, 5),   # Nach 7. Stunde: 5 Minuten
+            (8, 5),   # Nach 8. Stunde: 5 Minuten
+            (9, 5),   # Nach 9. Stunde: 5 Minuten
+        ]
+        
+        cursor.executemany(
+            "INSERT INTO breaks (after_lesson, duration) VALUES (?, ?)",
+            standard_breaks
+        )
+
+    # Bemerkungen Tabelle
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS student_remarks (
+            id INTEGER PRIMARY KEY,
+            student_id INTEGER NOT NULL,
+            lesson_id INTEGER,  -- Optional
+            remark_text TEXT NOT NULL,
+            type TEXT DEFAULT 'general',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE SET NULL
+        )
+    ''')
+
+    # Notensysteme (z.B. Unterstufe 1-6, Oberstufe 0-15)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS grading_systems (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            min_grade REAL NOT NULL,
+            max_grade REAL NOT NULL,
+            step_size REAL NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Beispiel-Notensysteme einfügen
+    cursor.execute("SELECT COUNT(*) as count FROM grading_systems")
+    if cursor.fetchone()['count'] == 0:
+        cursor.execute('''
+            INSERT INTO grading_systems 
+            (name, min_grade, max_grade, step_size, description)
+            VALUES 
+            ('Unterstufe (1-6)', 1.0, 6.0, 0.33, 'Klassisches Notensystem mit + und -'),
+            ('Oberstufe (0-15)', 0.0, 15.0, 1.0, 'Punktesystem der gymnasialen Oberstufe')
+        ''')
+
+    # Vorlagen für Bewertungstypen
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS assessment_type_templates (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            description TEXT,
+            grading_system_id INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (grading_system_id) REFERENCES grading_systems(id)
+        )
+    ''')
+
+    # Einzelne Bewertungstypen in Vorlagen
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_items (
+            id INTEGER PRIMARY KEY,
+            template_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            parent_item_id INTEGER,
+            default_weight REAL DEFAULT 1.0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES assessment_type_templates(id) ON DELETE CASCADE,
+            FOREIGN KEY (parent_item_id) REFERENCES template_items(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Konkrete Bewertungstypen für Kurse
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS assessment_types (
+            id INTEGER PRIMARY KEY,
+            course_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            parent_type_id INTEGER,
+            weight REAL DEFAULT 1.0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+            FOREIGN KEY (parent_type_id) REFERENCES assessment_types(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Konkrete Bewertungen/Noten
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS assessments (
+            id INTEGER PRIMARY KEY,
+            student_id INTEGER NOT NULL,
+            course_id INTEGER NOT NULL,
+            assessment_type_id INTEGER NOT NULL,
+            lesson_id INTEGER,
+            grade REAL NOT NULL,
+            weight REAL DEFAULT 1.0,
+            date TEXT NOT NULL,
+            topic TEXT,
+            comment TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+            FOREIGN KEY (assessment_type_id) REFERENCES assessment_types(id) ON DELETE CASCADE,
+            FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE SET NULL
+        )
+    ''')
+
+    # Tabelle für Abwesenheiten
+    cursor.execute('''    
+        CREATE TABLE IF NOT EXISTS student_attendance (
+            id INTEGER PRIMARY KEY,
+            student_id INTEGER NOT NULL,
+            lesson_id INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+            FOREIGN KEY (lesson_id) REFERENCES lessons(id) ON DELETE CASCADE,
+            UNIQUE(student_id, lesson_id)
+        )
+    ''')
+
+    # Tabelle für Fächer
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS subjects (
+            name TEXT PRIMARY KEY,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Feiertage und Ferientage (automatisch über API)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS public_holidays (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT CHECK(type IN ('holiday', 'vacation_day')) NOT NULL,
+            state TEXT NOT NULL,  -- Bundesland 
+            year INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Zusätzliche schulspezifische freie Tage (manuell)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS school_holidays (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Indizes
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_student ON grades(student_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_lesson ON grades(lesson_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_grades_competency ON grades(competency_id)')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_remarks_student 
+        ON student_remarks(student_id)
+    ''')
+
+
+@migration(2, "Indizes für die Zugriffsmuster der Repositories")
+def _add_query_indexes(cursor: sqlite3.Cursor) -> None:
+    """Legt Indizes für die tatsächlich verwendeten Filter/Sortierungen an.
+    
+    Zusätzlich wird (student_id, lesson_id) in assessments eindeutig, wie es
+    AssessmentRepository.add_or_update ohnehin voraussetzt. Gibt es doppelte
+    Noten für dieselbe Stunde, bleibt die neueste in assessments; die älteren
+    werden vollständig nach assessments_duplicates verschoben (nicht
+    gelöscht) und die Anzahl wird als Warnung protokolliert.
+    """
+    # Stunden: Tagesansicht (date, ORDER BY time)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_lessons_date_time
+        ON lessons(date, time)
+    ''')
+    # Stunden eines Kurses, vorherige Hausaufgaben (course_id, date, time)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_lessons_course_date_time
+        ON lessons(course_id, date, time)
+    ''')
+    # Wiederkehrende Stunden ab einem Datum ändern/löschen
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_lessons_recurring_date
+        ON lessons(recurring_hash, date)
+    ''')
+    # Fremdschlüssel-Prüfungen beim Löschen von Stunden
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_lessons_moved_to
+        ON lessons(moved_to_lesson_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_remarks_lesson
+        ON student_remarks(lesson_id)
+    ''')
+
+    # Noten: höchstens eine Note pro Schüler und Stunde. Ältere Dubletten
+    # werden gesichert statt gelöscht, damit keine Note verloren geht.
+    duplicates_sql = '''
+        FROM assessments
+        WHERE lesson_id IS NOT NULL
+        AND id NOT IN (
+            SELECT MAX(id) FROM assessments
+            WHERE lesson_id IS NOT NULL
+            GROUP BY student_id, lesson_id
+        )
+    '''
+    duplicate_count = cursor.execute(f"SELECT COUNT(*) {duplicates_sql}").fetchone()[0]
+    if duplicate_count:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS assessments_duplicates
+            AS SELECT * FROM assessments WHERE 0
+        ''')
+        cursor.execute(f"INSERT INTO assessments_duplicates SELECT * {duplicates_sql}")
+        cursor.execute(f"DELETE {duplicates_sql}")
+        logger.warning(
+            f"{duplicate_count} doppelte Noten (gleicher Schüler, gleiche Stunde) "
+            f"nach assessments_duplicates verschoben; die neueste Note bleibt erhalten"
+        )
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_assessments_student_lesson
+        ON assessments(student_id, lesson_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_assessments_student_course
+        ON assessments(student_id, course_id, assessment_type_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_assessments_course_type
+        ON assessments(course_id, assessment_type_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_assessments_lesson
+        ON assessments(lesson_id)
+    ''')
+
+    # Bewertungstypen eines Kurses und deren Hierarchie
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_assessment_types_course_parent
+        ON assessment_types(course_id, parent_type_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_assessment_types_parent
+        ON assessment_types(parent_type_id)
+    ''')
+
+    # Abwesenheiten einer Stunde
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_attendance_lesson_student
+        ON student_attendance(lesson_id, student_id)
+    ''')
+
+    # Schüler eines Kurses in einem Halbjahr
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_student_courses_course_semester
+        ON student_courses(course_id, semester_id, student_id)
+    ''')
+
+    # Halbjahr zu einem Datum
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_semester_history_dates
+        ON semester_history(start_date, end_date)
+    ''')
+
+    # Feiertage/Ferien nach Datum und nach Jahr/Bundesland
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_public_holidays_date
+        ON public_holidays(date, type, name)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_public_holidays_state_year
+        ON public_holidays(state, year, date)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_school_holidays_date
+        ON school_holidays(date, name)
+    ''')
+
+
+# Füllt grade_aggregates vollständig aus assessments (Migration und Neuaufbau)
+GRADE_AGGREGATES_REBUILD_SQL = '''
+    INSERT INTO grade_aggregates
+        (student_id, course_id, assessment_type_id,
+         weighted_sum, weight_sum, grade_count)
+    SELECT student_id, course_id, assessment_type_id,
+           SUM(grade * COALESCE(weight, 1.0)),
+           SUM(COALESCE(weight, 1.0)),
+           COUNT(*)
+    FROM assessments
+    GROUP BY student_id, course_id, assessment_type_id
+'''
+
+
+@migration(3, "Summentabelle der Noten je Schüler, Kurs und Bewertungstyp")
+def _add_grade_aggregates(cursor: sqlite3.Cursor) -> None:
+    """Legt grade_aggregates samt Triggern an und füllt sie einmalig.
+    
+    Die Tabelle enthält je (Schüler, Kurs, Bewertungstyp) die Summen von
+    Note*Gewicht und Gewicht sowie die Anzahl der Noten. Die Trigger halten
+    sie bei jedem INSERT/UPDATE/DELETE auf assessments aktuell, auch bei
+    Löschungen über ON DELETE CASCADE.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS grade_aggregates (
+            student_id INTEGER NOT NULL,
+            course_id INTEGER NOT NULL,
+            assessment_type_id INTEGER NOT NULL,
+            weighted_sum REAL NOT NULL DEFAULT 0,
+            weight_sum REAL NOT NULL DEFAULT 0,
+            grade_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (student_id, course_id, assessment_type_id)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_grade_aggregates_course
+        ON grade_aggregates(course_id, assessment_type_id)
+    ''')
+
+    # Neue Note: Summen erhöhen bzw. Zeile anlegen
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_aggregate_insert
+        AFTER INSERT ON assessments
+        BEGIN
+            INSERT INTO grade_aggregates
+                (student_id, course_id, assessment_type_id,
+                 weighted_sum, weight_sum, grade_count)
+            VALUES (NEW.student_id, NEW.course_id, NEW.assessment_type_id,
+                    NEW.grade * COALESCE(NEW.weight, 1.0),
+                    COALESCE(NEW.weight, 1.0), 1)
+            ON CONFLICT(student_id, course_id, assessment_type_id) DO UPDATE SET
+                weighted_sum = weighted_sum + excluded.weighted_sum,
+                weight_sum = weight_sum + excluded.weight_sum,
+                grade_count = grade_count + 1;
+        END
+    ''')
+
+    # Gelöschte Note: Summen verringern, leere Zeilen entfernen
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_aggregate_delete
+        AFTER DELETE ON assessments
+        BEGIN
+            UPDATE grade_aggregates SET
+                weighted_sum = weighted_sum - OLD.grade * COALESCE(OLD.weight, 1.0),
+                weight_sum = weight_sum - COALESCE(OLD.weight, 1.0),
+                grade_count = grade_count - 1
+            WHERE student_id = OLD.student_id
+              AND course_id = OLD.course_id
+              AND assessment_type_id = OLD.assessment_type_id;
+            DELETE FROM grade_aggregates
+            WHERE student_id = OLD.student_id
+              AND course_id = OLD.course_id
+              AND assessment_type_id = OLD.assessment_type_id
+              AND grade_count <= 0;
+        END
+    ''')
+
+    # Geänderte Note: alten Beitrag abziehen, neuen hinzufügen
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_assessments_aggregate_update
+        AFTER UPDATE OF student_id, course_id, assessment_type_id, grade, weight
+        ON assessments
+        BEGIN
+            UPDATE grade_aggregates SET
+                weighted_sum = weighted_sum - OLD.grade * COALESCE(OLD.weight, 1.0),
+                weight_sum = weight_sum - COALESCE(OLD.weight, 1.0),
+                grade_count = grade_count - 1
+            WHERE student_id = OLD.student_id
+              AND course_id = OLD.course_id
+              AND assessment_type_id = OLD.assessment_type_id;
+            DELETE FROM grade_aggregates
+            WHERE student_id = OLD.student_id
+              AND course_id = OLD.course_id
+              AND assessment_type_id = OLD.assessment_type_id
+              AND grade_count <= 0;
+            INSERT INTO grade_aggregates
+                (student_id, course_id, assessment_type_id,
+                 weighted_sum, weight_sum, grade_count)
+            VALUES (NEW.student_id, NEW.course_id, NEW.assessment_type_id,
+                    NEW.grade * COALESCE(NEW.weight, 1.0),
+                    COALESCE(NEW.weight, 1.0), 1)
+            ON CONFLICT(student_id, course_id, assessment_type_id) DO UPDATE SET
+                weighted_sum = weighted_sum + excluded.weighted_sum,
+                weight_sum = weight_sum + excluded.weight_sum,
+                grade_count = grade_count + 1;
+        END
+    ''')
+
+    cursor.execute('DELETE FROM grade_aggregates')
+    cursor.execute(GRADE_AGGREGATES_REBUILD_SQL)
+
+
+
+@migration(4, "Tabelle der bereits geladenen Feiertagsjahre je Bundesland")
+def _add_holiday_coverage(cursor: sqlite3.Cursor) -> None:
+    """Legt holiday_coverage an.
+    
+    Ein Eintrag (state, year) bedeutet, dass Ferien und Feiertage dieses
+    Jahres vollständig geladen wurden. Jahre, die bereits Einträge in
+    public_holidays haben, werden als geladen übernommen.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS holiday_coverage (
+            state TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (state, year)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        INSERT OR IGNORE INTO holiday_coverage (state, year)
+        SELECT DISTINCT state, year FROM public_holidays
+    ''')
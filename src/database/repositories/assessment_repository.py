@@ -2,6 +2,8 @@
 
 from typing import List, Dict, Any, Optional
 from .base_repository import BaseRepository
+from ..migrations import GRADE_AGGREGATES_REBUILD_SQL
+from src.models.grade_hierarchy import GradeHierarchy
 
 
 class AssessmentRepository(BaseRepository):
@@ -84,6 +86,58 @@ class AssessmentRepository(BaseRepository):
             (student_id, lesson_id)
         )
     
+    def upsert_many(self, assessments: List[dict]) -> None:
+        """Speichert mehrere Bewertungen zu Stunden mit einem executemany.
+        
+        Bestehende Noten desselben Schülers in derselben Stunde werden über
+        ON CONFLICT(student_id, lesson_id) aktualisiert.
+        
+        Args:
+            assessments: Liste von Dictionaries wie bei add_or_update();
+                         lesson_id ist erforderlich
+        """
+        if not assessments:
+            return
+        self.executemany(
+            """INSERT INTO assessments 
+            (student_id, course_id, assessment_type_id, grade,
+                date, lesson_id, topic, comment, weight)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(student_id, lesson_id) DO UPDATE SET
+                grade = excluded.grade,
+                assessment_type_id = excluded.assessment_type_id,
+                course_id = excluded.course_id,
+                date = excluded.date,
+                topic = excluded.topic,
+                comment = excluded.comment,
+                weight = excluded.weight""",
+            [(data['student_id'],
+              data['course_id'],
+              data['assessment_type_id'],
+              data['grade'],
+              data['date'],
+              data['lesson_id'],
+              data.get('topic'),
+              data.get('comment'),
+              data.get('weight', 1.0))
+             for data in assessments]
+        )
+    
+    def delete_many(self, lesson_id: int, student_ids: List[int]) -> None:
+        """Löscht die Noten mehrerer Schüler in einer Stunde.
+        
+        Args:
+            lesson_id: ID der Stunde
+            student_ids: IDs der Schüler
+        """
+        if not student_ids:
+            return
+        self.execute(
+            f"""DELETE FROM assessments 
+            WHERE lesson_id = ? AND student_id IN ({', '.join('?' * len(student_ids))})""",
+            (lesson_id, *student_ids)
+        )
+    
     def get_by_student_and_course(self, student_id: int, course_id: int) -> List[Dict[str, Any]]:
         """Holt alle Noten eines Schülers in einem Kurs.
         
@@ -154,62 +208,305 @@ class AssessmentRepository(BaseRepository):
             )
         return self._dicts_from_rows(cursor.fetchall())
     
-    def calculate_final_grade(self, student_id: int, course_id: int) -> Optional[float]:
-        """Berechnet die Gesamtnote eines Schülers in einem Kurs.
+    def rebuild_aggregates(self) -> None:
+        """Baut die Summentabelle grade_aggregates vollständig neu auf.
+        
+        Die Trigger auf assessments halten die Tabelle laufend aktuell; der
+        Neuaufbau dient der Reparatur, z.B. nach manuellen Datenbankeingriffen.
+        """
+        with self.transaction():
+            self.execute("DELETE FROM grade_aggregates")
+            self.execute(GRADE_AGGREGATES_REBUILD_SQL)
+    
+    def get_grade_hierarchy(self, course_id: int) -> GradeHierarchy:
+        """Lädt den Baum der Bewertungstypen eines Kurses.
         
         Args:
-            student_id: ID des Schülers
             course_id: ID des Kurses
             
         Returns:
-            Gewichtete Durchschnittsnote oder None wenn keine Noten vorhanden
+            GradeHierarchy für die Berechnung von Typ- und Endnoten
         """
-        # Prüfe ob der Schüler überhaupt Noten hat
         cursor = self.execute(
-            """SELECT COUNT(*) as count 
-            FROM assessments 
-            WHERE student_id = ? AND course_id = ?""",
-            (student_id, course_id)
+            """SELECT id, name, parent_type_id, weight
+               FROM assessment_types
+               WHERE course_id = ?""",
+            (course_id,)
         )
-        if cursor.fetchone()['count'] == 0:
-            return None
+        return GradeHierarchy(self._dicts_from_rows(cursor.fetchall()))
+    
+    def get_type_sums(self, course_id: int, student_id: Optional[int] = None,
+                      start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> Dict[int, Dict[int, tuple]]:
+        """Summiert die Noten eines Kurses je Schüler und Bewertungstyp.
         
-        # Hole alle Bewertungstypen und deren Gewichtungen
-        from .assessment_type_repository import AssessmentTypeRepository
-        type_repo = AssessmentTypeRepository(self.db)
-        types = type_repo.get_by_course(course_id)
-        if not types:
-            return None
+        Args:
+            course_id: ID des Kurses
+            student_id: Optional, nur für diesen Schüler
+            start_date: Optional, Startdatum (YYYY-MM-DD)
+            end_date: Optional, Enddatum (YYYY-MM-DD)
+            
+        Returns:
+            Schüler-ID -> (Typ-ID -> (Summe Note*Gewicht, Summe Gewicht, Anzahl))
+        """
+        if not start_date and not end_date:
+            # Ohne Zeitraum direkt aus der mitgeführten Summentabelle
+            query = """
+                SELECT student_id, assessment_type_id,
+                       weighted_sum, weight_sum, grade_count
+                FROM grade_aggregates
+                WHERE course_id = ?
+            """
+            params = [course_id]
+            if student_id is not None:
+                query += " AND student_id = ?"
+                params.append(student_id)
+        else:
+            query = """
+                SELECT student_id, assessment_type_id,
+                       SUM(grade * COALESCE(weight, 1.0)) as weighted_sum,
+                       SUM(COALESCE(weight, 1.0)) as weight_sum,
+                       COUNT(*) as grade_count
+                FROM assessments
+                WHERE course_id = ?
+            """
+            params = [course_id]
+            if student_id is not None:
+                query += " AND student_id = ?"
+                params.append(student_id)
+            if start_date:
+                query += " AND date >= ?"
+                params.append(start_date)
+            if end_date:
+                query += " AND date <= ?"
+                params.append(end_date)
+            query += " GROUP BY student_id, assessment_type_id"
         
-        # Berechne gewichtete Durchschnitte für jeden Typ
-        def calculate_type_average(type_id):
-            cursor = self.execute(
-                """SELECT AVG(grade) as avg_grade
-                   FROM assessments
-                   WHERE student_id = ? AND course_id = ? 
-                         AND assessment_type_id = ?""",
-                (student_id, course_id, type_id)
+        sums = {}
+        for row in self.execute(query, tuple(params)).fetchall():
+            sums.setdefault(row['student_id'], {})[row['assessment_type_id']] = (
+                row['weighted_sum'], row['weight_sum'], row['grade_count']
+            )
+        return sums
+    
+    def calculate_course_grades(self, course_id: int,
+                                start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+        """Berechnet End- und Typnoten aller Schüler eines Kurses.
+        
+        Lädt den Typbaum und die Notensummen mit je einer Abfrage und
+        wertet die gewichtete Hierarchie danach im Speicher aus.
+        
+        Args:
+            course_id: ID des Kurses
+            start_date: Optional, Startdatum (YYYY-MM-DD)
+            end_date: Optional, Enddatum (YYYY-MM-DD)
+            
+        Returns:
+            Schüler-ID -> {'final_grade': float|None, 'type_averages': {Typ-ID: float}}
+            für alle Schüler mit Noten im Kurs
+        """
+        hierarchy = self.get_grade_hierarchy(course_id)
+        sums = self.get_type_sums(course_id, start_date=start_date, end_date=end_date)
+        return hierarchy.evaluate_all(sums)
+    
+    def get_gradebook(self, course_id: int,
+                      semester_id: Optional[int] = None) -> Dict[str, Any]:
+        """Erstellt das Notenbuch eines Kurses als dichte Matrix.
+        
+        Zeilen sind die Schüler des Kurses, Spalten die einzelnen
+        Bewertungen (Bewertungstyp, Datum und Thema). Schüler, Typbaum und
+        Noten werden mit je einer Abfrage geladen, End- und Typnoten sowie
+        die Spaltenstatistik im Speicher berechnet.
+        
+        Args:
+            course_id: ID des Kurses
+            semester_id: Optional, nur Schüler und Noten dieses Halbjahres
+            
+        Returns:
+            Dictionary mit:
+            - students: Schüler mit 'final_grade' und 'type_averages'
+            - types: Bewertungstypen hierarchisch sortiert
+            - columns: Bewertungen mit 'assessment_type_id', 'type_name',
+              'date', 'topic', 'lesson_id' und Statistik ('count',
+              'average', 'best', 'worst')
+            - grades: Matrix [Schüler][Spalte] mit Note oder None
+            - final_stats: Statistik über die Endnoten
+        """
+        start_date = end_date = None
+        student_query = """
+            SELECT DISTINCT s.id, s.first_name, s.last_name
+            FROM students s
+            JOIN student_courses sc ON s.id = sc.student_id
+            WHERE sc.course_id = ?
+        """
+        student_params = [course_id]
+        if semester_id is not None:
+            semester = self.execute(
+                "SELECT start_date, end_date FROM semester_history WHERE id = ?",
+                (semester_id,)
+            ).fetchone()
+            if semester:
+                start_date, end_date = semester['start_date'], semester['end_date']
+            student_query += " AND sc.semester_id = ?"
+            student_params.append(semester_id)
+        student_query += " ORDER BY s.last_name, s.first_name"
+        students = self._dicts_from_rows(
+            self.execute(student_query, tuple(student_params)).fetchall()
+        )
+        
+        hierarchy = self.get_grade_hierarchy(course_id)
+        # Richtung der Skala für beste/schlechteste Note (1-6 abwärts, 0-15 aufwärts)
+        scale = self.db.grading_systems.get_scale_for_course(course_id)
+        higher_is_better = scale.higher_is_better if scale else False
+        
+        query = """
+            SELECT student_id, assessment_type_id, grade,
+                   COALESCE(weight, 1.0) as weight, date, topic, lesson_id
+            FROM assessments
+            WHERE course_id = ?
+        """
+        params = [course_id]
+        if start_date:
+            query += " AND date >= ? AND date <= ?"
+            params.extend([start_date, end_date])
+        query += " ORDER BY date, assessment_type_id, topic"
+        assessments = self.execute(query, tuple(params)).fetchall()
+        
+        # Spalten und Matrix in einem Durchlauf aufbauen
+        row_of = {student['id']: index for index, student in enumerate(students)}
+        columns = []
+        column_of = {}
+        cells = []    # (Zeile, Spalte, Note)
+        seen = {}     # (Zeile, Bewertung) -> Anzahl, für mehrere Noten derselben Bewertung
+        sums = {}     # Schüler-ID -> Typ-ID -> [Summe Note*Gewicht, Summe Gewicht, Anzahl]
+        for a in assessments:
+            row = row_of.get(a['student_id'])
+            if row is None:
+                continue  # Note eines Schülers, der nicht (mehr) im Kurs ist
+            
+            key = (a['assessment_type_id'], a['date'], a['topic'], a['lesson_id'])
+            occurrence = seen.get((row, key), 0)
+            seen[(row, key)] = occurrence + 1
+            key += (occurrence,)
+            column = column_of.get(key)
+            if column is None:
+                type_data = hierarchy.types.get(a['assessment_type_id'], {})
+                column = column_of[key] = len(columns)
+                columns.append({
+                    'assessment_type_id': a['assessment_type_id'],
+                    'type_name': type_data.get('name'),
+                    'date': a['date'],
+                    'topic': a['topic'],
+                    'lesson_id': a['lesson_id']
+                })
+            cells.append((row, column, a['grade']))
+            
+            type_sums = sums.setdefault(a['student_id'], {}).setdefault(
+                a['assessment_type_id'], [0.0, 0.0, 0]
             )
-            result = cursor.fetchone()
-            return result['avg_grade'] if result else None
+            type_sums[0] += a['grade'] * a['weight']
+            type_sums[1] += a['weight']
+            type_sums[2] += 1
+        
+        grades = [[None] * len(columns) for _ in students]
+        for row, column, grade in cells:
+            grades[row][column] = grade
+        
+        results = hierarchy.evaluate_all(sums)
+        for student in students:
+            result = results.get(student['id'], {})
+            student['final_grade'] = result.get('final_grade')
+            student['type_averages'] = result.get('type_averages', {})
+        
+        for index, column in enumerate(columns):
+            column.update(self._grade_stats(
+                (row[index] for row in grades), higher_is_better
+            ))
+        
+        return {
+            'students': students,
+            'types': hierarchy.ordered_types,
+            'columns': columns,
+            'grades': grades,
+            'final_stats': self._grade_stats(
+                (s['final_grade'] for s in students), higher_is_better
+            )
+        }
+    
+    def get_statistics_rows(self, course_ids: List[int],
+                            start_date: Optional[str] = None,
+                            end_date: Optional[str] = None) -> List[tuple]:
+        """Holt die Noten mehrerer Kurse als flache Zeilen für die Statistik.
+        
+        Args:
+            course_ids: IDs der Kurse
+            start_date: Optional, Startdatum (YYYY-MM-DD)
+            end_date: Optional, Enddatum (YYYY-MM-DD)
+            
+        Returns:
+            Liste von Tupeln (grade, weight, assessment_type_id, student_id, course_id)
+        """
+        if not course_ids:
+            return []
+        query = f"""
+            SELECT grade, weight, assessment_type_id, student_id, course_id
+            FROM assessments
+            WHERE course_id IN ({', '.join('?' * len(course_ids))})
+        """
+        params = list(course_ids)
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        return [tuple(row) for row in self.execute(query, tuple(params)).fetchall()]
+    
+    @staticmethod
+    def _grade_stats(values, higher_is_better: bool = False) -> Dict[str, Any]:
+        """Berechnet Anzahl, Durchschnitt, beste und schlechteste Note.
         
-        # Nur Root-Level Typen (ohne parent) für Endnote
-        root_types = [t for t in types if not t.get('parent_type_id')]
+        Args:
+            values: Noten (None wird übersprungen)
+            higher_is_better: True bei Punktesystemen (z.B. 0-15)
+        """
+        values = [value for value in values if value is not None]
+        if not values:
+            return {'count': 0, 'average': None, 'best': None, 'worst': None}
+        low, high = min(values), max(values)
+        return {
+            'count': len(values),
+            'average': round(sum(values) / len(values), 2),
+            'best': high if higher_is_better else low,
+            'worst': low if higher_is_better else high
+        }
+    
+    def calculate_final_grade(self, student_id: int, course_id: int) -> Optional[float]:
+        """Berechnet die Gesamtnote eines Schülers in einem Kurs.
         
-        weighted_sum = 0
-        weight_sum = 0
+        Berücksichtigt die gesamte Typhierarchie inklusive Untertypen.
         
-        for type_data in root_types:
-            avg = calculate_type_average(type_data['id'])
-            if avg is not None:
-                weighted_sum += avg * type_data['weight']
-                weight_sum += type_data['weight']
+        Args:
+            student_id: ID des Schülers
+            course_id: ID des Kurses
+            
+        Returns:
+            Gewichtete Durchschnittsnote oder None wenn keine Noten vorhanden
+        """
+        sums = self.get_type_sums(course_id, student_id=student_id)
+        if not sums:
+            return None
         
-        return round(weighted_sum / weight_sum, 2) if weight_sum > 0 else None
+        hierarchy = self.get_grade_hierarchy(course_id)
+        return hierarchy.evaluate_all(sums)[student_id]['final_grade']
     
     def get_student_course_grades(self, student_id: int) -> Dict[int, Dict[str, Any]]:
         """Holt die Gesamtnoten eines Schülers für alle seine Kurse.
         
+        Typbäume und Notensummen (aus grade_aggregates) aller Kurse werden
+        mit je einer Abfrage geladen statt einzeln pro Kurs.
+        
         Args:
             student_id: ID des Schülers
             
@@ -224,13 +521,39 @@ class AssessmentRepository(BaseRepository):
             WHERE sc.student_id = ?
             ORDER BY c.name
         """, (student_id,))
-        
         courses = cursor.fetchall()
         
+        cursor = self.execute("""
+            SELECT t.id, t.name, t.parent_type_id, t.weight, t.course_id
+            FROM assessment_types t
+            WHERE t.course_id IN (
+                SELECT course_id FROM student_courses WHERE student_id = ?
+            )
+        """, (student_id,))
+        types_by_course = {}
+        for row in cursor.fetchall():
+            types_by_course.setdefault(row['course_id'], []).append(dict(row))
+        
+        cursor = self.execute("""
+            SELECT course_id, assessment_type_id,
+                   weighted_sum, weight_sum, grade_count
+            FROM grade_aggregates
+            WHERE student_id = ?
+        """, (student_id,))
+        sums_by_course = {}
+        for row in cursor.fetchall():
+            sums_by_course.setdefault(row['course_id'], {})[row['assessment_type_id']] = (
+                row['weighted_sum'], row['weight_sum'], row['grade_count']
+            )
+        
         # Berechne Noten für jeden Kurs
         course_grades = {}
         for course in courses:
-            final_grade = self.calculate_final_grade(student_id, course['id'])
+            sums = sums_by_course.get(course['id'])
+            if not sums:
+                continue
+            hierarchy = GradeHierarchy(types_by_course.get(course['id'], []))
+            final_grade = hierarchy.evaluate_all({student_id: sums})[student_id]['final_grade']
             if final_grade is not None:
                 course_grades[course['id']] = {
                     'name': course['name'],
@@ -272,15 +595,14 @@ class AssessmentRepository(BaseRepository):
             TypeGrades AS (
                 SELECT 
                     th.*,
-                    ROUND(AVG(a.grade * a.weight) / AVG(a.weight), 2) as average_grade,
-                    COUNT(a.id) as grade_count
+                    ROUND(ga.weighted_sum / ga.weight_sum, 2) as average_grade,
+                    COALESCE(ga.grade_count, 0) as grade_count
                 FROM TypeHierarchy th
-                LEFT JOIN assessments a ON th.id = a.assessment_type_id 
-                    AND a.student_id = ?
-                GROUP BY th.id
+                LEFT JOIN grade_aggregates ga ON th.id = ga.assessment_type_id 
+                    AND ga.student_id = ? AND ga.course_id = ?
             )
             SELECT * FROM TypeGrades
             ORDER BY path
-        """, (course_id, student_id))
+        """, (course_id, student_id, course_id))
         
         return self._dicts_from_rows(cursor.fetchall())
@@ -100,6 +100,8 @@ class AssessmentTemplateRepository(BaseRepository):
                WHERE id = ?""",
             (name, subject, grading_system_id, description, template_id)
         )
+        # Kurse mit dieser Vorlage haben ggf. ein anderes Notensystem
+        self.db.notify_change('assessment_type_templates')
     
     def delete(self, template_id: int) -> None:
         """Löscht eine Vorlage und alle ihre Items.
@@ -118,6 +120,7 @@ class AssessmentTemplateRepository(BaseRepository):
             "DELETE FROM assessment_type_templates WHERE id = ?",
             (template_id,)
         )
+        self.db.notify_change('assessment_type_templates')
     
     def add_item(self, template_id: int, name: str, 
                 parent_item_id: int = None, default_weight: float = 1.0) -> int:
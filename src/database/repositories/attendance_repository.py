@@ -1,6 +1,6 @@
 # src/database/repositories/attendance_repository.py
 
-from typing import List
+from typing import Iterable, List
 from .base_repository import BaseRepository
 
 
@@ -47,3 +47,33 @@ class AttendanceRepository(BaseRepository):
             (lesson_id,)
         )
         return [row['student_id'] for row in cursor.fetchall()]
+    
+    def set_absent_students(self, lesson_id: int, student_ids: Iterable[int]) -> None:
+        """Setzt die abwesenden Schüler einer Stunde.
+        
+        Schreibt nur die Differenz zum gespeicherten Stand: neue
+        Abwesenheiten werden eingefügt, nicht mehr abwesende Schüler
+        gelöscht, jeweils mit einem executemany in einer Transaktion.
+        
+        Args:
+            lesson_id: ID der Stunde
+            student_ids: IDs aller Schüler, die abwesend sind
+        """
+        absent = set(student_ids)
+        current = set(self.get_absent_students(lesson_id))
+        to_add = absent - current
+        to_remove = current - absent
+        
+        with self.transaction():
+            if to_remove:
+                self.executemany(
+                    "DELETE FROM student_attendance WHERE lesson_id = ? AND student_id = ?",
+                    [(lesson_id, student_id) for student_id in sorted(to_remove)]
+                )
+            if to_add:
+                self.executemany(
+                    """INSERT OR REPLACE INTO student_attendance 
+                    (student_id, lesson_id)
+                    VALUES (?, ?)""",
+                    [(student_id, lesson_id) for student_id in sorted(to_add)]
+                )
@@ -33,6 +33,30 @@ class BaseRepository(ABC):
         """
         return self.db.execute(query, params)
     
+    def executemany(self, query: str, seq_of_params):
+        """Führt eine SQL-Query für mehrere Parametersätze aus.
+        
+        Delegiert an den DatabaseManager.
+        
+        Args:
+            query: SQL-Query-String
+            seq_of_params: Iterable von Parameter-Tupeln
+            
+        Returns:
+            Cursor-Objekt
+        """
+        return self.db.executemany(query, seq_of_params)
+    
+    def transaction(self):
+        """Öffnet eine (ggf. verschachtelte) Transaktion.
+        
+        Delegiert an DatabaseManager.transaction().
+        
+        Returns:
+            Context-Manager, der am Ende des Blocks einmal committet
+        """
+        return self.db.transaction()
+    
     def _dict_from_row(self, row) -> Optional[Dict[str, Any]]:
         """Konvertiert eine Datenbank-Zeile in ein Dictionary.
         
@@ -96,6 +96,10 @@ class CourseRepository(BaseRepository):
         
         query = f"UPDATE courses SET {', '.join(updates)} WHERE id = ?"
         self.execute(query, tuple(params))
+        # Name und Farbe erscheinen in den Stunden (z.B. Wochenansicht)
+        self.db.notify_change('lessons')
+        # Das Template (und damit das Notensystem) kann sich geändert haben
+        self.db.notify_change('courses')
     
     def delete(self, course_id: int) -> None:
         """Löscht einen Kurs aus der Datenbank.
@@ -107,6 +111,9 @@ class CourseRepository(BaseRepository):
             "DELETE FROM courses WHERE id = ?",
             (course_id,)
         )
+        # ON DELETE CASCADE entfernt auch die Stunden des Kurses
+        self.db.notify_change('lessons')
+        self.db.notify_change('courses')
     
     def get_by_semester(self, semester_id: int) -> List[Dict[str, Any]]:
         """Holt alle Kurse eines bestimmten Semesters.
@@ -1,11 +1,70 @@
 # src/database/repositories/grading_system_repository.py
 
+import os
+import threading
 from typing import List, Dict, Any, Optional
 from .base_repository import BaseRepository
+from src.models.grading_scale import GradingScale
+
+
+class GradingScaleCache:
+    """Berechnete Notenskalen und Kurs -> Notensystem einer Datenbankdatei.
+
+    Eine Instanz pro Datenbankdatei wird von allen Verbindungen geteilt
+    (GUI und ReadWorker), damit eine Änderung über eine Verbindung auch
+    die Skalen der anderen verwirft. Ein Generationszähler verhindert,
+    dass ein parallel gelesener, veralteter Wert nach dem Verwerfen
+    wieder eingetragen wird.
+    """
+
+    _instances: Dict[str, 'GradingScaleCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.scales: Dict[int, GradingScale] = {}
+        self.course_systems: Dict[int, Optional[int]] = {}  # Kurs -> Notensystem-ID
+        self.generation = 0
+
+    @classmethod
+    def for_database(cls, db_file: str) -> 'GradingScaleCache':
+        """Liefert den gemeinsamen Cache einer Datenbankdatei."""
+        key = db_file if db_file == ':memory:' else os.path.abspath(db_file)
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls._instances[key] = cls()
+            return cache
+
+    def clear(self, scales: bool = True) -> None:
+        """Verwirft die Zuordnung Kurs -> Notensystem und ggf. alle Skalen."""
+        with self.lock:
+            if scales:
+                self.scales.clear()
+            self.course_systems.clear()
+            self.generation += 1
 
 
 class GradingSystemRepository(BaseRepository):
-    """Repository für Notensystem-Operationen."""
+    """Repository für Notensystem-Operationen.
+    
+    Hält die berechneten Notenskalen pro Notensystem und das Notensystem
+    pro Kurs in einem GradingScaleCache vor, den alle Verbindungen zur
+    selben Datenbank teilen. Verworfen wird über db.notify_change():
+    'grading_systems' verwirft alles, 'courses' und
+    'assessment_type_templates' die Zuordnung Kurs -> Notensystem.
+    """
+    
+    def __init__(self, db_manager):
+        super().__init__(db_manager)
+        self._cache = GradingScaleCache.for_database(db_manager.db_file)
+        db_manager.add_change_listener(self._on_data_changed)
+    
+    def _on_data_changed(self, table: str, start_date=None, end_date=None) -> None:
+        if table == 'grading_systems':
+            self._cache.clear()
+        elif table in ('courses', 'assessment_type_templates'):
+            self._cache.clear(scales=False)
     
     def add(self, name: str, min_grade: float, max_grade: float, 
            step_size: float, description: str = None) -> int:
@@ -75,6 +134,7 @@ class GradingSystemRepository(BaseRepository):
                WHERE id = ?""",
             (name, min_grade, max_grade, step_size, description, system_id)
         )
+        self.db.notify_change('grading_systems')
     
     def delete(self, system_id: int) -> None:
         """Löscht ein Notensystem.
@@ -86,6 +146,72 @@ class GradingSystemRepository(BaseRepository):
             "DELETE FROM grading_systems WHERE id = ?",
             (system_id,)
         )
+        self.db.notify_change('grading_systems')
+    
+    def get_scale(self, system_id: int) -> Optional[GradingScale]:
+        """Holt die Notenskala eines Notensystems.
+        
+        Die Skala wird pro Notensystem nur einmal berechnet.
+        
+        Args:
+            system_id: ID des Notensystems
+            
+        Returns:
+            GradingScale oder None wenn das Notensystem nicht existiert
+        """
+        cache = self._cache
+        scale = cache.scales.get(system_id)
+        if scale is not None:
+            return scale
+        
+        generation = cache.generation
+        system = self.get_by_id(system_id)
+        if not system:
+            return None
+        return self._store_scale(system, generation)
+    
+    def get_scale_for_course(self, course_id: int) -> Optional[GradingScale]:
+        """Holt die Notenskala eines Kurses über dessen Notensystem.
+        
+        Das Notensystem des Kurses wird gemerkt, so dass wiederholte
+        Aufrufe für denselben Kurs ohne Datenbankzugriff auskommen.
+        
+        Args:
+            course_id: ID des Kurses
+            
+        Returns:
+            GradingScale oder None wenn der Kurs kein Notensystem hat
+        """
+        cache = self._cache
+        if course_id in cache.course_systems:
+            system_id = cache.course_systems[course_id]
+            if system_id is None:
+                return None
+            scale = cache.scales.get(system_id)
+            if scale is not None:
+                return scale
+        
+        generation = cache.generation
+        system = self.get_by_course(course_id)
+        with cache.lock:
+            if cache.generation == generation:
+                cache.course_systems[course_id] = system['id'] if system else None
+        if not system:
+            return None
+        return self._store_scale(system, generation)
+    
+    def clear_scale_cache(self) -> None:
+        """Verwirft alle berechneten Notenskalen (für alle Verbindungen)."""
+        self._cache.clear()
+    
+    def _store_scale(self, system: Dict[str, Any], generation: int) -> GradingScale:
+        """Berechnet die Skala und legt sie ab, sofern nicht inzwischen verworfen wurde."""
+        scale = GradingScale(system)
+        cache = self._cache
+        with cache.lock:
+            if cache.generation == generation:
+                scale = cache.scales.setdefault(system['id'], scale)
+        return scale
     
     def validate_grade(self, grade: float, system_id: int) -> bool:
         """Prüft ob eine Note in einem Notensystem gültig ist.
@@ -97,20 +223,11 @@ class GradingSystemRepository(BaseRepository):
         Returns:
             True wenn die Note gültig ist, sonst False
         """
-        system = self.get_by_id(system_id)
-        if not system:
+        scale = self.get_scale(system_id)
+        if not scale:
             raise ValueError("Notensystem nicht gefunden")
         
-        # Prüfe ob Note im erlaubten Bereich liegt
-        if grade < system['min_grade'] or grade > system['max_grade']:
-            return False
-        
-        # Prüfe ob Note ein gültiger Schritt ist
-        steps = round((grade - system['min_grade']) / system['step_size'])
-        valid_grade = system['min_grade'] + (steps * system['step_size'])
-        
-        # Berücksichtige Rundungsfehler
-        return abs(grade - valid_grade) < 0.0001
+        return scale.is_valid(grade)
     
     def get_by_course(self, course_id: int) -> Optional[Dict[str, Any]]:
         """Holt das Notensystem für einen Kurs über dessen Template.
@@ -1,6 +1,6 @@
 # src/database/repositories/holiday_repository.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from .base_repository import BaseRepository
 
 
@@ -26,8 +26,37 @@ class HolidayRepository(BaseRepository):
             VALUES (?, ?, ?, ?, ?)""",
             (date, name, type, state, year)
         )
+        self.db.notify_change('public_holidays', date, date)
         return cursor.lastrowid
     
+    def add_public_many(self, rows: Iterable[Tuple[str, str, str, str, int]]) -> int:
+        """Fügt mehrere öffentliche Feiertage/Ferientage auf einmal hinzu.
+        
+        Alle Zeilen werden mit einem executemany in einer Transaktion
+        eingefügt. Innerhalb eines äußeren transaction()-Blocks (z.B.
+        zusammen mit clear_public_by_year()) wird erst dort committet.
+        
+        Args:
+            rows: Zeilen (date, name, type, state, year)
+            
+        Returns:
+            Anzahl der eingefügten Zeilen
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        
+        with self.transaction():
+            self.executemany(
+                """INSERT INTO public_holidays 
+                (date, name, type, state, year) 
+                VALUES (?, ?, ?, ?, ?)""",
+                rows
+            )
+        dates = [row[0] for row in rows]
+        self.db.notify_change('public_holidays', min(dates), max(dates))
+        return len(rows)
+    
     def add_school(self, date: str, name: str, description: str = None) -> int:
         """Fügt einen schulspezifischen freien Tag hinzu.
         
@@ -45,6 +74,7 @@ class HolidayRepository(BaseRepository):
             VALUES (?, ?, ?)""",
             (date, name, description)
         )
+        self.db.notify_change('school_holidays', date, date)
         return cursor.lastrowid
     
     def delete_public(self, holiday_id: int) -> None:
@@ -57,6 +87,7 @@ class HolidayRepository(BaseRepository):
             "DELETE FROM public_holidays WHERE id = ?",
             (holiday_id,)
         )
+        self.db.notify_change('public_holidays')
     
     def delete_school(self, holiday_id: int) -> None:
         """Löscht einen schulspezifischen freien Tag.
@@ -68,6 +99,7 @@ class HolidayRepository(BaseRepository):
             "DELETE FROM school_holidays WHERE id = ?",
             (holiday_id,)
         )
+        self.db.notify_change('school_holidays')
     
     def get_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Holt alle Feiertage und freien Tage in einem Zeitraum.
@@ -79,38 +111,105 @@ class HolidayRepository(BaseRepository):
         Returns:
             Liste von Dictionaries mit Feiertagsdaten, sortiert nach Datum
         """
-        # Erst die öffentlichen Feiertage/Ferien
+        # Öffentliche und schulspezifische freie Tage in einer Abfrage
         cursor = self.execute(
             """SELECT date, name, type, 'public' as source
             FROM public_holidays 
-            WHERE date BETWEEN ? AND ?""",
-            (start_date, end_date)
+            WHERE date BETWEEN ? AND ?
+            UNION ALL
+            SELECT date, name, 'school' as type, 'school' as source
+            FROM school_holidays 
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date""",
+            (start_date, end_date, start_date, end_date)
         )
-        holidays = self._dicts_from_rows(cursor.fetchall())
+        return self._dicts_from_rows(cursor.fetchall())
+    
+    def get_cancellation_notes(self, start_date: str, end_date: str) -> Dict[str, str]:
+        """Liefert für jeden freien Tag im Zeitraum die Ausfall-Notiz.
+        
+        Es gelten dieselben Vorrangregeln wie in
+        update_lesson_status_for_holidays(): Feiertag vor Ferien vor
+        schulspezifischem freien Tag.
         
-        # Dann die schulspezifischen
+        Args:
+            start_date: Startdatum im Format "YYYY-MM-DD"
+            end_date: Enddatum im Format "YYYY-MM-DD"
+            
+        Returns:
+            Dictionary Datum -> Notiz (z.B. "Entfällt wegen Feiertag: Ostermontag")
+        """
+        candidates = {}
+        for holiday in self.get_by_date_range(start_date, end_date):
+            if holiday['type'] == 'holiday':
+                note, priority = f"Entfällt wegen Feiertag: {holiday['name']}", 0
+            elif holiday['type'] == 'school':
+                note, priority = f"Entfällt wegen Schulfrei: {holiday['name']}", 2
+            else:
+                note, priority = f"Entfällt wegen Ferien: {holiday['name']}", 1
+            candidates.setdefault(holiday['date'], []).append((priority, note))
+        return {date: min(entries)[1] for date, entries in candidates.items()}
+    
+    def clear_public_by_year(self, year: int, state: str, type: Optional[str] = None) -> None:
+        """Löscht alle öffentlichen Feiertage eines Jahres/Bundeslandes.
+        
+        Args:
+            year: Jahr
+            state: Bundesland
+            type: Optional, nur diesen Typ ('holiday' oder 'vacation_day')
+        """
+        if type is None:
+            self.execute(
+                """DELETE FROM public_holidays 
+                WHERE year = ? AND state = ?""",
+                (year, state)
+            )
+        else:
+            self.execute(
+                """DELETE FROM public_holidays 
+                WHERE year = ? AND state = ? AND type = ?""",
+                (year, state, type)
+            )
+        self.db.notify_change('public_holidays', f"{year}-01-01", f"{year}-12-31")
+    
+    def get_loaded_years(self, state: str) -> List[int]:
+        """Holt die Jahre, deren Ferien/Feiertage vollständig geladen sind.
+        
+        Args:
+            state: Bundesland
+            
+        Returns:
+            Aufsteigend sortierte Liste von Jahren
+        """
         cursor = self.execute(
-            """SELECT date, name, 'school' as type, 'school' as source
-            FROM school_holidays 
-            WHERE date BETWEEN ? AND ?""",
-            (start_date, end_date)
+            "SELECT year FROM holiday_coverage WHERE state = ? ORDER BY year",
+            (state,)
         )
-        holidays.extend(self._dicts_from_rows(cursor.fetchall()))
+        return [row['year'] for row in cursor.fetchall()]
+    
+    def mark_loaded(self, year: int, state: str) -> None:
+        """Vermerkt ein Jahr als vollständig geladen.
         
-        # Sortiert nach Datum zurückgeben
-        return sorted(holidays, key=lambda x: x['date'])
+        Args:
+            year: Jahr
+            state: Bundesland
+        """
+        self.execute(
+            """INSERT INTO holiday_coverage (state, year) VALUES (?, ?)
+            ON CONFLICT(state, year) DO UPDATE SET loaded_at = CURRENT_TIMESTAMP""",
+            (state, year)
+        )
     
-    def clear_public_by_year(self, year: int, state: str) -> None:
-        """Löscht alle öffentlichen Feiertage eines Jahres/Bundeslandes.
+    def clear_coverage(self, year: int, state: str) -> None:
+        """Entfernt den Geladen-Vermerk eines Jahres.
         
         Args:
             year: Jahr
             state: Bundesland
         """
         self.execute(
-            """DELETE FROM public_holidays 
-            WHERE year = ? AND state = ?""",
-            (year, state)
+            "DELETE FROM holiday_coverage WHERE state = ? AND year = ?",
+            (state, year)
         )
     
     def get_school_holidays(self) -> List[Dict[str, Any]]:
@@ -143,30 +242,65 @@ class HolidayRepository(BaseRepository):
         )
         return self._dicts_from_rows(cursor.fetchall())
     
-    def update_lesson_status_for_holidays(self) -> None:
-        """Aktualisiert den Status von Stunden, die in Ferien/an Feiertagen liegen."""
-        # Hole alle Stunden
+    def update_lesson_status_for_holidays(self, start_date: Optional[str] = None,
+                                          end_date: Optional[str] = None,
+                                          lesson_ids: Optional[List[int]] = None) -> int:
+        """Setzt Stunden, die in Ferien/an Feiertagen liegen, auf 'cancelled'.
+        
+        Arbeitet mengenbasiert mit einem einzigen UPDATE über public_holidays
+        und school_holidays. Bei mehreren Einträgen für ein Datum hat ein
+        Feiertag Vorrang vor Ferien, diese vor schulspezifischen freien Tagen.
+        Stunden, die bereits mit derselben Notiz entfallen, werden nicht
+        erneut geschrieben.
+        
+        Args:
+            start_date: Optional, nur Stunden ab diesem Datum ("YYYY-MM-DD")
+            end_date: Optional, nur Stunden bis zu diesem Datum ("YYYY-MM-DD")
+            lesson_ids: Optional, nur diese Stunden
+            
+        Returns:
+            Anzahl der geänderten Stunden
+        """
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+        if lesson_ids is not None:
+            if not lesson_ids:
+                return 0
+            conditions.append(f"id IN ({', '.join('?' * len(lesson_ids))})")
+            params.extend(lesson_ids)
+        filter_sql = "".join(f" AND {condition}" for condition in conditions)
+        
+        # Notiz des vorrangigen freien Tages zum Datum der Stunde
+        note_sql = """(SELECT note FROM (
+                SELECT 'Entfällt wegen ' ||
+                       CASE type WHEN 'holiday' THEN 'Feiertag' ELSE 'Ferien' END ||
+                       ': ' || name AS note,
+                       CASE type WHEN 'holiday' THEN 0 ELSE 1 END AS priority
+                FROM public_holidays
+                WHERE date = lessons.date
+                UNION ALL
+                SELECT 'Entfällt wegen Schulfrei: ' || name, 2
+                FROM school_holidays
+                WHERE date = lessons.date
+            )
+            ORDER BY priority, note
+            LIMIT 1)"""
+        
         cursor = self.execute(
-            "SELECT id, date FROM lessons"
+            f"""UPDATE lessons
+            SET status = 'cancelled',
+                status_note = {note_sql}
+            WHERE (date IN (SELECT date FROM public_holidays)
+                   OR date IN (SELECT date FROM school_holidays)){filter_sql}
+            AND (status IS NOT 'cancelled' OR status_note IS NOT {note_sql})""",
+            tuple(params)
         )
-        lessons = cursor.fetchall()
-        
-        for lesson in lessons:
-            # Prüfe ob das Datum ein Feiertag/Ferientag ist
-            cursor = self.execute(
-                """SELECT type, name FROM public_holidays 
-                WHERE date = ?""",
-                (lesson['date'],)
-            )
-            holiday = cursor.fetchone()
-            
-            if holiday:
-                status_note = f"Entfällt wegen {'Feiertag' if holiday['type'] == 'holiday' else 'Ferien'}: {holiday['name']}"
-                # Update den Status
-                self.execute(
-                    """UPDATE lessons 
-                    SET status = 'cancelled',
-                        status_note = ?
-                    WHERE id = ?""",
-                    (status_note, lesson['id'])
-                )
+        if cursor.rowcount > 0:
+            self.db.notify_change('lessons', start_date, end_date)
+        return cursor.rowcount
@@ -34,58 +34,7 @@ class LessonRepository(BaseRepository):
             raise ValueError("Eine Unterrichtsstunde muss einem Kurs zugeordnet sein")
         
         if data.get('is_recurring'):
-            # Semesterdaten holen (benötigt SemesterRepository)
-            from .semester_repository import SemesterRepository
-            semester_repo = SemesterRepository(self.db)
-            semester = semester_repo.get_current()
-            if not semester:
-                raise ValueError("Kein aktives Halbjahr gefunden")
-            
-            # Wochentag bestimmen
-            start_date = datetime.strptime(data['date'], "%Y-%m-%d")
-            weekday = start_date.isoweekday()
-            
-            # Hash generieren
-            time_str = data['time'] if isinstance(data['time'], str) else data['time'][0]
-            rec_hash = self._generate_recurring_hash(
-                data['course_id'],
-                weekday,
-                time_str
-            )
-            
-            # Alle Termine bis Semesterende erstellen
-            lesson_ids = []
-            current_date = start_date
-            end_date = datetime.strptime(semester['semester_end'], "%Y-%m-%d")
-            
-            while current_date <= end_date:
-                if current_date.isoweekday() == weekday:
-                    cursor = self.execute(
-                        """INSERT INTO lessons
-                        (course_id, date, time, subject, topic, homework, recurring_hash, 
-                         duration, status, status_note, moved_to_lesson_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (data['course_id'],
-                         current_date.strftime("%Y-%m-%d"),
-                         data['time'],
-                         data['subject'],
-                         data.get('topic', ''),
-                         data.get('homework'),
-                         rec_hash,
-                         data.get('duration', 1),
-                         data.get('status', 'normal'),
-                         data.get('status_note'),
-                         data.get('moved_to_lesson_id'))
-                    )
-                    lesson_ids.append(cursor.lastrowid)
-                current_date += timedelta(days=1)
-            
-            # Status für Feiertage aktualisieren
-            from .holiday_repository import HolidayRepository
-            holiday_repo = HolidayRepository(self.db)
-            holiday_repo.update_lesson_status_for_holidays()
-            
-            return lesson_ids
+            return self.add_recurring_series([data])
         else:
             # Normale einzelne Unterrichtsstunde
             cursor = self.execute(
@@ -104,8 +53,97 @@ class LessonRepository(BaseRepository):
                  data.get('status_note'),
                  data.get('moved_to_lesson_id'))
             )
+            self.db.notify_change('lessons', data['date'], data['date'])
             return cursor.lastrowid
     
+    def add_recurring_series(self, slots: List[dict],
+                             until: Optional[str] = None) -> List[int]:
+        """Legt wöchentlich wiederkehrende Stunden für mehrere Slots an.
+        
+        Die Termine werden direkt in Wochenschritten ab dem Startdatum
+        berechnet. Feiertage, Ferien und schulfreie Tage werden einmalig
+        für den gesamten Zeitraum geladen; Stunden an diesen Tagen werden
+        direkt als 'cancelled' mit passender Notiz angelegt. Alle Zeilen
+        werden mit einem executemany in einer Transaktion eingefügt, so
+        dass z.B. ein kompletter Stundenplan in einem Aufruf entsteht.
+        
+        Args:
+            slots: Liste von Stundendaten wie bei add(); 'date' ist das
+                   Startdatum und legt den Wochentag fest
+            until: Optional, letztes Datum ("YYYY-MM-DD"),
+                   Standard: Ende des aktuellen Halbjahres
+                   
+        Returns:
+            Liste der IDs aller erstellten Stunden, in der Reihenfolge der
+            Slots und innerhalb eines Slots nach Datum
+        """
+        if not slots:
+            return []
+        if any(not slot.get('course_id') for slot in slots):
+            raise ValueError("Eine Unterrichtsstunde muss einem Kurs zugeordnet sein")
+        
+        if until is None:
+            from .semester_repository import SemesterRepository
+            semester = SemesterRepository(self.db).get_current()
+            if not semester:
+                raise ValueError("Kein aktives Halbjahr gefunden")
+            until = semester['semester_end']
+        end_date = datetime.strptime(until, "%Y-%m-%d").date()
+        
+        first_date = min(slot['date'] for slot in slots)
+        from .holiday_repository import HolidayRepository
+        notes = HolidayRepository(self.db).get_cancellation_notes(first_date, until)
+        
+        rows = []
+        week = timedelta(weeks=1)
+        for slot in slots:
+            current_date = datetime.strptime(slot['date'], "%Y-%m-%d").date()
+            time_str = slot['time'] if isinstance(slot['time'], str) else slot['time'][0]
+            rec_hash = self._generate_recurring_hash(
+                slot['course_id'],
+                current_date.isoweekday(),
+                time_str
+            )
+            while current_date <= end_date:
+                date_str = current_date.isoformat()
+                note = notes.get(date_str)
+                rows.append((
+                    slot['course_id'],
+                    date_str,
+                    slot['time'],
+                    slot['subject'],
+                    slot.get('topic', ''),
+                    slot.get('homework'),
+                    rec_hash,
+                    slot.get('duration', 1),
+                    'cancelled' if note else slot.get('status', 'normal'),
+                    note if note else slot.get('status_note'),
+                    slot.get('moved_to_lesson_id')
+                ))
+                current_date += week
+        
+        if not rows:
+            return []
+        
+        with self.transaction():
+            # Innerhalb der Transaktion vergibt SQLite fortlaufende IDs
+            # oberhalb des bisherigen Maximums
+            cursor = self.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM lessons")
+            max_id = cursor.fetchone()['max_id']
+            self.executemany(
+                """INSERT INTO lessons
+                (course_id, date, time, subject, topic, homework, recurring_hash,
+                 duration, status, status_note, moved_to_lesson_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+            cursor = self.execute(
+                "SELECT id FROM lessons WHERE id > ? ORDER BY id",
+                (max_id,)
+            )
+            self.db.notify_change('lessons', first_date, until)
+            return [row['id'] for row in cursor.fetchall()]
+    
     def get_by_id(self, lesson_id: int) -> Optional[Dict[str, Any]]:
         """Holt eine einzelne Unterrichtsstunde mit Kursinformationen.
         
@@ -116,7 +154,8 @@ class LessonRepository(BaseRepository):
             Dictionary mit Stundendaten oder None
         """
         cursor = self.execute(
-            """SELECT l.*, c.name as course_name, c.subject as course_subject
+            """SELECT l.*, c.name as course_name, c.subject as course_subject,
+                   c.color as course_color
             FROM lessons l
             JOIN courses c ON l.course_id = c.id
             WHERE l.id = ?""",
@@ -147,6 +186,30 @@ class LessonRepository(BaseRepository):
         cursor = self.execute(query, (date,))
         return self._dicts_from_rows(cursor.fetchall())
     
+    def get_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Holt alle Unterrichtsstunden in einem Zeitraum.
+        
+        Args:
+            start_date: Startdatum im Format "YYYY-MM-DD"
+            end_date: Enddatum im Format "YYYY-MM-DD" (inklusive)
+            
+        Returns:
+            Liste von Dictionaries mit Stundendaten inkl. Kursinformationen,
+            sortiert nach Datum und Zeit
+        """
+        query = """
+            SELECT 
+                l.*,
+                c.name as course_name,
+                c.color as course_color
+            FROM lessons l
+            JOIN courses c ON l.course_id = c.id
+            WHERE l.date BETWEEN ? AND ?
+            ORDER BY l.date, l.time
+        """
+        cursor = self.execute(query, (start_date, end_date))
+        return self._dicts_from_rows(cursor.fetchall())
+    
     def get_all(self) -> List[Dict[str, Any]]:
         """Holt alle Unterrichtsstunden.
         
@@ -176,57 +239,50 @@ class LessonRepository(BaseRepository):
     def get_next_by_course(self, date: str) -> List[Dict[str, Any]]:
         """Holt für jeden Kurs die nächste anstehende Stunde nach einem Datum.
         
+        Stunden am Startdatum, die zur aktuellen Uhrzeit bereits vorbei
+        sind, werden übersprungen. Das Stundenende wird in SQL aus der
+        Stundenlänge der Zeiteinstellungen (Standard: 45 Minuten) und der
+        Dauer der Stunde berechnet; pro Kurs wird über ROW_NUMBER() nur
+        eine Zeile geliefert.
+        
         Args:
             date: Startdatum im Format "YYYY-MM-DD"
             
         Returns:
-            Liste von Dictionaries mit den nächsten Stunden pro Kurs
+            Liste von Dictionaries mit den nächsten Stunden pro Kurs,
+            sortiert nach Datum und Zeit
         """
         query = """
-            SELECT 
-                l.*,
-                c.name as course_name,
-                c.color as course_color
-            FROM lessons l
-            JOIN courses c ON l.course_id = c.id
-            WHERE l.date >= ?
-            ORDER BY l.date, l.time
+            WITH upcoming AS (
+                SELECT 
+                    l.*,
+                    c.name as course_name,
+                    c.color as course_color,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY l.course_id
+                        ORDER BY l.date, l.time, l.id
+                    ) AS course_rank
+                FROM lessons l
+                JOIN courses c ON l.course_id = c.id
+                WHERE l.date >= ?
+                AND (
+                    l.date > ?
+                    OR strftime('%H:%M', l.time, '+' || (
+                        COALESCE((SELECT lesson_duration FROM timetable_settings WHERE id = 1), 45)
+                        * COALESCE(l.duration, 1)
+                    ) || ' minutes') > ?
+                )
+            )
+            SELECT * FROM upcoming
+            WHERE course_rank = 1
+            ORDER BY date, time
         """
-        cursor = self.execute(query, (date,))
-        all_lessons = self._dicts_from_rows(cursor.fetchall())
-        
-        # Dictionary für die nächsten Stunden pro Kurs
-        next_lessons = {}
-        current_time = datetime.now()
-        current_time_str = current_time.strftime("%H:%M")
-        
-        # Hole Zeiteinstellungen für Stundenlänge
-        from .settings_repository import SettingsRepository
-        settings_repo = SettingsRepository(self.db)
-        settings = settings_repo.get_time_settings()
-        lesson_duration = 45  # Standard-Stundenlänge in Minuten
-        if settings and 'lesson_duration' in settings:
-            lesson_duration = settings['lesson_duration']
-        
-        for lesson in all_lessons:
-            course_id = lesson['course_id']
-            if course_id in next_lessons:
-                continue
-            
-            # Berechne Endzeit der Stunde
-            lesson_time = datetime.strptime(lesson['time'], "%H:%M")
-            lesson_end = (lesson_time + timedelta(
-                minutes=lesson_duration * lesson.get('duration', 1)
-            )).time()
-            
-            # Überspringe Stunden vom aktuellen Tag die schon vorbei sind
-            if (lesson['date'] == date and 
-                lesson_end.strftime("%H:%M") <= current_time_str):
-                continue
-            
-            next_lessons[course_id] = lesson
-        
-        return list(next_lessons.values())
+        current_time_str = datetime.now().strftime("%H:%M")
+        cursor = self.execute(query, (date, date, current_time_str))
+        next_lessons = self._dicts_from_rows(cursor.fetchall())
+        for lesson in next_lessons:
+            del lesson['course_rank']
+        return next_lessons
     
     def update(self, lesson_id: int, data: dict, update_all_following: bool = False) -> List[int]:
         """Aktualisiert eine oder mehrere Unterrichtsstunden.
@@ -268,6 +324,7 @@ class LessonRepository(BaseRepository):
             """
             
             self.execute(query, tuple(values))
+            self.db.notify_change('lessons', current_lesson['date'], None)
             
             # Hole IDs aller geänderten Stunden
             cursor = self.execute(
@@ -295,6 +352,9 @@ class LessonRepository(BaseRepository):
             """
             
             self.execute(query, tuple(values))
+            self.db.notify_change('lessons', current_lesson['date'], current_lesson['date'])
+            if data.get('date') and data['date'] != current_lesson['date']:
+                self.db.notify_change('lessons', data['date'], data['date'])
             return [lesson_id]
     
     def delete(self, lesson_id: int, delete_all_following: bool = False) -> None:
@@ -319,12 +379,14 @@ class LessonRepository(BaseRepository):
                 (current_lesson['recurring_hash'],
                  current_lesson['date'])
             )
+            self.db.notify_change('lessons', current_lesson['date'], None)
         else:
             # Nur einzelne Stunde löschen
             self.execute(
                 "DELETE FROM lessons WHERE id = ?",
                 (lesson_id,)
             )
+            self.db.notify_change('lessons', current_lesson['date'], current_lesson['date'])
     
     def get_previous_homework(self, course_id: int, date: str, time: str) -> Optional[str]:
         """Holt die Hausaufgaben der vorherigen Stunde eines Kurses.
@@ -335,7 +397,8 @@ class LessonRepository(BaseRepository):
             time: Uhrzeit der aktuellen Stunde
             
         Returns:
-            Hausaufgaben der vorherigen Stunde oder None
+            Hausaufgaben der letzten vorherigen Stunde mit (nicht leeren)
+            Hausaufgaben oder None
         """
         query = """
             SELECT homework
@@ -343,6 +406,7 @@ class LessonRepository(BaseRepository):
             WHERE course_id = ? 
             AND (date < ? OR (date = ? AND time < ?))
             AND homework IS NOT NULL
+            AND TRIM(homework) <> ''
             ORDER BY date DESC, time DESC
             LIMIT 1
         """
@@ -350,6 +414,110 @@ class LessonRepository(BaseRepository):
         result = cursor.fetchone()
         return result['homework'] if result else None
     
+    def get_previous_homework_batch(self, lesson_ids: Optional[List[int]] = None,
+                                    date: Optional[str] = None) -> Dict[int, Optional[str]]:
+        """Holt die Hausaufgaben der jeweils vorherigen Stunde für mehrere Stunden.
+        
+        Entspricht get_previous_homework() für jede Stunde, benötigt aber nur
+        eine Abfrage. Die vorherige Stunde wird pro Stunde über eine
+        korrelierte Unterabfrage auf dem Index (course_id, date, time)
+        bestimmt.
+        
+        Args:
+            lesson_ids: Optional, IDs der Stunden
+            date: Optional, alle Stunden dieses Datums ("YYYY-MM-DD")
+            
+        Returns:
+            Dictionary lesson_id -> Hausaufgaben der vorherigen Stunde oder None
+        """
+        conditions = []
+        params = []
+        if lesson_ids is not None:
+            if not lesson_ids:
+                return {}
+            conditions.append(f"l.id IN ({', '.join('?' * len(lesson_ids))})")
+            params.extend(lesson_ids)
+        if date:
+            conditions.append("l.date = ?")
+            params.append(date)
+        if not conditions:
+            raise ValueError("lesson_ids oder date muss angegeben werden")
+        
+        query = f"""
+            SELECT 
+                l.id,
+                (SELECT p.homework
+                 FROM lessons p
+                 WHERE p.course_id = l.course_id
+                 AND (p.date, p.time) < (l.date, l.time)
+                 AND p.homework IS NOT NULL
+                 AND TRIM(p.homework) <> ''
+                 ORDER BY p.date DESC, p.time DESC, p.id DESC
+                 LIMIT 1) AS previous_homework
+            FROM lessons l
+            WHERE {' OR '.join(conditions)}
+        """
+        cursor = self.execute(query, tuple(params))
+        return {row['id']: row['previous_homework'] for row in cursor.fetchall()}
+    
+    def get_roster(self, lesson_id: int) -> List[Dict[str, Any]]:
+        """Holt die Schülerliste einer Stunde mit Anwesenheit und Bewertung.
+        
+        Eine einzige Abfrage: Schüler des Kurses im aktuellen Halbjahr
+        (Halbjahr aus den Einstellungen, aufgelöst über semester_history),
+        Abwesenheit und die vorhandene Note mit Kommentar zu dieser Stunde.
+        
+        Args:
+            lesson_id: ID der Stunde
+            
+        Returns:
+            Liste von Dictionaries, sortiert nach Nach- und Vorname, mit:
+                - student_id, first_name, last_name
+                - is_absent: bool
+                - assessment_id, assessment_type_id, grade, topic, comment:
+                  Werte der Bewertung oder None
+            Leer, wenn kein aktives Halbjahr existiert oder der Kurs in
+            diesem Halbjahr keine Schüler hat.
+        """
+        query = """
+            WITH current_semester AS (
+                SELECT sh.id
+                FROM settings st
+                JOIN semester_history sh
+                  ON sh.start_date <= st.semester_start
+                 AND sh.end_date >= st.semester_start
+                WHERE st.id = 1
+                ORDER BY sh.start_date DESC
+                LIMIT 1
+            )
+            SELECT 
+                s.id AS student_id,
+                s.first_name,
+                s.last_name,
+                a.id IS NOT NULL AS is_absent,
+                asm.id AS assessment_id,
+                asm.assessment_type_id,
+                asm.grade,
+                asm.topic,
+                asm.comment
+            FROM lessons l
+            JOIN student_courses sc
+              ON sc.course_id = l.course_id
+             AND sc.semester_id = (SELECT id FROM current_semester)
+            JOIN students s ON s.id = sc.student_id
+            LEFT JOIN student_attendance a
+              ON a.lesson_id = l.id AND a.student_id = s.id
+            LEFT JOIN assessments asm
+              ON asm.lesson_id = l.id AND asm.student_id = s.id
+            WHERE l.id = ?
+            ORDER BY s.last_name, s.first_name
+        """
+        cursor = self.execute(query, (lesson_id,))
+        roster = self._dicts_from_rows(cursor.fetchall())
+        for entry in roster:
+            entry['is_absent'] = bool(entry['is_absent'])
+        return roster
+    
     def add_competency(self, lesson_id: int, competency_id: int) -> None:
         """Fügt eine Verknüpfung zwischen Unterrichtsstunde und Kompetenz hinzu.
         
@@ -3,9 +3,11 @@
 from .course.course import Course
 from .student.student import Student
 from .student.remarks import StudentRemark
+from .grading_scale import GradingScale
 
 __all__ = [
     'Course',
     'Student',
-    'StudentRemark'
+    'StudentRemark',
+    'GradingScale'
 ]
\ No newline at end of file
@@ -115,6 +115,10 @@ class Course:
             (self.name, self.type, self.subject, self.description, 
              self.color, self.template_id, self.id)
         )
+        # Name und Farbe erscheinen in den Stunden (z.B. Wochenansicht)
+        db.notify_change('lessons')
+        # Das Template (und damit das Notensystem) kann sich geändert haben
+        db.notify_change('courses')
 
     def delete(self, db) -> None:
         """Löscht den Kurs aus der Datenbank."""
@@ -122,6 +126,9 @@ class Course:
             raise ValueError("Kurs hat keine ID")
             
         db.execute("DELETE FROM courses WHERE id = ?", (self.id,))
+        # ON DELETE CASCADE entfernt auch die Stunden des Kurses
+        db.notify_change('lessons')
+        db.notify_change('courses')
 
     def __str__(self) -> str:
         return f"{self.name} ({self.type})"
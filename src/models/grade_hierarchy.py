@@ -0,0 +1,128 @@
+# src/models/grade_hierarchy.py
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# (Summe Note*Gewicht, Summe Gewicht, Anzahl) der Noten eines Typs
+TypeSums = Tuple[float, float, int]
+
+
+class GradeHierarchy:
+    """Gewichtete Notenberechnung über den Baum der Bewertungstypen eines Kurses.
+
+    Der Baum wird einmal aufbereitet (Kinder je Typ und eine Reihenfolge,
+    in der Untertypen vor ihren Eltern stehen). Danach wird jede
+    Auswertung in einem Durchlauf von den Blättern zur Wurzel berechnet:
+
+    - Die direkten Noten eines Typs ergeben ihren nach Notengewicht
+      gewichteten Durchschnitt.
+    - Ein Typ mit Untertypen mittelt die Durchschnitte seiner Untertypen
+      nach deren Typgewicht. Hat er zusätzlich eigene Noten, zählen diese
+      als weitere Komponente mit Gewicht 1.
+    - Die Endnote ist der nach Typgewicht gewichtete Durchschnitt der
+      Wurzeltypen.
+
+    Typen ohne Noten (auch in ihren Untertypen) bleiben unberücksichtigt.
+    """
+
+    OWN_GRADES_WEIGHT = 1.0  # Gewicht eigener Noten neben Untertypen
+
+    def __init__(self, types: Iterable[Dict[str, Any]]):
+        """Bereitet den Typbaum auf.
+
+        Args:
+            types: Bewertungstypen eines Kurses mit 'id', 'parent_type_id'
+                   und 'weight'
+        """
+        self.types = {t['id']: dict(t) for t in types}
+        self.children: Dict[int, List[int]] = {type_id: [] for type_id in self.types}
+        self.roots: List[int] = []
+
+        for type_id, type_data in self.types.items():
+            parent_id = type_data.get('parent_type_id')
+            if parent_id in self.children:
+                self.children[parent_id].append(type_id)
+            else:
+                self.roots.append(type_id)
+
+        # Untertypen vor ihren Eltern (umgekehrte Breitensuche ab den Wurzeln)
+        order = list(self.roots)
+        for type_id in order:
+            order.extend(self.children[type_id])
+        self.bottom_up = order[::-1]
+
+    @property
+    def ordered_types(self) -> List[Dict[str, Any]]:
+        """Bewertungstypen von den Wurzeln zu den Blättern sortiert."""
+        return [self.types[type_id] for type_id in reversed(self.bottom_up)]
+
+    def evaluate(self, sums: Dict[int, TypeSums]) -> Tuple[Optional[float], Dict[int, float]]:
+        """Berechnet Typdurchschnitte und Endnote für einen Schüler.
+
+        Args:
+            sums: Typ-ID -> (Summe Note*Gewicht, Summe Gewicht, Anzahl)
+                  der direkten Noten dieses Typs
+
+        Returns:
+            Tuple aus Endnote (oder None ohne Noten) und Dictionary
+            Typ-ID -> Durchschnitt für alle Typen mit Noten
+        """
+        averages: Dict[int, float] = {}
+
+        for type_id in self.bottom_up:
+            weighted_sum = 0.0
+            weight_sum = 0.0
+
+            for child_id in self.children[type_id]:
+                child_avg = averages.get(child_id)
+                if child_avg is not None:
+                    child_weight = self.types[child_id]['weight'] or 0.0
+                    weighted_sum += child_avg * child_weight
+                    weight_sum += child_weight
+
+            own = sums.get(type_id)
+            if own and own[1]:
+                own_avg = own[0] / own[1]
+                if weight_sum:
+                    weighted_sum += own_avg * self.OWN_GRADES_WEIGHT
+                    weight_sum += self.OWN_GRADES_WEIGHT
+                else:
+                    weighted_sum, weight_sum = own_avg, 1.0
+
+            if weight_sum > 0:
+                averages[type_id] = weighted_sum / weight_sum
+
+        return self._combine(self.roots, averages), averages
+
+    def _combine(self, type_ids: List[int], averages: Dict[int, float]) -> Optional[float]:
+        weighted_sum = 0.0
+        weight_sum = 0.0
+        for type_id in type_ids:
+            avg = averages.get(type_id)
+            if avg is not None:
+                weight = self.types[type_id]['weight'] or 0.0
+                weighted_sum += avg * weight
+                weight_sum += weight
+        return weighted_sum / weight_sum if weight_sum > 0 else None
+
+    def evaluate_all(self, sums_by_student: Dict[int, Dict[int, TypeSums]]
+                     ) -> Dict[int, Dict[str, Any]]:
+        """Berechnet Endnote und Typdurchschnitte für mehrere Schüler.
+
+        Args:
+            sums_by_student: Schüler-ID -> (Typ-ID -> Notensummen)
+
+        Returns:
+            Schüler-ID -> {'final_grade': float|None,
+                           'type_averages': {Typ-ID: float}},
+            Werte auf zwei Nachkommastellen gerundet
+        """
+        results = {}
+        for student_id, sums in sums_by_student.items():
+            final_grade, averages = self.evaluate(sums)
+            results[student_id] = {
+                'final_grade': round(final_grade, 2) if final_grade is not None else None,
+                'type_averages': {
+                    type_id: round(avg, 2) for type_id, avg in averages.items()
+                }
+            }
+        return results
@@ -0,0 +1,218 @@
+# src/models/grade_statistics.py
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+class GradeStatistics:
+    """Vektorisierte Notenstatistik über beliebig viele Bewertungen.
+
+    Die Noten werden einmal in NumPy-Arrays übernommen (Note, Gewicht,
+    Bewertungstyp, Schüler, Kurs). Kennzahlen, Verteilungen und
+    Aufschlüsselungen nach Typ oder Kurs werden danach ohne Python-Schleifen
+    über die einzelnen Noten berechnet.
+
+    Mittelwert und Standardabweichung werden mit den Notengewichten
+    berechnet, Median und Perzentile ungewichtet. Beste und schlechteste
+    Note richten sich nach der Richtung der Skala (1-6 abwärts, Punkte
+    wie 0-15 aufwärts).
+    """
+
+    PERCENTILES = (10, 25, 50, 75, 90)
+
+    def __init__(self, rows: Iterable[Sequence[float]], higher_is_better: bool = False):
+        """Übernimmt die Noten.
+
+        Args:
+            rows: Zeilen (grade, weight, assessment_type_id, student_id,
+                  course_id), z.B. direkt aus einem Cursor
+            higher_is_better: True bei Punktesystemen (siehe
+                  GradingScale.higher_is_better)
+        """
+        self.higher_is_better = higher_is_better
+        data = np.array(list(rows), dtype=float).reshape(-1, 5)
+        self.grades = data[:, 0]
+        self.weights = np.nan_to_num(data[:, 1], nan=1.0)
+        self.type_ids = data[:, 2].astype(np.int64)
+        self.student_ids = data[:, 3].astype(np.int64)
+        self.course_ids = data[:, 4].astype(np.int64)
+
+    def __len__(self) -> int:
+        return len(self.grades)
+
+    def summary(self) -> Dict[str, Any]:
+        """Berechnet die Kennzahlen über alle Noten.
+
+        Returns:
+            Dictionary mit count, mean, weighted_mean, median, std, best,
+            worst und percentiles ({Perzentil: Wert})
+        """
+        return self._summary(self.grades, self.weights)
+
+    def distribution(self, values: Optional[Sequence[float]] = None) -> Dict[float, int]:
+        """Zählt, wie oft jede Note vergeben wurde.
+
+        Args:
+            values: Optional, alle möglichen Notenwerte (z.B. aus der
+                    GradingScale), damit auch nie vergebene Noten mit 0
+                    erscheinen. Noten werden dem nächsten Wert zugeordnet.
+
+        Returns:
+            Dictionary Notenwert -> Anzahl, aufsteigend sortiert
+        """
+        if values is None:
+            keys, counts = np.unique(np.round(self.grades, 2), return_counts=True)
+            return {float(key): int(count) for key, count in zip(keys, counts)}
+
+        values = np.sort(np.asarray(values, dtype=float))
+        if not len(values):
+            return {}
+        if not len(self.grades):
+            return {float(value): 0 for value in values}
+        if len(values) == 1:
+            nearest = np.zeros(len(self.grades), dtype=np.int64)
+        else:
+            # Index des nächstgelegenen Notenwerts
+            right = np.clip(np.searchsorted(values, self.grades), 1, len(values) - 1)
+            left = right - 1
+            nearest = np.where(
+                self.grades - values[left] <= values[right] - self.grades, left, right
+            )
+        counts = np.bincount(nearest, minlength=len(values))
+        return {float(value): int(count) for value, count in zip(values, counts)}
+
+    def histogram(self, bins=10) -> Dict[str, List[float]]:
+        """Berechnet ein Histogramm der Noten.
+
+        Args:
+            bins: Anzahl der Klassen oder Folge von Klassengrenzen
+
+        Returns:
+            Dictionary mit 'counts' und 'edges'
+        """
+        if not len(self.grades):
+            return {'counts': [], 'edges': []}
+        counts, edges = np.histogram(self.grades, bins=bins)
+        return {'counts': counts.tolist(), 'edges': edges.tolist()}
+
+    def by_type(self) -> Dict[int, Dict[str, Any]]:
+        """Kennzahlen je Bewertungstyp.
+
+        Returns:
+            Typ-ID -> Dictionary wie bei summary() (ohne Perzentile)
+        """
+        return self._grouped(self.type_ids)
+
+    def by_course(self) -> Dict[int, Dict[str, Any]]:
+        """Kennzahlen je Kurs.
+
+        Returns:
+            Kurs-ID -> Dictionary wie bei summary() (ohne Perzentile)
+        """
+        return self._grouped(self.course_ids)
+
+    def by(self, labels: Sequence[Any]) -> Dict[Any, Dict[str, Any]]:
+        """Kennzahlen je beliebiger Gruppierung.
+
+        Args:
+            labels: Gruppe je Note in Reihenfolge der Zeilen (z.B. der
+                    Kompetenzbereich), Zahlen oder Strings
+
+        Returns:
+            Gruppe -> Dictionary wie bei summary() (ohne Perzentile)
+        """
+        labels = np.asarray(labels)
+        if len(labels) != len(self.grades):
+            raise ValueError("Anzahl der Gruppen passt nicht zur Anzahl der Noten")
+        return self._grouped(labels)
+
+    def student_means(self) -> Dict[int, float]:
+        """Gewichteter Notendurchschnitt je Schüler über alle Bewertungen.
+
+        Returns:
+            Schüler-ID -> Durchschnitt
+        """
+        keys, inverse = np.unique(self.student_ids, return_inverse=True)
+        weight_sums = np.bincount(inverse, weights=self.weights)
+        weighted = np.bincount(inverse, weights=self.grades * self.weights)
+        means = np.divide(weighted, weight_sums,
+                          out=np.full(len(keys), np.nan), where=weight_sums > 0)
+        return {int(key): self._float(mean) for key, mean in zip(keys, means)}
+
+    # Hilfsfunktionen
+
+    @staticmethod
+    def _float(value) -> Optional[float]:
+        return None if np.isnan(value) else round(float(value), 2)
+
+    def _summary(self, grades: np.ndarray, weights: np.ndarray) -> Dict[str, Any]:
+        if not len(grades):
+            return {
+                'count': 0, 'mean': None, 'weighted_mean': None, 'median': None,
+                'std': None, 'best': None, 'worst': None,
+                'percentiles': {p: None for p in self.PERCENTILES}
+            }
+
+        weight_sum = weights.sum()
+        weighted_mean = (grades * weights).sum() / weight_sum if weight_sum > 0 else np.nan
+        variance = (
+            (weights * (grades - weighted_mean) ** 2).sum() / weight_sum
+            if weight_sum > 0 else np.nan
+        )
+        percentiles = np.percentile(grades, self.PERCENTILES)
+        return {
+            'count': int(len(grades)),
+            'mean': self._float(grades.mean()),
+            'weighted_mean': self._float(weighted_mean),
+            'median': self._float(np.median(grades)),
+            'std': self._float(np.sqrt(variance)),
+            'best': self._float(grades.max() if self.higher_is_better else grades.min()),
+            'worst': self._float(grades.min() if self.higher_is_better else grades.max()),
+            'percentiles': {
+                p: self._float(value) for p, value in zip(self.PERCENTILES, percentiles)
+            }
+        }
+
+    def _grouped(self, keys: np.ndarray) -> Dict[Any, Dict[str, Any]]:
+        """Berechnet die Kennzahlen je Gruppe in einem Durchlauf."""
+        if not len(keys):
+            return {}
+
+        groups, inverse = np.unique(keys, return_inverse=True)
+        grades, weights = self.grades, self.weights
+
+        counts = np.bincount(inverse)
+        weight_sums = np.bincount(inverse, weights=weights)
+        means = np.bincount(inverse, weights=grades) / counts
+        weighted_means = np.divide(
+            np.bincount(inverse, weights=grades * weights), weight_sums,
+            out=np.full(len(groups), np.nan), where=weight_sums > 0
+        )
+        variances = np.divide(
+            np.bincount(inverse, weights=weights * (grades - weighted_means[inverse]) ** 2),
+            weight_sums, out=np.full(len(groups), np.nan), where=weight_sums > 0
+        )
+        lowest = np.full(len(groups), np.inf)
+        np.minimum.at(lowest, inverse, grades)
+        highest = np.full(len(groups), -np.inf)
+        np.maximum.at(highest, inverse, grades)
+        best, worst = (highest, lowest) if self.higher_is_better else (lowest, highest)
+
+        # Median: nach Gruppe und Note sortieren, dann die Mitte jeder Gruppe
+        ordered = grades[np.lexsort((grades, inverse))]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        medians = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+
+        return {
+            group.item(): {
+                'count': int(counts[i]),
+                'mean': self._float(means[i]),
+                'weighted_mean': self._float(weighted_means[i]),
+                'median': self._float(medians[i]),
+                'std': self._float(np.sqrt(variances[i])),
+                'best': self._float(best[i]),
+                'worst': self._float(worst[i])
+            }
+            for i, group in enumerate(groups)
+        }
@@ -0,0 +1,149 @@
+# src/models/grading_scale.py
+
+import math
+from typing import Any, Dict, List, Optional
+
+
+class GradingScale:
+    """Vorberechnete Notenskala eines Notensystems.
+
+    Beim Erzeugen werden alle Schritte des Notensystems einmal durchlaufen
+    und in Tabellen abgelegt: Anzeige-String -> Zahl und Zahl -> Anzeige-String.
+    Umrechnen und Prüfen einzelner Noten sind danach reine Dictionary-Zugriffe.
+
+    Notensysteme mit Schrittweite <= 0.4 werden mit +/- angezeigt
+    ("2+" = 1.7, "2" = 2.0, "2-" = 2.3), alle anderen mit ihrem Zahlenwert.
+
+    Notensysteme bis 6 (1-6) zählen abwärts, 1 ist die beste Note;
+    Punktesysteme darüber (z.B. Oberstufe 0-15) zählen aufwärts.
+    """
+
+    PLUS_MINUS_MAX_STEP = 0.4   # Bis zu dieser Schrittweite +/- Notation
+    MODIFIER = 0.3              # Abstand von "2+"/"2-" zur glatten Note
+    PRECISION = 2               # Nachkommastellen der Lookup-Schlüssel
+    GRADE_MAX = 6.0             # Höchstwert klassischer Noten (sonst Punkte)
+
+    def __init__(self, system: Dict[str, Any]):
+        """Berechnet die Skala für ein Notensystem.
+
+        Args:
+            system: Dictionary mit 'id', 'name', 'min_grade', 'max_grade'
+                    und 'step_size' (Zeile aus grading_systems)
+        """
+        self.system_id = system.get('id')
+        self.name = system.get('name', '')
+        self.min_grade = float(system['min_grade'])
+        self.max_grade = float(system['max_grade'])
+        self.step_size = float(system['step_size'])
+        self.plus_minus = self.step_size <= self.PLUS_MINUS_MAX_STEP
+        self.higher_is_better = self.max_grade > self.GRADE_MAX
+
+        self.grades = []        # Anzeige-Strings in Reihenfolge der Skala
+        self.values = []        # Zugehörige Zahlenwerte
+        self._value_of = {}     # Anzeige-String -> Zahl
+        self._grade_of = {}     # gerundete Zahl -> Anzeige-String
+        self._valid = set()     # gerundete Zahlen, die als gültig gelten
+
+        # Ganzzahlige Schritte statt aufaddierter Fließkommawerte
+        steps = int(math.floor((self.max_grade - self.min_grade) / self.step_size + 1e-9))
+        for i in range(steps + 1):
+            raw = round(self.min_grade + i * self.step_size, self.PRECISION)
+            self._valid.add(raw)
+
+            grade = self._classify(raw)
+            if grade in self._value_of:
+                continue
+            value = self._parse(grade)
+            self.grades.append(grade)
+            self.values.append(value)
+            self._value_of[grade] = value
+            self._grade_of[self._key(value)] = grade
+            self._valid.add(self._key(value))
+
+    def __repr__(self) -> str:
+        return f"GradingScale({self.name!r}, {len(self.grades)} Noten)"
+
+    @classmethod
+    def _key(cls, number: float) -> float:
+        return round(number, cls.PRECISION)
+
+    def _classify(self, number: float) -> str:
+        """Ordnet eine Zahl dem nächsten Anzeige-String zu."""
+        if not self.plus_minus:
+            return f"{number:g}"
+
+        base = math.floor(number)
+        decimal = round(number - base, self.PRECISION)
+        if decimal < 0.15:  # Zur glatten Note
+            return str(base)
+        elif decimal < 0.5:  # Zur Minus-Note (z.B. 1.3 -> "1-")
+            return f"{base}-"
+        elif decimal < 0.85:  # Zur Plus-Note der nächsten Stufe (z.B. 1.7 -> "2+")
+            return f"{base+1}+"
+        else:  # Zur nächsten glatten Note
+            return str(base + 1)
+
+    def _parse(self, grade: str) -> Optional[float]:
+        """Wandelt einen Anzeige-String ohne Tabelle in eine Zahl um."""
+        try:
+            if len(grade) > 1 and grade[-1] in ('+', '-'):
+                base = float(grade[:-1])
+                offset = -self.MODIFIER if grade[-1] == '+' else self.MODIFIER
+                return self._key(base + offset)
+            return float(grade)
+        except ValueError:
+            return None
+
+    def to_number(self, grade: str) -> Optional[float]:
+        """Wandelt eine angezeigte Note in ihren Zahlenwert um.
+
+        Args:
+            grade: Note als Anzeige-String (z.B. "2+")
+
+        Returns:
+            Zahlenwert oder None bei leerer/ungültiger Eingabe
+        """
+        if not grade or not grade.strip():
+            return None
+        grade = grade.strip()
+        value = self._value_of.get(grade)
+        return value if value is not None else self._parse(grade)
+
+    def to_text(self, number: Optional[float]) -> str:
+        """Wandelt einen Zahlenwert in die anzuzeigende Note um.
+
+        Werte außerhalb der Skala werden auf die nächste Note abgebildet.
+
+        Args:
+            number: Zahlenwert der Note
+
+        Returns:
+            Anzeige-String, leer bei None
+        """
+        if number is None:
+            return ""
+        grade = self._grade_of.get(self._key(number))
+        return grade if grade is not None else self._classify(number)
+
+    def is_valid(self, number: float) -> bool:
+        """Prüft ob ein Zahlenwert eine gültige Note der Skala ist.
+
+        Gültig sind die Schritte des Notensystems und die Zahlenwerte
+        der angezeigten Noten (z.B. 1.7 für "2+").
+
+        Args:
+            number: Zu prüfender Zahlenwert
+
+        Returns:
+            True wenn die Note gültig ist, sonst False
+        """
+        return self._key(number) in self._valid
+
+    def to_texts(self, numbers: List[Optional[float]]) -> List[str]:
+        """Wandelt mehrere Zahlenwerte auf einmal in Anzeige-Strings um."""
+        grade_of = self._grade_of
+        return [
+            "" if number is None
+            else grade_of.get(self._key(number)) or self._classify(number)
+            for number in numbers
+        ]
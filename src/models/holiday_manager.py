@@ -1,9 +1,17 @@
-import requests
+import os
+import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
 
+from .http_cache import HttpCache
+from .public_holidays import public_holidays
+
+# (Datum, Name, Typ) eines geladenen Ferien-/Feiertags
+HolidayRecord = Tuple[str, str, str]
+
 class HolidayAPIError(Exception):
     """Basisklasse für API-bezogene Fehler"""
     pass
@@ -20,64 +28,153 @@ class HolidayManager:
     FERIEN_API_URL = "https://ferien-api.de/api/v1/holidays/"
     FEIERTAGE_API_URL = "https://feiertage-api.de/api/"
     TIMEOUT = 10  # Timeout in Sekunden
+    CACHE_DIR = "http_cache"  # Neben der Datenbankdatei
+    # Berechnete Feiertage zusätzlich mit der Feiertage-API abgleichen
+    CROSS_CHECK_PUBLIC_HOLIDAYS = False
     
-    def __init__(self, db, state: str = "NW"):
+    def __init__(self, db, state: str = "NW", cache: Optional[HttpCache] = None):
         self.db = db
         self.state = state
         self.logger = logging.getLogger(__name__)
+        if cache is None:
+            db_dir = os.path.dirname(os.path.abspath(db.db_file))
+            cache = HttpCache(os.path.join(db_dir, self.CACHE_DIR))
+        self.cache = cache
         
     def update_all(self, year: int) -> None:
         """
         Aktualisiert sowohl Ferien als auch Feiertage für das angegebene Jahr.
         
-        Raises:
-            HolidayAPIError: Wenn beide APIs nicht erreichbar sind
-            HolidayDataError: Wenn bei beiden APIs Datenfehler auftreten
+        Die Feiertage stehen immer zur Verfügung; ist die Ferien-API nicht
+        erreichbar, bleiben die bisherigen Ferientage erhalten.
+        """
+        self.store_year(year, self.fetch_year(year))
+
+    def fetch_year(self, year: int) -> Dict[str, Any]:
         """
+        Stellt Ferien und Feiertage eines Jahres zusammen, ohne die
+        Datenbank zu berühren.
+        
+        Feiertage werden lokal berechnet, nur die Ferien kommen aus der
+        Ferien-API. Darf daher in einem Hintergrund-Thread aufgerufen werden.
+        
+        Returns:
+            Dictionary mit 'days' (Liste von (Datum, Name, Typ)), 'types'
+            (vollständig geladene Typen) und 'errors' (Liste von
+            (Quelle, Fehlermeldung))
+        """
+        days: List[HolidayRecord] = self.calculate_public_holidays(year)
+        types = ['holiday']
         errors = []
         
         try:
-            self.db.holidays.clear_public_by_year(year, self.state)
-            
-            # Versuche beide APIs zu aktualisieren
-            try:
-                self.update_vacation_days(year)
-            except Exception as e:
-                self.logger.error(f"Fehler bei Ferien-Update: {str(e)}")
-                errors.append(("Ferien", e))
-                
+            days.extend(self.fetch_vacation_days(year))
+            types.append('vacation_day')
+        except Exception as e:
+            self.logger.error(f"Fehler bei Ferien-Update: {str(e)}")
+            errors.append(("Ferien", str(e)))
+
+        if self.CROSS_CHECK_PUBLIC_HOLIDAYS:
             try:
-                self.update_public_holidays(year)
-            except Exception as e:
-                self.logger.error(f"Fehler bei Feiertage-Update: {str(e)}")
-                errors.append(("Feiertage", e))
+                self.cross_check_public_holidays(year)
+            except HolidayAPIError as e:
+                self.logger.warning(f"Abgleich mit Feiertage-API nicht möglich: {str(e)}")
+        
+        return {'days': days, 'types': types, 'errors': errors}
+
+    def calculate_public_holidays(self, year: int) -> List[HolidayRecord]:
+        """
+        Berechnet die gesetzlichen Feiertage des Bundeslandes (ohne Netzwerk).
+        
+        Returns:
+            Liste von (Datum, Name, 'holiday')
+        """
+        return [(date, name, 'holiday') for date, name in public_holidays(year, self.state)]
+
+    def cross_check_public_holidays(self, year: int) -> Dict[str, List[HolidayRecord]]:
+        """
+        Vergleicht die berechneten Feiertage mit der Feiertage-API.
+        
+        Abweichungen werden als Warnung protokolliert.
+        
+        Returns:
+            Dictionary mit 'missing' (nur in der API) und 'extra' (nur
+            berechnet)
+        
+        Raises:
+            HolidayAPIError: Wenn die API nicht erreichbar ist
+        """
+        calculated = set(self.calculate_public_holidays(year))
+        fetched = set(self.fetch_public_holidays(year))
+        result = {
+            'missing': sorted(fetched - calculated),
+            'extra': sorted(calculated - fetched)
+        }
+        if result['missing'] or result['extra']:
+            self.logger.warning(
+                f"Feiertage {year}/{self.state} weichen von der API ab: "
+                f"fehlend {result['missing']}, zusätzlich {result['extra']}"
+            )
+        return result
+
+    def store_year(self, year: int, fetched: Dict[str, Any]) -> None:
+        """
+        Ersetzt die Ferien/Feiertage eines Jahres durch die geladenen Daten.
+        
+        Das Jahr gilt erst als geladen, wenn auch die Ferien geladen werden
+        konnten; andernfalls wird es beim nächsten Start erneut abgefragt.
+        
+        Args:
+            year: Jahr
+            fetched: Ergebnis von fetch_year()
+        """
+        try:
+            # Eine Transaktion: Leser sehen entweder das alte oder das
+            # neue Jahr, nie ein halb gelöschtes
+            with self.db.transaction():
+                # Nur vollständig geladene Typen ersetzen: fehlt die Ferien-API,
+                # bleiben die bisherigen Ferientage erhalten
+                for type in fetched['types']:
+                    self.db.holidays.clear_public_by_year(year, self.state, type)
+                self.db.holidays.add_public_many(
+                    (date, name, type, self.state, year)
+                    for date, name, type in fetched['days']
+                )
                 
-            # Wenn beide Updates fehlgeschlagen sind
-            if len(errors) == 2:
-                error_msg = "\n".join([f"{src}: {str(err)}" for src, err in errors])
-                raise HolidayAPIError(f"Beide APIs nicht erreichbar:\n{error_msg}")
+                if fetched['errors']:
+                    self.db.holidays.clear_coverage(year, self.state)
+                else:
+                    self.db.holidays.mark_loaded(year, self.state)
 
-            self.db.holidays.update_lesson_status_for_holidays()
+                # Nur den Zeitraum der neu geladenen Tage prüfen (Ferien können
+                # über den Jahreswechsel hinausreichen)
+                loaded = self.db.holidays.get_public_by_year(year, self.state)
+                if loaded:
+                    self.db.holidays.update_lesson_status_for_holidays(
+                        start_date=loaded[0]['date'],
+                        end_date=loaded[-1]['date']
+                    )
                 
         except Exception as e:
             self.logger.error(f"Kritischer Fehler beim Update: {str(e)}")
             raise
         
-    def update_vacation_days(self, year: int) -> None:
+    def fetch_vacation_days(self, year: int) -> List[HolidayRecord]:
         """
-        Holt Ferientage von der Ferien-API.
+        Holt Ferientage von der Ferien-API (über den HTTP-Cache).
+        
+        Returns:
+            Liste von (Datum, Name, 'vacation_day')
         
         Raises:
             HolidayConnectionError: Bei Verbindungsproblemen
             HolidayDataError: Bei Problemen mit den empfangenen Daten
         """
+        days: List[HolidayRecord] = []
         try:
             url = f"{self.FERIEN_API_URL}{self.state}/{year}"
-            response = requests.get(url, timeout=self.TIMEOUT)
-            response.raise_for_status()
-            
             try:
-                vacations = response.json()
+                vacations = self.cache.get_json(url, timeout=self.TIMEOUT)
             except ValueError as e:
                 raise HolidayDataError(f"Ungültige JSON-Daten von Ferien-API: {str(e)}")
             
@@ -96,19 +193,15 @@ class HolidayManager:
                         
                     current_date = start_date
                     while current_date <= end_date:
-                        self.db.holidays.add_public(
-                            date=current_date.strftime("%Y-%m-%d"),
-                            name=name,
-                            type='vacation_day',
-                            state=self.state,
-                            year=year
-                        )
+                        days.append((current_date.strftime("%Y-%m-%d"), name, 'vacation_day'))
                         current_date += timedelta(days=1)
                         
                 except KeyError as e:
                     self.logger.warning(f"Fehlende Ferien-Daten: {str(e)}")
                 except ValueError as e:
                     self.logger.warning(f"Ungültiges Datum in Ferien-Daten: {str(e)}")
+            
+            return days
                     
         except Timeout:
             raise HolidayConnectionError("Zeitüberschreitung bei Ferien-API")
@@ -119,28 +212,32 @@ class HolidayManager:
         except RequestException as e:
             raise HolidayConnectionError(f"Fehler bei Ferien-API-Anfrage: {str(e)}")
             
-    def update_public_holidays(self, year: int) -> None:
+    def fetch_public_holidays(self, year: int) -> List[HolidayRecord]:
         """
-        Holt Feiertage von der Feiertage-API.
+        Holt Feiertage von der Feiertage-API (über den HTTP-Cache).
+        
+        Nur noch für cross_check_public_holidays(); die verwendeten
+        Feiertage werden mit calculate_public_holidays() berechnet.
+        
+        Returns:
+            Liste von (Datum, Name, 'holiday')
         
         Raises:
             HolidayConnectionError: Bei Verbindungsproblemen
             HolidayDataError: Bei Problemen mit den empfangenen Daten
         """
+        days: List[HolidayRecord] = []
         try:
             params = {
                 'jahr': year,
                 'nur_land': self.state
             }
-            response = requests.get(
-                self.FEIERTAGE_API_URL, 
-                params=params,
-                timeout=self.TIMEOUT
-            )
-            response.raise_for_status()
-            
             try:
-                holidays = response.json()
+                holidays = self.cache.get_json(
+                    self.FEIERTAGE_API_URL, 
+                    params=params,
+                    timeout=self.TIMEOUT
+                )
             except ValueError as e:
                 raise HolidayDataError(f"Ungültige JSON-Daten von Feiertage-API: {str(e)}")
             
@@ -153,16 +250,12 @@ class HolidayManager:
                         self.logger.warning(f"Feiertag ohne Datum: {name}")
                         continue
                         
-                    self.db.holidays.add_public(
-                        date=data['datum'],
-                        name=name,
-                        type='holiday',
-                        state=self.state,
-                        year=year
-                    )
+                    days.append((data['datum'], name, 'holiday'))
                     
                 except KeyError as e:
                     self.logger.warning(f"Fehlende Feiertags-Daten: {str(e)}")
+            
+            return days
                     
         except Timeout:
             raise HolidayConnectionError("Zeitüberschreitung bei Feiertage-API")
@@ -181,47 +274,93 @@ class HolidayManager:
             week_end.strftime("%Y-%m-%d")
         )
 
-        # In holiday_manager.py ergänzen:
+    def missing_years(self, current_year: Optional[int] = None) -> List[int]:
+        """
+        Ermittelt, welche Jahre (aktuelles und nächstes) noch fehlen.
+        
+        Args:
+            current_year: Optional das Jahr, für das geprüft werden soll.
+                        Wenn None, wird das aktuelle Jahr verwendet.
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+        loaded_years = self._get_loaded_years()
+        return [year for year in (current_year, current_year + 1)
+                if year not in loaded_years]
 
     def initialize_holidays(self, current_year: Optional[int] = None) -> None:
         """
         Initialisiert die Feiertage/Ferien für das aktuelle und nächste Jahr,
-        falls sie noch nicht geladen wurden.
+        falls sie noch nicht geladen wurden (blockierend).
         
         Args:
             current_year: Optional das Jahr, für das initialisiert werden soll.
                         Wenn None, wird das aktuelle Jahr verwendet.
         """
-        try:
-            if current_year is None:
-                current_year = datetime.now().year
-                
-            # Prüfe welche Jahre bereits geladen sind
-            loaded_years = self._get_loaded_years()
+        for year in self.missing_years(current_year):
+            try:
+                self.update_all(year)
+            except HolidayAPIError as e:
+                self.logger.error(f"Fehler beim Initialisieren der Feiertage: {str(e)}")
+                # Wir lassen den Fehler nicht nach oben propagieren, 
+                # da fehlende Feiertage nicht kritisch sind
+
+    def start_background_sync(self, current_year: Optional[int] = None) -> Optional[Future]:
+        """
+        Lädt fehlende Jahre in einem Hintergrund-Thread.
+        
+        Der Thread greift nur auf das Netz bzw. den HTTP-Cache zu. Die
+        Ergebnisse müssen anschließend im Thread der Datenbankverbindung
+        mit store_fetched() gespeichert werden.
+        
+        Args:
+            current_year: Optional das Jahr, ab dem geprüft wird
             
-            # Lade aktuelles Jahr falls nötig
-            if current_year not in loaded_years:
-                self.update_all(current_year)
-                
-            # Lade nächstes Jahr falls nötig
-            next_year = current_year + 1
-            if next_year not in loaded_years:
-                self.update_all(next_year)
-                
-        except HolidayAPIError as e:
-            self.logger.error(f"Fehler beim Initialisieren der Feiertage: {str(e)}")
-            # Wir lassen den Fehler nicht nach oben propagieren, 
-            # da fehlende Feiertage nicht kritisch sind
+        Returns:
+            Future mit {Jahr: Ergebnis von fetch_year()} oder None, wenn
+            bereits alle Jahre geladen sind
+        """
+        years = self.missing_years(current_year)
+        if not years:
+            return None
+
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                self.cache.reset_unreachable()
+                results = {}
+                for year in years:
+                    try:
+                        results[year] = self.fetch_year(year)
+                    except HolidayAPIError as e:
+                        self.logger.error(f"Fehler beim Laden der Feiertage {year}: {str(e)}")
+            except Exception as e:
+                # Sonst bliebe das Future für immer offen
+                future.set_exception(e)
+                return
+            future.set_result(results)
+
+        # Daemon-Thread: ein hängender Request verzögert das Beenden nicht
+        threading.Thread(target=run, name='holiday-sync', daemon=True).start()
+        return future
+
+    def store_fetched(self, results: Dict[int, Dict[str, Any]]) -> None:
+        """
+        Speichert die Ergebnisse von start_background_sync().
+        
+        Args:
+            results: Jahr -> Ergebnis von fetch_year()
+        """
+        for year, fetched in sorted(results.items()):
+            self.store_year(year, fetched)
             
     def _get_loaded_years(self) -> List[int]:
-        """Ermittelt welche Jahre bereits in der Datenbank sind."""
+        """Ermittelt welche Jahre bereits vollständig geladen sind."""
         try:
-            loaded_holidays = self.db.holidays.get_public_by_year(
-                year=datetime.now().year,
-                state=self.state
-            )
-            # Extrahiere die Jahre aus den geladenen Feiertagen
-            return list(set(h['year'] for h in loaded_holidays))
+            return self.db.holidays.get_loaded_years(self.state)
         except Exception as e:
             self.logger.error(f"Fehler beim Prüfen der geladenen Jahre: {str(e)}")
-            return []
\ No newline at end of file
+            return []
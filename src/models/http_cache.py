@@ -0,0 +1,142 @@
+# src/models/http_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.exceptions import ConnectionError, RequestException, Timeout
+
+
+class HttpCache:
+    """Persistenter Cache für JSON-Antworten von HTTP-APIs.
+
+    Jede Antwort wird als eigene Datei im Cache-Verzeichnis abgelegt, samt
+    ETag, Last-Modified und Ablaufzeitpunkt. Solange ein Eintrag gültig ist,
+    wird kein Request gestellt. Abgelaufene Einträge werden mit
+    If-None-Match/If-Modified-Since erneuert (304 = unverändert).
+
+    Ist ein Server nicht erreichbar, wird ein vorhandener (auch
+    abgelaufener) Eintrag zurückgegeben. Weitere Requests an denselben
+    Host schlagen danach sofort fehl, statt erneut auf den Timeout zu
+    warten (bis reset_unreachable()).
+    """
+
+    DEFAULT_MAX_AGE = 7 * 24 * 3600  # Gültigkeit ohne Cache-Control-Angabe (Sekunden)
+    CONNECT_TIMEOUT = 3.05           # Verbindungsaufbau (Sekunden)
+
+    def __init__(self, directory: str, max_age: int = DEFAULT_MAX_AGE):
+        """
+        Args:
+            directory: Cache-Verzeichnis (wird bei Bedarf angelegt)
+            max_age: Gültigkeit in Sekunden, wenn der Server keine angibt
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self.logger = logging.getLogger(__name__)
+        self._unreachable = set()  # Hosts ohne Verbindung in dieser Sitzung
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None,
+                 timeout: float = 10) -> Any:
+        """Holt eine JSON-Antwort, wenn möglich aus dem Cache.
+
+        Args:
+            url: Adresse der API
+            params: Optional, Query-Parameter
+            timeout: Lese-Timeout in Sekunden
+
+        Returns:
+            Dekodierte JSON-Antwort
+
+        Raises:
+            requests.exceptions.RequestException: Bei Verbindungs- oder
+                HTTP-Fehlern, wenn kein Cache-Eintrag vorhanden ist
+            ValueError: Bei ungültigem JSON
+        """
+        path = self._path(url, params)
+        entry = self._load(path)
+        if entry is not None and entry['expires'] > time.time():
+            return entry['body']
+
+        host = urlsplit(url).netloc
+        try:
+            if host in self._unreachable:
+                raise ConnectionError(f"{host} ist in dieser Sitzung nicht erreichbar")
+
+            headers = {}
+            if entry is not None:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+            try:
+                response = requests.get(
+                    url, params=params, headers=headers,
+                    timeout=(min(self.CONNECT_TIMEOUT, timeout), timeout)
+                )
+            except (ConnectionError, Timeout):
+                self._unreachable.add(host)
+                raise
+
+            if response.status_code == 304 and entry is not None:
+                entry['expires'] = self._expires(response)
+                self._save(path, entry)
+                return entry['body']
+
+            response.raise_for_status()
+        except RequestException as e:
+            if entry is None:
+                raise
+            self.logger.warning(f"Verwende veraltete Daten für {url}: {str(e)}")
+            return entry['body']
+
+        body = response.json()
+        self._save(path, {
+            'url': response.url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'expires': self._expires(response),
+            'body': body
+        })
+        return body
+
+    def reset_unreachable(self) -> None:
+        """Erlaubt wieder Requests an zuvor nicht erreichbare Hosts."""
+        self._unreachable.clear()
+
+    # Hilfsfunktionen
+
+    def _path(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        key = url + ('?' + urlencode(sorted(params.items())) if params else '')
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def _expires(self, response) -> float:
+        """Ablaufzeitpunkt aus Cache-Control: max-age oder der Standardwert."""
+        match = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+        max_age = int(match.group(1)) if match else self.max_age
+        return time.time() + max(max_age, 0)
+
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if 'body' in entry and 'expires' in entry else None
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, path: str, entry: Dict[str, Any]) -> None:
+        """Schreibt einen Eintrag atomar (erst temporäre Datei, dann ersetzen)."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Ohne Cache funktioniert alles weiter, nur langsamer
+            self.logger.warning(f"Cache-Eintrag konnte nicht geschrieben werden: {str(e)}")
@@ -0,0 +1,146 @@
+# src/models/public_holidays.py
+
+"""
+Offline-Berechnung der gesetzlichen Feiertage in Deutschland.
+
+Alle Feiertage ergeben sich aus festen Daten oder ihrem Abstand zum
+Ostersonntag (Gaußsche Osterformel, gregorianischer Kalender). Welche
+Feiertage in einem Bundesland gelten, steht in der Regeltabelle RULES.
+Nur landesweit geltende Feiertage werden berücksichtigt, regionale
+(z.B. Mariä Himmelfahrt in katholischen Gemeinden Bayerns) nicht.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, NamedTuple, Optional, Tuple
+
+STATES = frozenset({
+    'BW', 'BY', 'BE', 'BB', 'HB', 'HH', 'HE', 'MV',
+    'NI', 'NW', 'RP', 'SL', 'SN', 'ST', 'SH', 'TH'
+})
+
+
+def easter_sunday(year: int) -> date:
+    """Berechnet den Ostersonntag (anonymer gregorianischer Algorithmus).
+
+    Args:
+        year: Jahr (ab 1583)
+
+    Returns:
+        Datum des Ostersonntags
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _fixed(month: int, day: int) -> Callable[[int, date], date]:
+    return lambda year, easter: date(year, month, day)
+
+
+def _easter(offset: int) -> Callable[[int, date], date]:
+    return lambda year, easter: easter + timedelta(days=offset)
+
+
+def _repentance_day(year: int, easter: date) -> date:
+    """Buß- und Bettag: der letzte Mittwoch vor dem 23. November."""
+    nov_22 = date(year, 11, 22)
+    return nov_22 - timedelta(days=(nov_22.weekday() - 2) % 7)
+
+
+class Rule(NamedTuple):
+    """Ein Feiertag mit Geltungsbereich."""
+    name: str
+    when: Callable[[int, date], date]
+    states: Optional[FrozenSet[str]] = None  # None = bundesweit
+    since: int = 0                           # Erstes Jahr
+    until: int = 9999                        # Letztes Jahr
+
+
+def _states(*codes: str) -> FrozenSet[str]:
+    return frozenset(codes)
+
+
+# Namen wie bei feiertage-api.de, damit der Abgleich per Namen möglich ist
+RULES: Tuple[Rule, ...] = (
+    Rule("Neujahrstag", _fixed(1, 1)),
+    Rule("Heilige Drei Könige", _fixed(1, 6), _states('BW', 'BY', 'ST')),
+    Rule("Frauentag", _fixed(3, 8), _states('BE'), since=2019),
+    Rule("Frauentag", _fixed(3, 8), _states('MV'), since=2023),
+    Rule("Karfreitag", _easter(-2)),
+    Rule("Ostersonntag", _easter(0), _states('BB')),
+    Rule("Ostermontag", _easter(1)),
+    Rule("Tag der Arbeit", _fixed(5, 1)),
+    Rule("Tag der Befreiung", _fixed(5, 8), _states('BE'), since=2020, until=2020),
+    Rule("Tag der Befreiung", _fixed(5, 8), _states('BE'), since=2025, until=2025),
+    Rule("Christi Himmelfahrt", _easter(39)),
+    Rule("Pfingstsonntag", _easter(49), _states('BB')),
+    Rule("Pfingstmontag", _easter(50)),
+    Rule("Fronleichnam", _easter(60), _states('BW', 'BY', 'HE', 'NW', 'RP', 'SL')),
+    Rule("Mariä Himmelfahrt", _fixed(8, 15), _states('SL')),
+    Rule("Weltkindertag", _fixed(9, 20), _states('TH'), since=2019),
+    Rule("Tag der Deutschen Einheit", _fixed(10, 3)),
+    Rule("Reformationstag", _fixed(10, 31), since=2017, until=2017),
+    Rule("Reformationstag", _fixed(10, 31),
+         _states('BB', 'MV', 'SN', 'ST', 'TH'), until=2016),
+    Rule("Reformationstag", _fixed(10, 31),
+         _states('BB', 'MV', 'SN', 'ST', 'TH', 'HB', 'HH', 'NI', 'SH'), since=2018),
+    Rule("Allerheiligen", _fixed(11, 1), _states('BW', 'BY', 'NW', 'RP', 'SL')),
+    Rule("Buß- und Bettag", _repentance_day, _states('SN')),
+    Rule("1. Weihnachtstag", _fixed(12, 25)),
+    Rule("2. Weihnachtstag", _fixed(12, 26)),
+)
+
+
+@lru_cache(maxsize=256)
+def public_holidays(year: int, state: str) -> Tuple[Tuple[str, str], ...]:
+    """Berechnet die gesetzlichen Feiertage eines Bundeslandes.
+
+    Args:
+        year: Jahr
+        state: Kürzel des Bundeslandes (z.B. "NW")
+
+    Returns:
+        Tuple von (Datum "YYYY-MM-DD", Name), nach Datum sortiert
+
+    Raises:
+        ValueError: Bei unbekanntem Bundesland
+    """
+    if state not in STATES:
+        raise ValueError(f"Unbekanntes Bundesland: {state}")
+
+    easter = easter_sunday(year)
+    holidays = [
+        (rule.when(year, easter).isoformat(), rule.name)
+        for rule in RULES
+        if rule.since <= year <= rule.until
+        and (rule.states is None or state in rule.states)
+    ]
+    return tuple(sorted(holidays))
+
+
+def public_holidays_between(start_year: int, end_year: int,
+                            state: str) -> List[Tuple[str, str]]:
+    """Berechnet die Feiertage mehrerer Jahre.
+
+    Args:
+        start_year: Erstes Jahr
+        end_year: Letztes Jahr (einschließlich)
+        state: Kürzel des Bundeslandes
+
+    Returns:
+        Liste von (Datum "YYYY-MM-DD", Name), nach Datum sortiert
+    """
+    return [
+        holiday
+        for year in range(start_year, end_year + 1)
+        for holiday in public_holidays(year, state)
+    ]
@@ -0,0 +1,87 @@
+# src/views/async_loader.py
+
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+
+class AsyncLoader(QObject):
+    """Bringt Ergebnisse des ReadWorker zurück in den GUI-Thread.
+
+    Pro Schlüssel zählt nur die zuletzt gestartete Anfrage: Ergebnisse
+    überholter oder abgebrochener Anfragen werden verworfen, sodass ein
+    Widget nie mit veralteten Daten gefüllt wird.
+    """
+
+    loaded = pyqtSignal(str, object)    # Schlüssel, Ergebnis
+    failed = pyqtSignal(str, str)       # Schlüssel, Fehlermeldung
+    _done = pyqtSignal(str, object)     # intern: Future aus dem Worker-Thread
+
+    def __init__(self, worker, parent=None):
+        """
+        Args:
+            worker: ReadWorker, der die Abfragen ausführt
+            parent: Optional, Qt-Elternobjekt
+        """
+        super().__init__(parent)
+        self.worker = worker
+        self._pending: Dict[str, tuple] = {}  # Schlüssel -> (Future, on_done, on_error)
+        self._done.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def load(self, key: str, func: Callable[..., Any], *args,
+             on_done: Optional[Callable[[Any], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> Future:
+        """Startet eine Abfrage im Hintergrund.
+
+        Args:
+            key: Schlüssel der Anfrage (z.B. 'course_grades'); eine offene
+                 Anfrage mit demselben Schlüssel wird abgebrochen
+            func: Wird im Worker als func(controllers, *args) aufgerufen
+            on_done: Optional, wird im GUI-Thread mit dem Ergebnis aufgerufen
+            on_error: Optional, wird im GUI-Thread mit der Exception aufgerufen
+
+        Returns:
+            Future der Anfrage
+        """
+        future = self.worker.submit(func, *args, key=key)
+        return self.watch(key, future, on_done=on_done, on_error=on_error)
+
+    def watch(self, key: str, future: Future,
+              on_done: Optional[Callable[[Any], None]] = None,
+              on_error: Optional[Callable[[Exception], None]] = None) -> Future:
+        """Liefert das Ergebnis eines beliebigen Futures im GUI-Thread.
+
+        Für Hintergrundarbeit außerhalb des ReadWorker (z.B. Netzwerk).
+        Argumente wie bei load().
+        """
+        self._pending[key] = (future, on_done, on_error)
+        # Der Callback läuft im fremden Thread, das Signal wechselt den Thread
+        future.add_done_callback(lambda f: self._done.emit(key, f))
+        return future
+
+    def cancel(self, key: str) -> None:
+        """Bricht die offene Anfrage mit diesem Schlüssel ab."""
+        self._pending.pop(key, None)
+        self.worker.cancel(key)
+
+    def _deliver(self, key: str, future: Future) -> None:
+        pending = self._pending.get(key)
+        if pending is None or pending[0] is not future:
+            return  # Überholt oder abgebrochen
+        del self._pending[key]
+        _, on_done, on_error = pending
+
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            self.failed.emit(key, str(e))
+            return
+
+        if on_done:
+            on_done(result)
+        self.loaded.emit(key, result)
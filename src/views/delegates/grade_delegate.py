@@ -0,0 +1,42 @@
+# src/views/delegates/grade_delegate.py
+
+from typing import List
+from PyQt6.QtWidgets import QStyledItemDelegate, QComboBox
+from PyQt6.QtCore import Qt
+
+class GradeDelegate(QStyledItemDelegate):
+    """Delegate für die Notenspalte.
+
+    Die Liste der möglichen Noten wird einmal pro Notensystem gesetzt.
+    Eine ComboBox entsteht nur für die Zelle, die gerade bearbeitet wird.
+    """
+
+    def __init__(self, parent=None, grades: List[str] = None):
+        super().__init__(parent)
+        self.grades = list(grades or [])
+
+    def set_grades(self, grades: List[str]):
+        """Setzt die auswählbaren Noten (ohne leere Auswahl)."""
+        self.grades = list(grades)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItem("")  # Leere Auswahl als erste Option
+        combo.addItems(self.grades)
+        # Auswahl sofort übernehmen, ohne dass die Zelle verlassen werden muss
+        combo.activated.connect(lambda _: self._commit_and_close(combo))
+        return combo
+
+    def setEditorData(self, editor, index):
+        grade = index.data(Qt.ItemDataRole.EditRole) or ""
+        editor.setCurrentIndex(max(editor.findText(grade), 0))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
@@ -2,17 +2,18 @@
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                            QLineEdit, QTextEdit, QPushButton, QTabWidget,
-                           QWidget, QMessageBox, QTableWidget, QTableWidgetItem,
-                           QComboBox, QCheckBox, QHeaderView, QGroupBox)
-from PyQt6.QtCore import Qt
-import math
+                           QWidget, QMessageBox, QTableView, QAbstractItemView,
+                           QComboBox, QHeaderView, QGroupBox)
+from PyQt6.QtCore import Qt, QModelIndex
+from src.views.lesson_roster_model import LessonRosterModel
+from src.views.delegates.grade_delegate import GradeDelegate
 
 class LessonDetailsDialog(QDialog):
     # Spalten-Konstanten
-    COLUMN_NAME = 0
-    COLUMN_ATTENDANCE = 1
-    COLUMN_GRADE = 2
-    COLUMN_REMARK = 3
+    COLUMN_NAME = LessonRosterModel.COLUMN_NAME
+    COLUMN_ATTENDANCE = LessonRosterModel.COLUMN_ATTENDANCE
+    COLUMN_GRADE = LessonRosterModel.COLUMN_GRADE
+    COLUMN_REMARK = LessonRosterModel.COLUMN_REMARK
 
     def __init__(self, main_window, lesson_id):
         """
@@ -26,6 +27,7 @@ class LessonDetailsDialog(QDialog):
         self.main_window = main_window  # Dies ist die direkte Referenz zum Hauptfenster
         self.lesson_id = lesson_id
         self.lesson = self.main_window.controllers.lesson.get_lesson(lesson_id)
+        self.grading_scale = None  # Wird mit der Schülerliste geladen
         self.setup_ui()
         self.load_data()
 
@@ -152,12 +154,14 @@ class LessonDetailsDialog(QDialog):
         grade_group.setLayout(grade_layout)
         students_layout.addWidget(grade_group)
         
-        # Tabelle für Schüler
-        self.students_table = QTableWidget()
-        self.students_table.setColumnCount(4)
-        self.students_table.setHorizontalHeaderLabels([
-            "Name", "Anwesenheit", "Note", "Bemerkung"
-        ])
+        # Tabelle für Schüler: Modell mit Delegates statt Widgets pro Zeile
+        self.students_model = LessonRosterModel(self)
+        self.students_table = QTableView()
+        self.students_table.setModel(self.students_model)
+        self.grade_delegate = GradeDelegate(self.students_table)
+        self.students_table.setItemDelegateForColumn(self.COLUMN_GRADE, self.grade_delegate)
+        self.students_table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        self.students_table.verticalHeader().setVisible(False)
 
         # Spaltenbreiten anpassen
         header = self.students_table.horizontalHeader()
@@ -235,9 +239,6 @@ class LessonDetailsDialog(QDialog):
                             combo.setCurrentIndex(i)
                             break
 
-                # Lade und setze Anwesenheitsdaten
-                self.load_attendance_data()
-
                 # Assessment Type Info laden
                 self.load_assessment_data()
                     
@@ -272,79 +273,52 @@ class LessonDetailsDialog(QDialog):
             QMessageBox.critical(self, "Fehler", f"Fehler beim Laden der Daten: {str(e)}")
 
     def load_students(self):
-        """Lädt die Schüler des Kurses in die Tabelle (ohne Anwesenheitsstatus)"""
+        """Lädt die Schüler des Kurses mit Anwesenheit, Noten und Kommentaren in die Tabelle"""
         try:
-            semester = self.main_window.controllers.semester.get_semester_dates()
-            if not semester:
-                raise ValueError("Kein aktives Semester gefunden")
-
-            # Hole semester_id aus der Historie
-            semester_data = self.main_window.controllers.semester.get_semester_by_date(
-                semester['semester_start']
-            )
-            if not semester_data:
-                raise ValueError("Aktives Semester nicht in der Historie gefunden")
-
-            # Hole alle Schüler des Kurses für das aktuelle Semester
-            students = self.main_window.controllers.course.get_students_by_course(
-                self.lesson['course_id'], 
-                semester_data['id']
-            )
-
-            # Fülle die Tabelle
-            self.students_table.setRowCount(len(students))
+            # Schüler, Abwesenheiten, Noten und Kommentare in einer Abfrage
+            self.roster = self.main_window.controllers.lesson.get_lesson_roster(self.lesson_id)
+            if not self.roster:
+                # Nur bei leerer Liste die Ursache ermitteln
+                semester = self.main_window.controllers.semester.get_semester_dates()
+                if not semester:
+                    raise ValueError("Kein aktives Semester gefunden")
+                if not self.main_window.controllers.semester.get_semester_by_date(
+                    semester['semester_start']
+                ):
+                    raise ValueError("Aktives Semester nicht in der Historie gefunden")
+
+            # Notenliste einmal für das Notensystem des Kurses erzeugen
+            self.grade_delegate.set_grades(self.load_grade_options())
+
+            # Fülle das Modell (Anwesenheit, Noten und Kommentare aus der Schülerliste)
+            self.students_model.set_roster([
+                {
+                    'student_id': student['student_id'],
+                    'name': f"{student['last_name']}, {student['first_name']}",
+                    'present': not student['is_absent'],
+                    'grade': self.number_to_grade(student['grade'])
+                             if student['assessment_id'] else "",
+                    'comment': (student.get('comment') or "")
+                               if student['assessment_id'] else ""
+                }
+                for student in self.roster
+            ])
             
-            # Prüfe ob ein Bewertungstyp ausgewählt ist
-            has_type = self.assessment_type.currentIndex() > 0
-            
-            for row, student in enumerate(students):
-                # Name
-                name_item = QTableWidgetItem(f"{student['last_name']}, {student['first_name']}")
-                name_item.setData(Qt.ItemDataRole.UserRole, student['id'])
-                self.students_table.setItem(row, self.COLUMN_NAME, name_item)
-                
-                # Anwesenheit (neutral initialisiert)
-                attendance = QCheckBox()
-                self.students_table.setCellWidget(row, self.COLUMN_ATTENDANCE, attendance)
-                
-                # Note
-                grade_combo = QComboBox()
-                self.setup_grade_combo(grade_combo)
-                grade_combo.setEnabled(has_type)  # Initial nur aktiv wenn Typ ausgewählt
-                self.students_table.setCellWidget(row, self.COLUMN_GRADE, grade_combo)
-                
-                # Bemerkung
-                remark = QLineEdit()
-                self.students_table.setCellWidget(row, self.COLUMN_REMARK, remark)
+            # Noten nur bearbeitbar wenn ein Bewertungstyp ausgewählt ist
+            self.students_model.set_grades_editable(self.assessment_type.currentIndex() > 0)
 
         except Exception as e:
+            self.roster = []
+            self.students_model.set_roster([])
             QMessageBox.critical(self, "Fehler", f"Fehler beim Laden der Schüler: {str(e)}")
 
-    def load_attendance_data(self):
-        """Lädt und setzt die Anwesenheitsdaten für alle Schüler"""
-        try:
-            absent_students = self.main_window.controllers.assessment.get_absent_students(self.lesson_id)
-            
-            # Durchlaufe alle Zeilen der Tabelle
-            for row in range(self.students_table.rowCount()):
-                student_item = self.students_table.item(row, 0)
-                student_id = student_item.data(Qt.ItemDataRole.UserRole)
-                
-                # Hole die Checkbox
-                attendance_checkbox = self.students_table.cellWidget(row, self.COLUMN_ATTENDANCE)
-                
-                # Setze Checkbox basierend auf Anwesenheit
-                attendance_checkbox.setChecked(student_id not in absent_students)
-                
-        except Exception as e:
-            print(f"DEBUG Load - Error loading attendance: {str(e)}")
-            raise
-
     def load_assessment_data(self):
-        """Lädt die Assessment-Daten (Noten etc.) für alle Schüler"""
+        """Setzt Bewertungstyp und Bezeichnung aus der geladenen Schülerliste"""
         try:
-            # Hole exemplarisch die erste Note dieser Stunde für Assessment-Typ und Name
-            first_assessment = self.main_window.controllers.assessment.get_first_assessment_for_lesson(self.lesson_id)
+            # Exemplarisch die erste Note dieser Stunde für Assessment-Typ und Name
+            first_assessment = next(
+                (student for student in self.roster if student['assessment_id']), None
+            )
             
             if first_assessment:
                 # Setze Assessment-Typ in ComboBox
@@ -359,33 +333,6 @@ class LessonDetailsDialog(QDialog):
                 # Kein Assessment gefunden - setze auf leer/deaktiviert
                 self.assessment_type.setCurrentIndex(0)
                 self.assessment_name.setText(self.lesson['date'])
-
-            # Lade Noten für alle Schüler
-            for row in range(self.students_table.rowCount()):
-                student_item = self.students_table.item(row, self.COLUMN_NAME)
-                student_id = student_item.data(Qt.ItemDataRole.UserRole)
-                grade_combo = self.students_table.cellWidget(row, self.COLUMN_GRADE)
-                remark_widget = self.students_table.cellWidget(row, self.COLUMN_REMARK)
-
-                try:
-                    assessment = self.main_window.controllers.assessment.get_assessment(
-                        student_id, 
-                        self.lesson_id
-                    )                    
-                    if assessment:
-                        # Note setzen
-                        grade_str = self.number_to_grade(assessment['grade'])
-                        index = grade_combo.findText(grade_str)
-                        
-                        if index >= 0:
-                            grade_combo.setCurrentIndex(index)
-
-                        # Kommentar setzen falls vorhanden
-                        if assessment.get('comment'):
-                            remark_widget.setText(assessment['comment'])
-
-                except Exception as e:
-                    continue  # Fahre mit nächstem Schüler fort
         except Exception as e:
             print(f"Fehler beim Laden der Noten: {e}")
 
@@ -394,31 +341,13 @@ class LessonDetailsDialog(QDialog):
         try:
             print("DEBUG Save - Starting save_data()")
 
-            # Allgemeine Stundendaten
-            self.save_lesson_data()
-            
-            # Anwesenheiten speichern
-            self.save_attendance_data()
-            
-            try:
-                # Noten/Assessments speichern
-                self.save_assessment_data()
-            except ValueError as e:
-                if "ungespeicherter Kommentare" in str(e):
-                    # Spezieller Fall: Nutzer hat Speichern wegen Kommentare abgebrochen
-                    return  # Dialog bleibt offen
-                else:
-                    raise  # andere ValueError weiterreichen
-            
-            # Kompetenzen speichern
-            self.save_competency_data()
-            
-            self.accept()
-            
-            # Liste aktualisieren
-            self.main_window.list_manager.update_all(
-                self.main_window.calendar_container.get_selected_date()
-            )
+            # Offenen Editor in der Schülertabelle ins Modell übernehmen
+            self.students_table.setCurrentIndex(QModelIndex())
+
+            # Rückfrage vor dem Öffnen der Transaktion, damit die Datenbank
+            # nicht während eines offenen Dialogs gesperrt bleibt
+            if not self.confirm_comments_without_grades():
+                return  # Dialog bleibt offen
 
             # Status-Informationen zum Speichern vorbereiten
             status_map = {
@@ -438,9 +367,30 @@ class LessonDetailsDialog(QDialog):
                 'moved_to_lesson_id': getattr(self, 'moved_to_lesson_id', None) 
                                     if status == "moved" else None
             }
+
+            # Alle Änderungen gemeinsam mit einem einzigen Commit speichern
+            with self.main_window.db.transaction():
+                # Allgemeine Stundendaten
+                self.save_lesson_data()
+                
+                # Anwesenheiten speichern
+                self.save_attendance_data()
+                
+                # Noten/Assessments speichern
+                self.save_assessment_data()
+                
+                # Kompetenzen speichern
+                self.save_competency_data()
+
+                # Status speichern über Controller
+                self.main_window.controllers.lesson.update_lesson(self.lesson_id, data)
             
-            # Speichern über Controller
-            self.main_window.controllers.lesson.update_lesson(self.lesson_id, data)
+            self.accept()
+            
+            # Liste aktualisieren
+            self.main_window.list_manager.update_all(
+                self.main_window.calendar_container.get_selected_date()
+            )
                 
         except Exception as e:
             QMessageBox.critical(self, "Fehler", f"Fehler beim Speichern: {str(e)}")
@@ -458,50 +408,33 @@ class LessonDetailsDialog(QDialog):
     def save_attendance_data(self):
         """Speichert die Anwesenheitsdaten"""
         try:
-            # Lösche zuerst alle bestehenden Abwesenheitseinträge
-            # (Lösche alle und füge dann nur Abwesende wieder hinzu)
-            absent_students = self.main_window.controllers.assessment.get_absent_students(self.lesson_id)
-            for student_id in absent_students:
-                self.main_window.controllers.assessment.mark_present(self.lesson_id, student_id)
-
-            # Speichere neue Abwesenheitseinträge
-            for row in range(self.students_table.rowCount()):
-                student_item = self.students_table.item(row, self.COLUMN_NAME)
-                student_id = student_item.data(Qt.ItemDataRole.UserRole)
-                
-                attendance_checkbox = self.students_table.cellWidget(row, self.COLUMN_ATTENDANCE)
-                if not attendance_checkbox.isChecked():
-                    # Speichere nur Abwesenheiten
-                    self.main_window.controllers.assessment.mark_absent(self.lesson_id, student_id)
+            # Sammle alle Abwesenden, geschrieben wird nur die Differenz
+            absent_ids = [
+                student['student_id'] for student in self.students_model.rows()
+                if not student['present']
+            ]
+
+            self.main_window.controllers.assessment.set_absent_students(
+                self.lesson_id, absent_ids
+            )
         except Exception as e:
             print(f"DEBUG Save - Error saving attendance: {str(e)}")
             raise
 
-    def save_assessment_data(self):
-        """Speichert die Bewertungsdaten"""
-        print("DEBUG Save - Starting assessment data save")
+    def confirm_comments_without_grades(self) -> bool:
+        """Warnt vor Kommentaren ohne Note.
         
-        # Assessment Type Info
-        assessment_type_id = self.assessment_type.currentData()
-        if not assessment_type_id:
-            return  # Kein Bewertungstyp ausgewählt
-
-        # Hauptspeicherlogik
-        print(f"DEBUG Save - Assessment type ID: {assessment_type_id}")
-        assessment_name = self.assessment_name.text().strip()
+        Returns:
+            False wenn der Nutzer das Speichern abbricht, sonst True
+        """
+        if not self.assessment_type.currentData():
+            return True  # Kein Bewertungstyp ausgewählt, es wird nichts bewertet
 
         # Sammle erst alle Kommentare ohne Noten
         comments_without_grades = []
-        for row in range(self.students_table.rowCount()):
-            student_item = self.students_table.item(row, self.COLUMN_NAME)
-            grade_combo = self.students_table.cellWidget(row, self.COLUMN_GRADE)
-            remark_widget = self.students_table.cellWidget(row, self.COLUMN_REMARK)
-            
-            grade_str = grade_combo.currentText().strip()
-            comment = remark_widget.text().strip() if remark_widget else ""
-            
-            if comment and not grade_str:
-                comments_without_grades.append(student_item.text())
+        for student in self.students_model.rows():
+            if student['comment'].strip() and not student['grade']:
+                comments_without_grades.append(student['name'])
 
         # Warnung anzeigen wenn nötig
         if comments_without_grades:
@@ -519,54 +452,52 @@ class LessonDetailsDialog(QDialog):
             )
             
             if reply == QMessageBox.StandardButton.No:
-                raise ValueError("Speichern wegen ungespeicherter Kommentare abgebrochen")
+                return False
 
-        # Jetzt das eigentliche Speichern
-        for row in range(self.students_table.rowCount()):
-            try:
-                student_item = self.students_table.item(row, self.COLUMN_NAME)
-                student_id = student_item.data(Qt.ItemDataRole.UserRole)
-                print(f"DEBUG Save - Processing student ID: {student_id}")
-
-                grade_combo = self.students_table.cellWidget(row, self.COLUMN_GRADE)
-                grade_str = grade_combo.currentText().strip()
-
-                remark_widget = self.students_table.cellWidget(row, self.COLUMN_REMARK)
-                comment = remark_widget.text().strip() if remark_widget else ""
-                print(f"DEBUG Save - Comment for student {student_id}: {comment}")
+        return True
 
-                # Wenn eine leere Note ausgewählt wurde, lösche eine eventuell vorhandene Note
-                if not grade_str:
-                    self.main_window.controllers.assessment.delete_assessment(
-                        student_id, self.lesson_id
-                    )
-                    continue
-
-                # Ab hier nur noch wenn wirklich eine Note ausgewählt wurde  
-                numeric_grade = self.grade_to_number(grade_str)
-                print(f"DEBUG Save - Converting {grade_str} to numeric: {numeric_grade}")
-                
-                if numeric_grade is not None:
-                    weight = 2.0 if self.lesson['duration'] == 2 else 1.0
-                    assessment_data = {
-                        'student_id': student_id,
-                        'course_id': self.lesson['course_id'],
-                        'assessment_type_id': assessment_type_id,
-                        'grade': numeric_grade,
-                        'date': self.lesson['date'],
-                        'lesson_id': self.lesson_id,
-                        'topic': assessment_name,
-                        'weight': weight,
-                        'comment': comment
-                    }
-                    print(f"DEBUG Save - Complete assessment data: {assessment_data}")
-                    self.main_window.controllers.assessment.add_or_update_assessment(
-                        data=assessment_data
-                    )
+    def save_assessment_data(self):
+        """Speichert die Bewertungsdaten"""
+        assessment_type_id = self.assessment_type.currentData()
+        if not assessment_type_id:
+            return  # Kein Bewertungstyp ausgewählt
 
-            except Exception as e:
-                print(f"DEBUG Save - Error processing student {student_id}: {str(e)}")
-                raise
+        assessment_name = self.assessment_name.text().strip()
+        weight = 2.0 if self.lesson['duration'] == 2 else 1.0
+
+        assessments = []
+        deleted_ids = []
+        for student in self.students_model.rows():
+            student_id = student['student_id']
+            grade_str = student['grade']
+
+            # Leere Note: eine eventuell vorhandene Note wird gelöscht
+            if not grade_str:
+                deleted_ids.append(student_id)
+                continue
+
+            numeric_grade = self.grade_to_number(grade_str)
+            if numeric_grade is None:
+                continue
+
+            comment = student['comment'].strip()
+            assessments.append({
+                'student_id': student_id,
+                'course_id': self.lesson['course_id'],
+                'assessment_type_id': assessment_type_id,
+                'grade': numeric_grade,
+                'date': self.lesson['date'],
+                'lesson_id': self.lesson_id,
+                'topic': assessment_name,
+                'weight': weight,
+                'comment': comment
+            })
+
+        # Fehler nicht abfangen: save_data() rollt die Transaktion zurück
+        # und zeigt die Meldung an
+        self.main_window.controllers.assessment.save_lesson_assessments(
+            self.lesson_id, assessments, deleted_ids
+        )
 
     def save_competency_data(self):
         """Speichert die Kompetenzzuordnungen"""
@@ -590,135 +521,54 @@ class LessonDetailsDialog(QDialog):
             raise
 
 
-    def setup_grade_combo(self, combo: QComboBox):
-        """Richtet die Noten-ComboBox ein"""
-        combo.addItem("")  # Leere Auswahl als erste Option
+    def load_grade_options(self) -> list:
+        """Lädt die Notenskala des Kurses und gibt die auswählbaren Noten zurück.
         
+        Returns:
+            Liste der Noten als Anzeige-Strings (ohne leere Auswahl)
+        """
+        self.grading_scale = None
         try:
-            # Hole das Notensystem für den Kurs
-            grading_system = self.main_window.controllers.assessment.get_grading_system_for_course(self.lesson['course_id'])
-            if not grading_system:
+            self.grading_scale = self.main_window.controllers.assessment.get_grading_scale_for_course(
+                self.lesson['course_id']
+            )
+            if not self.grading_scale:
                 QMessageBox.warning(self, "Warnung", 
                                 "Kein Notensystem für diesen Kurs definiert!")
-                return
-                
-            # Generiere mögliche Noten
-            current = grading_system['min_grade']
-            grades = []
-            while current <= grading_system['max_grade']:
-                base = math.floor(current)
-                decimal = current - base
-                # Bei Notensystemen mit Schritten <= 0.33 fügen wir +/- hinzu
-                if grading_system['step_size'] <= 0.4:
-                    if decimal == 0:  # Glatte Note
-                        grades.append(str(base))
-                        print(str(base))
-                    elif decimal == 0.7:  # Plus-Note (z.B. 1.7 -> "2+")
-                        grades.append(f"{base+1}+")
-                        print(f"{base+1}+")
-                    elif decimal == 0.3:  # Minus-Note (z.B. 1.3 -> "1-")
-                        grades.append(f"{base}-")
-                        print(f"{base+1}-")
-                    else:
-                        # Falls wir einen "ungültigen" Wert haben, runden wir zur nächsten gültigen Note
-                        if decimal < 0.15:  # Zur glatten Note
-                            grades.append(str(base))
-                        elif decimal < 0.5:  # Zur Minus-Note
-                            grades.append(f"{base}-")
-                        elif decimal < 0.85:  # Zur Plus-Note der nächsten Stufe
-                            grades.append(f"{base+1}+")
-                        else:  # Zur nächsten glatten Note
-                            grades.append(str(base + 1))
-                else:
-                    # Bei größeren Schritten nur die Basis-Note
-                    grades.append(str(base))
-                current = round(current + grading_system['step_size'], 2)
-                
-            combo.addItems(grades)
+                return []
+            return list(self.grading_scale.grades)
                 
         except Exception as e:
             QMessageBox.critical(self, "Fehler", 
                             f"Fehler beim Laden des Notensystems.{e}")
-
+            return []
 
     def grade_to_number(self, grade_str: str) -> float:
         """Wandelt eine Note aus der ComboBox in einen numerischen Wert um."""
-        if not grade_str or not grade_str.strip():
-            return None
-                
+        if self.grading_scale:
+            return self.grading_scale.to_number(grade_str)
+        # Ohne Notensystem nur glatte Zahlen
         try:
-            print(f"DEBUG: Converting grade string '{grade_str}' to number")
-                
-            # Bei Plus/Minus-Notation
-            if len(grade_str) > 1 and (grade_str[-1] in ['+', '-']):
-                base = float(grade_str[0:-1])  # Basisnote ohne +/-
-                modifier = grade_str[-1]
-                    
-                if modifier == '+':
-                    result = base - 0.3  # Vorher 0.33
-                else:  # '-'
-                    result = base + 0.3  # Vorher 0.33
-                        
-                print(f"DEBUG: '{grade_str}' -> {result}")
-                return round(result, 2)
-            else:
-                # Einfach als Zahl parsen für glatte Noten
-                result = float(grade_str)
-                print(f"DEBUG: '{grade_str}' -> {result}")
-                return result
-                    
-        except ValueError as e:
-            print(f"DEBUG: Error converting grade '{grade_str}' to number: {str(e)}")
+            return float(grade_str) if grade_str and grade_str.strip() else None
+        except ValueError:
             return None
 
     def number_to_grade(self, number: float) -> str:
         """Wandelt einen numerischen Notenwert in einen Anzeige-String um."""
         if number is None:
             return ""
+        if self.grading_scale:
+            return self.grading_scale.to_text(number)
+        return f"{number:g}"
 
-        try:
-            print(f"DEBUG: Converting number {number} to grade string")
-            number = round(number, 2)  # Runde auf 2 Dezimalstellen
-            
-            # Bestimme die Basisnote (die nächste ganze Zahl)
-            base = int(number)
-            decimal = number - base
-
-            # Konvertiere in +/-/normal basierend auf Dezimalstellen
-            if decimal == 0:  # Glatte Note
-                return str(base)
-            elif decimal == 0.7:  # Plus-Note (z.B. 1.7 -> "2+")
-                return f"{base+1}+"
-            elif decimal == 0.3:  # Minus-Note (z.B. 1.3 -> "1-")
-                return f"{base}-"
-            else:
-                # Falls wir einen "ungültigen" Wert haben, runden wir zur nächsten gültigen Note
-                if decimal < 0.15:  # Zur glatten Note
-                    return str(base)
-                elif decimal < 0.5:  # Zur Minus-Note
-                    return f"{base}-"
-                elif decimal < 0.85:  # Zur Plus-Note der nächsten Stufe
-                    return f"{base+1}+"
-                else:  # Zur nächsten glatten Note
-                    return str(base + 1)
-
-        except Exception as e:
-            print(f"DEBUG: Error converting number {number} to grade: {str(e)}")
-            return str(number)
-
-    def on_grade_changed(self, index: int, row: int):
+    def on_grade_changed(self, row: int):
         """Handler für Notenänderungen"""
-        combo = self.students_table.cellWidget(row, self.COLUMN_GRADE)
-        if not combo:  
-            return
-            
-        attendance_checkbox = self.students_table.cellWidget(row, self.COLUMN_ATTENDANCE)
-        if not attendance_checkbox:  
+        if not 0 <= row < self.students_model.rowCount():
             return
             
-        grade_str = combo.currentText()
+        student = self.students_model.rows()[row]
         
-        if grade_str and not attendance_checkbox.isChecked():
+        if student['grade'] and not student['present']:
             if QMessageBox.question(
                 self,
                 "Abwesender Schüler",
@@ -726,9 +576,9 @@ class LessonDetailsDialog(QDialog):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
             ) == QMessageBox.StandardButton.No:
-                combo.blockSignals(True)
-                combo.setCurrentIndex(0)  # Zurück zu "keine Note"
-                combo.blockSignals(False)
+                self.students_model.setData(
+                    self.students_model.index(row, self.COLUMN_GRADE), ""
+                )  # Zurück zu "keine Note"
 
     def add_competency_row(self, is_first_row=False):
         """Fügt eine neue Kompetenzauswahl-Zeile hinzu"""
@@ -867,12 +717,8 @@ class LessonDetailsDialog(QDialog):
         # Aktiviere/Deaktiviere die abhängigen Widgets
         self.assessment_name.setEnabled(has_type)
         
-        # Aktiviere/Deaktiviere alle Noten-ComboBoxen
-        for row in range(self.students_table.rowCount()):
-            grade_combo = self.students_table.cellWidget(row, self.COLUMN_GRADE)
-            if grade_combo:
-                print(f"DEBUG: Setting grade combo enabled to {has_type} for row {row}")
-                grade_combo.setEnabled(has_type)
+        # Aktiviere/Deaktiviere die Notenspalte
+        self.students_model.set_grades_editable(has_type)
 
 
     def on_status_changed(self, new_status):
@@ -0,0 +1,133 @@
+# src/views/lesson_roster_model.py
+
+from typing import Any, Dict, List
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class LessonRosterModel(QAbstractTableModel):
+    """Tabellenmodell für die Schülerliste im Stundendetails-Dialog.
+
+    Hält pro Schüler Name, Anwesenheit, Note (als Anzeige-String) und
+    Bemerkung. Anwesenheit ist eine ankreuzbare Zelle, Note und Bemerkung
+    werden über Delegates bearbeitet, es gibt also keine Widgets pro Zeile.
+    """
+
+    COLUMN_NAME = 0
+    COLUMN_ATTENDANCE = 1
+    COLUMN_GRADE = 2
+    COLUMN_REMARK = 3
+
+    HEADERS = ["Name", "Anwesenheit", "Note", "Bemerkung"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []              # [{'student_id', 'name', 'present', 'grade', 'comment'}]
+        self._grades_editable = False
+
+    # Aufbau
+
+    def set_roster(self, rows: List[Dict[str, Any]]) -> None:
+        """Setzt die Schülerliste.
+
+        Args:
+            rows: Liste von Dictionaries mit 'student_id', 'name',
+                  'present', 'grade' (Anzeige-String) und 'comment'
+        """
+        self.beginResetModel()
+        self._rows = [dict(row) for row in rows]
+        self.endResetModel()
+
+    def set_grades_editable(self, editable: bool) -> None:
+        """Aktiviert oder deaktiviert die Notenspalte.
+
+        Args:
+            editable: True wenn Noten vergeben werden können
+        """
+        if editable == self._grades_editable:
+            return
+        self._grades_editable = editable
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.COLUMN_GRADE),
+                self.index(len(self._rows) - 1, self.COLUMN_GRADE)
+            )
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Gibt die aktuellen Zeilen der Schülerliste zurück."""
+        return self._rows
+
+    # QAbstractTableModel
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        column = index.column()
+        if column == self.COLUMN_ATTENDANCE:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        if column == self.COLUMN_GRADE:
+            if not self._grades_editable:
+                return Qt.ItemFlag.NoItemFlags  # Ausgegraut wie ein deaktiviertes Widget
+            return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                    | Qt.ItemFlag.ItemIsEditable)
+        if column == self.COLUMN_REMARK:
+            return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                    | Qt.ItemFlag.ItemIsEditable)
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if column == self.COLUMN_NAME:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return row['name']
+            if role == Qt.ItemDataRole.UserRole:
+                return row['student_id']
+        elif column == self.COLUMN_ATTENDANCE:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if row['present'] else Qt.CheckState.Unchecked
+        elif column == self.COLUMN_GRADE:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+                return row['grade']
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+        elif column == self.COLUMN_REMARK:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+                return row['comment']
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if column == self.COLUMN_ATTENDANCE and role == Qt.ItemDataRole.CheckStateRole:
+            row['present'] = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif column == self.COLUMN_GRADE and role == Qt.ItemDataRole.EditRole:
+            row['grade'] = (value or "").strip()
+        elif column == self.COLUMN_REMARK and role == Qt.ItemDataRole.EditRole:
+            row['comment'] = value or ""
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [role])
+        return True
@@ -50,9 +50,16 @@ class ListManager:
             current_time = current_datetime.time()
             is_today = date == QDate.currentDate()
             
-            # Hole Stunden und Zeitslots über Controller
-            lessons = self.parent.controllers.lesson.get_lessons_by_date(date.toString("yyyy-MM-dd"))
+            # Hole Stunden, nächste Stunden pro Kurs und Zeitslots über Controller
+            day_str = date.toString("yyyy-MM-dd")
+            lessons = self.parent.controllers.lesson.get_lessons_by_date(day_str)
+            next_lessons = self.parent.controllers.lesson.get_next_lesson_by_course(day_str)
             time_slots = self.get_time_slots()
+            
+            # Hausaufgaben der jeweils vorherigen Stunde in einer Abfrage
+            homework_by_lesson = self.parent.controllers.lesson.get_previous_homework_batch(
+                lesson_ids=[lesson['id'] for lesson in lessons + next_lessons]
+            )
             day_schedule = self.calendar_container.day_schedule
             day_schedule.clear_schedule()
             
@@ -113,12 +120,8 @@ class ListManager:
                             homework = None  # Keine Hausaufgaben bei aktueller Stunde
                         else:
                             status = "kommend"
-                            # Hole Hausaufgaben der vorherigen Stunde
-                            homework = self.parent.controllers.lesson.get_previous_homework(
-                                lesson['course_id'],
-                                lesson['date'],
-                                lesson['time']
-                            )
+                            # Hausaufgaben der vorherigen Stunde
+                            homework = homework_by_lesson.get(lesson['id'])
                             
                         day_schedule.add_lesson(
                             time_slot,
@@ -132,9 +135,7 @@ class ListManager:
                             lesson.get('status', 'normal')  # Füge den lesson_status hinzu
                         )
             
-            # Hole und zeige die nächsten Stunden pro Kurs
-            next_lessons = self.parent.controllers.lesson.get_next_lesson_by_course(date.toString("yyyy-MM-dd"))
-            
+            # Zeige die nächsten Stunden pro Kurs
             if next_lessons:
                 day_schedule.add_separator("Nächste Stunden pro Kurs")
                 
@@ -142,12 +143,8 @@ class ListManager:
                     lesson_date = QDate.fromString(lesson['date'], "yyyy-MM-dd")
                     date_str = lesson_date.toString("dd.MM.")
                     
-                    # Hole Hausaufgaben der vorherigen Stunde für diesen Kurs
-                    homework = self.parent.controllers.lesson.get_previous_homework(
-                        lesson['course_id'],
-                        lesson['date'],
-                        lesson['time']
-                    )
+                    # Hausaufgaben der vorherigen Stunde für diesen Kurs
+                    homework = homework_by_lesson.get(lesson['id'])
                     
                     day_schedule.add_lesson(
                         f"{date_str} {lesson['time']}",
@@ -184,9 +181,8 @@ class ListManager:
             if dialog.exec():
                 lessons_data = dialog.get_data()  # Jetzt eine Liste von Stunden
                 
-                # Erstelle jede ausgewählte Stunde
-                for lesson_data in lessons_data:
-                    self.parent.controllers.lesson.add_lesson(lesson_data)
+                # Alle ausgewählten Stunden in einem Aufruf erstellen
+                self.parent.controllers.lesson.add_lessons(lessons_data)
                 
                 self.update_day_list(selected_date)
                 
@@ -223,8 +219,7 @@ class ListManager:
             
             if dialog.exec():
                 lessons_data = dialog.get_data()
-                for lesson_data in lessons_data:
-                    self.parent.controllers.lesson.add_lesson(lesson_data)
+                self.parent.controllers.lesson.add_lessons(lessons_data)
                 
                 # Aktualisiere Kalenderansichten
                 self.update_all(date)
@@ -259,7 +254,7 @@ class ListManager:
                     update_all_following = update_data.pop('update_all_following', False)
                     
                     # Aktualisiere die Stunde(n)
-                    self.parent.controllers.lesson.update_lesson(
+                    updated_ids = self.parent.controllers.lesson.update_lesson(
                         lesson_id, 
                         update_data, 
                         update_all_following
@@ -268,10 +263,9 @@ class ListManager:
                     # Aktualisiere Tagesliste
                     self.update_day_list(self.calendar_container.get_selected_date())
 
-                    # Aktualisiere WeekView falls vorhanden
+                    # Aktualisiere die geänderten Stunden in der WeekView falls vorhanden
                     if hasattr(self.calendar_container, 'week_view'):
-                        current_week = self.calendar_container.week_view.week_navigator.current_week_start
-                        self.calendar_container.week_view.update_view(current_week)
+                        self.calendar_container.week_view.refresh_lessons(updated_ids)
                     
                     msg = "Alle folgenden Stunden wurden aktualisiert" if update_all_following \
                           else "Stunde wurde aktualisiert"
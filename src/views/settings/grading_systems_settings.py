@@ -102,22 +102,11 @@ class GradingSystemsSettings(QWidget):
             if current_row >= 0:
                 system_id = self.table.item(current_row, 0).\
                         data(Qt.ItemDataRole.UserRole)
-                system = self.parent.controllers.grading_system.get_grading_system(system_id)
+                scale = self.parent.controllers.grading_system.get_grading_scale(system_id)
                 
-                if system:
-                    # Berechne die Anzahl der Schritte
-                    steps = round((system['max_grade'] - system['min_grade']) / 
-                                system['step_size'])
-                    
-                    # Generiere alle möglichen Noten mit korrekter Rundung
-                    grades = []
-                    for i in range(steps + 1):  # +1 um auch die max_grade einzuschließen
-                        grade = round(system['min_grade'] + (i * system['step_size']), 2)
-                        # Formatiere auf 2 Dezimalstellen wenn nötig
-                        if grade.is_integer():
-                            grades.append(str(int(grade)))
-                        else:
-                            grades.append(f"{grade:.2f}")
+                if scale:
+                    # Vorberechnete Noten so, wie sie bei der Eingabe angeboten werden
+                    grades = scale.grades
                     self.preview_label.setText(", ".join(grades))
             else:
                 self.preview_label.clear()
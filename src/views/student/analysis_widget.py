@@ -1,6 +1,6 @@
 # src/views/student/analysis_widget.py
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QTableWidget, QTableWidgetItem, QHeaderView)
+                           QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPen, QBrush, QPainter
 from PyQt6.QtCharts import (QChartView, QPolarChart, QSplineSeries, 
@@ -78,25 +78,40 @@ class AnalysisWidget(QWidget):
         layout.addWidget(self.chart_view)
 
     def load_analysis(self, student_id: int):
-        try:
-            self.current_student_id = student_id
-            # Reset all displays
-            self.type_grades_table.setRowCount(0)
-            self.course_grades_table.setRowCount(0)
-            self.radar_chart.removeAllSeries()
+        """Lädt die Auswertung eines Schülers im Hintergrund."""
+        self.current_student_id = student_id
+        # Reset all displays
+        self.type_grades_table.setRowCount(0)
+        self.course_grades_table.setRowCount(0)
+        self.radar_chart.removeAllSeries()
+
+        self.main_window.loader.load(
+            'student_analysis', self._fetch_analysis, student_id,
+            on_done=self._show_analysis,
+            on_error=self._show_load_error
+        )
 
-            # Get data via controller
-            course_grades = self.main_window.controllers.student.get_student_course_grades(student_id)
-            course_competencies = self.main_window.controllers.student.get_student_competency_grades(student_id)
+    def _show_load_error(self, error: Exception):
+        QMessageBox.critical(
+            self,
+            "Fehler",
+            f"Fehler beim Laden der Auswertung: {str(error)}"
+        )
 
-            # Only update if there's data
-            if course_grades and any(grade.get('final_grade') is not None for grade in course_grades.values()):
-                self.update_tables(course_grades, course_competencies)
-                self.update_radar_chart(course_competencies)
+    @staticmethod
+    def _fetch_analysis(controllers, student_id: int):
+        """Läuft im ReadWorker: holt Kursnoten und Kompetenzen."""
+        return (
+            controllers.student.get_student_course_grades(student_id),
+            controllers.student.get_student_competency_grades(student_id)
+        )
 
-        except Exception as e:
-            print(f"DEBUG Analysis Error: {str(e)}")
-            raise
+    def _show_analysis(self, result):
+        course_grades, course_competencies = result
+        # Only update if there's data
+        if course_grades and any(grade.get('final_grade') is not None for grade in course_grades.values()):
+            self.update_tables(course_grades, course_competencies)
+            self.update_radar_chart(course_competencies)
 
     def update_tables(self, course_grades, competency_data):
         # Reset tables first
@@ -276,20 +291,14 @@ class AnalysisWidget(QWidget):
         num_areas = len(competency_data['areas'])
         angle_step = 360.0 / num_areas
 
-        # Durchschnitt pro Kompetenzbereich berechnen
-        area_averages = {}
-        for course in competency_data['grades']:
-            for area, grade in course['competencies'].items():
-                if area not in area_averages:
-                    area_averages[area] = {'sum': 0.0, 'count': 0}
-                area_averages[area]['sum'] += grade
-                area_averages[area]['count'] += 1
+        # Durchschnitt pro Kompetenzbereich (im Controller berechnet)
+        area_averages = competency_data.get('area_averages', {})
 
         # Punkte hinzufügen
         for i, area in enumerate(competency_data['areas']):
             angle = i * angle_step
-            if area_averages[area]['count'] > 0:
-                avg = area_averages[area]['sum'] / area_averages[area]['count']
+            avg = area_averages.get(area)
+            if avg is not None:
                 # Werte transformieren: 1 ganz außen (8.0), 6 innen (1.0, nah zur Mitte)
                 # Stückweise lineare Transformation, die den Label-Positionen entspricht
                 if avg <= 1.0:
@@ -10,7 +10,7 @@ from PyQt6.QtGui import QColor
 from src.views.dialogs.course_dialog import CourseDialog
 from src.views.dialogs.lesson_details_dialog import LessonDetailsDialog
 from src.models.course import Course
-from src.views.delegates.strikeout_delegate import StrikeoutDelegate    
+from src.views.delegates.strikeout_delegate import StrikeoutDelegate, LESSON_STATUS_ROLE
 
 class CourseTab(QWidget):
     def __init__(self, parent=None):
@@ -101,7 +101,7 @@ class CourseTab(QWidget):
         
         self.detail_tabs.addTab(self.lesson_table, "Stunden")
 
-        self.lesson_table.setItemDelegate(StrikeoutDelegate(self.lesson_table, self.parent.db, self.parent))
+        self.lesson_table.setItemDelegate(StrikeoutDelegate(self.lesson_table))
         
         # Tab für Noten
         self.grades_widget = QTableWidget()
@@ -209,8 +209,9 @@ class CourseTab(QWidget):
                     
                 self.lesson_table.setItem(row, 4, status_item)
                 
-                # Lesson-ID als Userdata speichern
+                # Lesson-ID und Status als Userdata speichern
                 date_item.setData(Qt.ItemDataRole.UserRole, lesson['id'])
+                date_item.setData(LESSON_STATUS_ROLE, status)
                 
         except Exception as e:
             QMessageBox.critical(
@@ -283,11 +284,26 @@ class CourseTab(QWidget):
                 
 
     def load_course_grades(self, course_id: int):
-        """Lädt alle Bewertungen des ausgewählten Kurses"""
+        """Lädt alle Bewertungen des ausgewählten Kurses im Hintergrund"""
+        # Hole alle Bewertungen mit zugehörigen Details über den ReadWorker
+        self.parent.loader.load(
+            'course_grades',
+            lambda controllers, cid: controllers.course.get_course_grades_detailed(cid),
+            course_id,
+            on_done=self._show_course_grades,
+            on_error=self._show_load_error
+        )
+
+    def _show_load_error(self, error: Exception):
+        QMessageBox.critical(
+            self,
+            "Fehler",
+            f"Fehler beim Laden der Bewertungen: {str(error)}"
+        )
+
+    def _show_course_grades(self, grades):
+        """Füllt die Bewertungstabelle (im GUI-Thread)"""
         try:
-            # Hole alle Bewertungen mit zugehörigen Details über Controller
-            grades = self.parent.controllers.course.get_course_grades_detailed(course_id)
-            
             # Tabelle leeren und Größe anpassen
             self.grades_widget.setRowCount(0)
             self.grades_widget.setRowCount(len(grades))
@@ -331,11 +347,7 @@ class CourseTab(QWidget):
                 self.grades_widget.setItem(row, 4, avg_item)
                 
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Fehler",
-                f"Fehler beim Laden der Bewertungen: {str(e)}"
-            )
+            self._show_load_error(e)
 
     def delete_grade_group(self, row):
         """Löscht alle Noten der ausgewählten Bewertung"""
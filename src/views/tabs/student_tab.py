@@ -292,60 +292,69 @@ class StudentTab(QWidget):
             )
 
     def refresh_students(self):
-        """Aktualisiert die Schülerliste"""
-        try:
-            course_id = self.course_filter.currentData()
-            semester = self.main_window.controllers.semester.get_semester_dates()
-
-            # Alle Schüler mit Kursen laden
-            if semester:
-                students = self.main_window.controllers.student.get_students_with_courses(
-                    semester.get('semester_start'), semester.get('semester_end')
-                )
-            else:
-                students = self.main_window.controllers.student.get_students_with_courses()
-                
-            # Nach Kurs filtern wenn nötig
-            if course_id:
-                filtered_students = []
-                for student in students:
-                    if any(c['id'] == course_id for c in student.get('courses', [])):
-                        filtered_students.append(student)
-                students = filtered_students
-
-            # Tabelle befüllen
-            self.students_table.setRowCount(len(students))
-            for row, student in enumerate(students):
-                # Name
-                self.students_table.setItem(
-                    row, 0, 
-                    QTableWidgetItem(student['last_name'])
-                )
-                self.students_table.setItem(
-                    row, 1, 
-                    QTableWidgetItem(student['first_name'])
-                )
-                
-                # ID als userData speichern
-                self.students_table.item(row, 0).setData(
-                    Qt.ItemDataRole.UserRole, 
-                    student['id']
-                )
-                
-                # Kurse anzeigen
-                courses = student.get('courses', [])
-                course_names = [course['name'] for course in courses]
-                self.students_table.setItem(
-                    row, 2,
-                    QTableWidgetItem(", ".join(course_names))
-                )
-                
-        except Exception as e:
-            QMessageBox.critical(
+        """Aktualisiert die Schülerliste (Abfrage im Hintergrund)"""
+        self.main_window.loader.load(
+            'students', self._fetch_students, self.course_filter.currentData(),
+            on_done=self._show_students,
+            on_error=lambda e: QMessageBox.critical(
                 self,
                 "Fehler",
                 f"Fehler beim Laden der Schüler: {str(e)}"
             )
+        )
+
+    @staticmethod
+    def _fetch_students(controllers, course_id):
+        """Läuft im ReadWorker: lädt die Schüler des Semesters"""
+        semester = controllers.semester.get_semester_dates()
+
+        # Alle Schüler mit Kursen laden
+        if semester:
+            students = controllers.student.get_students_with_courses(
+                semester.get('semester_start'), semester.get('semester_end')
+            )
+        else:
+            students = controllers.student.get_students_with_courses()
+
+        # Nach Kurs filtern wenn nötig
+        if course_id:
+            students = [
+                student for student in students
+                if any(c['id'] == course_id for c in student.get('courses', []))
+            ]
+        return students
+
+    def _show_students(self, students):
+        """Füllt die Schülertabelle (im GUI-Thread)"""
+        self.students_table.setRowCount(len(students))
+        for row, student in enumerate(students):
+            # Name
+            self.students_table.setItem(
+                row, 0, 
+                QTableWidgetItem(student['last_name'])
+            )
+            self.students_table.setItem(
+                row, 1, 
+                QTableWidgetItem(student['first_name'])
+            )
+            
+            # ID als userData speichern
+            self.students_table.item(row, 0).setData(
+                Qt.ItemDataRole.UserRole, 
+                student['id']
+            )
+            
+            # Kurse anzeigen
+            courses = student.get('courses', [])
+            course_names = [course['name'] for course in courses]
+            self.students_table.setItem(
+                row, 2,
+                QTableWidgetItem(", ".join(course_names))
+            )
+
+        # Suchfilter auf die neuen Zeilen anwenden
+        if self.search_input.text():
+            self.filter_students(self.search_input.text())
 
     def filter_students(self, text: str):
         """Filtert die Schülerliste basierend auf der Sucheingabe"""
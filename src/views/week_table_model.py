@@ -0,0 +1,353 @@
+# src/views/week_table_model.py
+
+from typing import Any, Dict, List, Optional, Tuple
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QDate
+from PyQt6.QtGui import QColor, QBrush, QFont
+
+
+class WeekTableModel(QAbstractTableModel):
+    """Tabellenmodell für den Wochenstundenplan (Mo-Fr).
+
+    Hält ein kompaktes Raster der Stunden einer Woche: Zeilen sind die
+    Zeitslots inklusive Pausenzeilen, Spalten die Wochentage. Die Zuordnung
+    Uhrzeit -> Zeile wird beim Setzen der Zeitslots einmal berechnet.
+    Änderungen an einzelnen Stunden lösen nur dataChanged für die
+    betroffenen Zellen aus.
+    """
+
+    WEEKDAYS = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']
+
+    PAUSE_COLOR = QColor("#dee2e6")
+
+    # Farben für verschiedene Arten von freien Tagen
+    HOLIDAY_COLORS = {
+        'holiday': QColor(255, 230, 230, 100),      # Hellrot mit Transparenz
+        'vacation_day': QColor(230, 255, 230, 100), # Hellgrün mit Transparenz
+        'school': QColor(230, 230, 255, 100)        # Hellblau mit Transparenz
+    }
+
+    # Icons für verschiedene Typen
+    HOLIDAY_ICONS = {
+        'holiday': "★",       # Stern für Feiertag
+        'vacation_day': "☼",  # Sonne für Ferien
+        'school': "✎"         # Stift für Schulfrei
+    }
+
+    # Farbzuordnung für Fächer ohne Kursfarbe
+    SUBJECT_COLORS = {
+        'Mathematik': '#FFE5E5',  # Hellrot
+        'Deutsch': '#E5FFE5',     # Hellgrün
+        'Englisch': '#E5E5FF',    # Hellblau
+        'Geschichte': '#FFE5FF',  # Helllila
+        'Biologie': '#FFFFE5',    # Hellgelb
+        'Physik': '#E5FFFF',      # Helltürkis
+        'Chemie': '#FFE5E5',      # Hellrot
+        'Kunst': '#FFE5FF',       # Helllila
+        'Musik': '#E5FFE5',       # Hellgrün
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []           # [{'label', 'is_pause', 'height'}]
+        self._row_for_time = {}   # "HH:MM" -> Zeile
+        self._week_start = None   # QDate des Montags
+        self._holidays = {}       # Spalte -> freier Tag
+        self._lessons = {}        # lesson_id -> Stunde
+        self._cells = {}          # (Zeile, Spalte) -> (Stunde, Darstellung)
+        self._lesson_cells = {}   # lesson_id -> (Zeile, Spalte)
+
+    # Aufbau
+
+    def set_time_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Setzt die Zeilen (Zeitslots und Pausen) des Rasters.
+
+        Args:
+            rows: Liste von Dictionaries mit 'label' ("HH:MM - HH:MM" bzw.
+                  "Pause (...)"), 'is_pause' und 'height'
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._row_for_time = {
+            row['label'].split(" - ")[0]: index
+            for index, row in enumerate(self._rows)
+            if not row['is_pause']
+        }
+        self._rebuild_cells()
+        self.endResetModel()
+
+    def set_week(self, week_start: QDate, schedule: Dict[str, Any]) -> None:
+        """Lädt eine Woche in das Raster.
+
+        Die Zeilenstruktur bleibt gleich, daher genügt ein dataChanged über
+        das gesamte Raster; Zeilenhöhen der View bleiben erhalten.
+
+        Args:
+            week_start: Montag der Woche
+            schedule: Ergebnis von LessonController.get_week_schedule()
+        """
+        self._week_start = week_start
+        self._holidays = {}
+        for date_str, holiday in schedule['holidays'].items():
+            column = self._column_for_date(date_str)
+            if column is not None:
+                self._holidays[column] = holiday
+        self._lessons = {
+            lesson['id']: lesson
+            for date_str in sorted(schedule['lessons'])
+            for time in sorted(schedule['lessons'][date_str])
+            for lesson in schedule['lessons'][date_str][time]
+        }
+        self._rebuild_cells()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, len(self.WEEKDAYS) - 1)
+            )
+
+    def update_lesson(self, lesson: Dict[str, Any]) -> bool:
+        """Übernimmt eine geänderte Stunde in das Raster.
+
+        Args:
+            lesson: Stundendaten inkl. course_name und course_color
+
+        Returns:
+            True, wenn sich die Zellverbindungen (Position/Dauer) geändert haben
+        """
+        lesson_id = lesson['id']
+        old_lesson = self._lessons.get(lesson_id)
+        old_cell = self._lesson_cells.get(lesson_id)
+
+        if self._cell_for_lesson(lesson) is None:
+            return self.remove_lesson(lesson_id)
+
+        self._lessons[lesson_id] = lesson
+        self._rebuild_cells()
+        new_cell = self._lesson_cells.get(lesson_id)
+        self._emit_cells_changed([old_cell, new_cell])
+
+        return (old_lesson is None or old_cell != new_cell or
+                old_lesson.get('duration', 1) != lesson.get('duration', 1))
+
+    def remove_lesson(self, lesson_id: int) -> bool:
+        """Entfernt eine Stunde aus dem Raster.
+
+        Args:
+            lesson_id: ID der Stunde
+
+        Returns:
+            True, wenn die Stunde in dieser Woche angezeigt wurde
+        """
+        if lesson_id not in self._lessons:
+            return False
+        old_cell = self._lesson_cells.get(lesson_id)
+        del self._lessons[lesson_id]
+        self._rebuild_cells()
+        self._emit_cells_changed([old_cell])
+        return True
+
+    # Abfragen für die View
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Gibt die Zeilendefinitionen zurück."""
+        return self._rows
+
+    def row_for_time(self, time: str) -> int:
+        """Ermittelt die Zeile für eine Startzeit ("HH:MM"), sonst -1."""
+        return self._row_for_time.get(time, -1)
+
+    def start_time(self, row: int) -> Optional[str]:
+        """Gibt die Startzeit einer Stundenzeile zurück, bei Pausen None."""
+        if not 0 <= row < len(self._rows) or self._rows[row]['is_pause']:
+            return None
+        return self._rows[row]['label'].split(" - ")[0]
+
+    def is_pause_row(self, row: int) -> bool:
+        """Prüft, ob eine Zeile eine Pausenzeile ist."""
+        return 0 <= row < len(self._rows) and self._rows[row]['is_pause']
+
+    def lesson_id(self, index: QModelIndex) -> Optional[int]:
+        """Gibt die ID der Stunde in einer Zelle zurück."""
+        cell = self._cells.get((index.row(), index.column()))
+        return cell[0]['id'] if cell else None
+
+    def spans(self) -> List[Tuple[int, int, int]]:
+        """Gibt die Zellverbindungen für Doppelstunden zurück.
+
+        Returns:
+            Liste von (Zeile, Spalte, Zeilenanzahl)
+        """
+        return [
+            (row, column, 2)
+            for (row, column), (lesson, _) in self._cells.items()
+            if lesson.get('duration', 1) == 2 and row < len(self._rows) - 1
+        ]
+
+    # QAbstractTableModel
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.WEEKDAYS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.WEEKDAYS[section] if section < len(self.WEEKDAYS) else None
+        return self._rows[section]['label'] if section < len(self._rows) else None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if self._rows[row]['is_pause']:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return QBrush(self.PAUSE_COLOR)
+            if role == Qt.ItemDataRole.DisplayRole:
+                return ""
+            return None
+
+        cell = self._cells.get((row, column))
+        if cell:
+            lesson, display = cell
+            if role == Qt.ItemDataRole.DisplayRole:
+                return display['html']
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return display['background']
+            if role == Qt.ItemDataRole.UserRole:
+                return lesson['id']
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+            return None
+
+        holiday = self._holidays.get(column)
+        if holiday:
+            return self._holiday_data(holiday, row, role)
+        return None
+
+    # Interne Hilfsmethoden
+
+    def _column_for_date(self, date_str: str) -> Optional[int]:
+        """Spalte für ein Datum der aktuellen Woche oder None."""
+        if self._week_start is None:
+            return None
+        column = self._week_start.daysTo(QDate.fromString(date_str, "yyyy-MM-dd"))
+        return column if 0 <= column < len(self.WEEKDAYS) else None
+
+    def _cell_for_lesson(self, lesson: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Zelle (Zeile, Spalte) einer Stunde oder None, wenn nicht sichtbar."""
+        column = self._column_for_date(lesson['date'])
+        row = self._row_for_time.get(lesson['time'])
+        if column is None or row is None:
+            return None
+        return (row, column)
+
+    def _rebuild_cells(self) -> None:
+        """Ordnet alle Stunden der Woche ihren Zellen zu.
+
+        Liegen mehrere Stunden in derselben Zelle, wird die letzte angezeigt.
+        """
+        self._cells = {}
+        self._lesson_cells = {}
+        for lesson in sorted(self._lessons.values(),
+                             key=lambda l: (l['date'], l['time'], l['id'])):
+            cell = self._cell_for_lesson(lesson)
+            if cell is None:
+                continue
+            previous = self._cells.get(cell)
+            if previous:
+                del self._lesson_cells[previous[0]['id']]
+            self._cells[cell] = (lesson, self._render_lesson(lesson, self._holidays.get(cell[1])))
+            self._lesson_cells[lesson['id']] = cell
+
+    def _emit_cells_changed(self, cells) -> None:
+        """Sendet dataChanged für die angegebenen Zellen."""
+        for cell in set(c for c in cells if c is not None):
+            index = self.index(*cell)
+            self.dataChanged.emit(index, index)
+
+    def _render_lesson(self, lesson: Dict[str, Any],
+                       holiday: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Erzeugt HTML und Hintergrund für eine Stunde."""
+        # Basis-Text formatieren
+        text = f"<b>{lesson['subject']} {lesson['course_name']}</b>"
+        if lesson.get('topic'):
+            text += f"<br>{lesson['topic']}"
+
+        status = lesson.get('status') or 'normal'
+        status_note = lesson.get('status_note')
+        if holiday:
+            # An freien Tagen entfällt die Stunde immer
+            status = 'cancelled'
+            reason = "Feiertag" if holiday['type'] == 'holiday' else "Ferien"
+            status_note = f"Entfällt wegen {reason}: {holiday['name']}"
+
+        # Status-spezifische Formatierung
+        if status == 'cancelled':
+            # Deutlichere Markierung für entfallene Stunden
+            text = (f"<div style='color: #999999;'>"  # Grauer Text
+                f"<s>{text}</s>"          # Durchgestrichen
+                f"<br>⛔ <small>{status_note or 'Entfällt'}</small>"  # Entfallen-Symbol und Grund
+                f"</div>")
+            # Sehr heller Hintergrund mit rötlichem Ton
+            color = QColor(255, 240, 240)
+            if lesson.get('course_color'):
+                base_color = QColor(lesson['course_color'])
+                color = QColor(
+                    min(255, base_color.red() + 200),
+                    min(255, base_color.green() + 180),
+                    min(255, base_color.blue() + 180),
+                    40  # Sehr transparent
+                )
+        elif status == 'moved':
+            # Kursiv mit Pfeil
+            text = f"<i>{text} →</i>"
+            if status_note:
+                text += f"<br><small>{status_note}</small>"
+            color = QColor('#FFFFD0')  # Hellgelb
+        elif status == 'substituted':
+            # Symbol für Vertretung
+            text = f"🔄 {text}"
+            if status_note:
+                text += f"<br><small>{status_note}</small>"
+            color = self._background_color(lesson)
+        else:
+            # Normale Stunde
+            color = self._background_color(lesson)
+
+        return {'html': text, 'background': QBrush(color)}
+
+    def _background_color(self, lesson: Dict[str, Any]) -> QColor:
+        """Ermittelt die Hintergrundfarbe für eine Stunde."""
+        if lesson.get('course_color'):
+            color = QColor(lesson['course_color'])
+        else:
+            color = QColor(self.SUBJECT_COLORS.get(lesson['subject'], '#FFFFFF'))
+
+        # Standard-Alpha für normale Stunden
+        color.setAlpha(40)
+        return color
+
+    def _holiday_data(self, holiday: Dict[str, Any], row: int, role):
+        """Daten einer leeren Zelle in einer Feiertags-/Ferienspalte."""
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return QBrush(self.HOLIDAY_COLORS.get(holiday['type'], QColor("#FFFFFF")))
+
+        # In der ersten Zeile den Namen anzeigen
+        if row != 0:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{self.HOLIDAY_ICONS.get(holiday['type'], '')} {holiday['name']}"
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole:
+            kind = {'holiday': 'Feiertag', 'vacation_day': 'Ferien'}.get(holiday['type'], 'Schulfrei')
+            return f"{kind}\n{holiday['name']}"
+        if role == Qt.ItemDataRole.FontRole and holiday['type'] == 'holiday':
+            # Fett für Feiertage
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
@@ -1,10 +1,14 @@
 # src/views/week_view.py
 
-from PyQt6.QtWidgets import (QWidget, QTableWidget, QTableWidgetItem, QHeaderView,
+import logging
+
+from PyQt6.QtWidgets import (QWidget, QTableView, QHeaderView,
                            QVBoxLayout, QMenu, QStyledItemDelegate, QMessageBox, QStyle)
 from PyQt6.QtCore import Qt, QDate, pyqtSignal, QSize
-from PyQt6.QtGui import QColor, QBrush, QTextDocument, QAbstractTextDocumentLayout
+from PyQt6.QtGui import QTextDocument, QAbstractTextDocumentLayout
+from collections import OrderedDict
 from .week_navigator import WeekNavigator
+from .week_table_model import WeekTableModel
 
 class WeekView(QWidget):
     """Widget zur Anzeige des Wochenstundenplans"""
@@ -12,10 +16,26 @@ class WeekView(QWidget):
     # Signal für Kontextmenü-Interaktionen
     lesson_clicked = pyqtSignal(int)  # Sendet lesson_id
     
+    # Ab dieser Anzahl geänderter Stunden wird die ganze Woche neu geladen
+    MAX_SINGLE_REFRESH = 5
+    
+    # Anzahl zwischengespeicherter Wochen (inkl. vorgeladener Nachbarwochen)
+    WEEK_CACHE_SIZE = 8
+    
+    # Tabellen, deren Änderungen die zwischengespeicherten Wochen betreffen
+    CACHED_TABLES = ('lessons', 'public_holidays', 'school_holidays')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.current_week = QDate.currentDate()
+        # Montag ("yyyy-MM-dd") -> Ergebnis von get_week_schedule()
+        self._week_cache = OrderedDict()
+        # Wird bei jeder relevanten Änderung erhöht; verwirft überholte Vorladungen
+        self._cache_generation = 0
+        self.logger = logging.getLogger(__name__)
+        if hasattr(self.parent, 'db'):
+            self.parent.db.add_change_listener(self.on_data_changed)
         self.setup_ui()
         self.setup_context_menu()
 
@@ -31,26 +51,24 @@ class WeekView(QWidget):
         self.week_navigator.week_changed.connect(self.update_view)
         layout.addWidget(self.week_navigator)
         
-        # Tabelle erstellen (bisheriger Code)
-        self.table = QTableWidget()
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Tabelle mit Wochenmodell erstellen
+        self.model = WeekTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
         # HTML-Delegate setzen
         self.table.setItemDelegate(HTMLDelegate(self.table))
         
-        self.table.setColumnCount(5)
-        weekdays = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']
-        self.table.setHorizontalHeaderLabels(weekdays)
-        
         self.update_time_slots()
         
         header = self.table.horizontalHeader()
-        for i in range(5):
+        for i in range(self.model.columnCount()):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
         
         self.table.setShowGrid(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 gridline-color: #d0d0d0;
             }
@@ -93,24 +111,6 @@ class WeekView(QWidget):
                     all_rows.append({"label": time_label, "is_pause": False, "height": 60})
                     
                     last_end_time = end_time
-                
-                # Tabelle aktualisieren
-                self.table.setRowCount(len(all_rows))
-                time_labels = []
-                
-                for row, data in enumerate(all_rows):
-                    time_labels.append(data["label"])
-                    self.table.setRowHeight(row, data["height"])
-                    
-                    # Pausen visuell kennzeichnen
-                    if data["is_pause"]:
-                        pause_item = QTableWidgetItem("")
-                        pause_item.setBackground(QColor("#dee2e6"))
-                        self.table.setItem(row, 0, pause_item)
-                        # Verbinde alle Spalten zu einer
-                        self.table.setSpan(row, 0, 1, self.table.columnCount())
-                
-                self.table.setVerticalHeaderLabels(time_labels)
             else:
                 # Fallback auf Standardzeiten
                 standard_times = [
@@ -120,14 +120,26 @@ class WeekView(QWidget):
                     "13:30 - 14:15", "14:15 - 15:00",
                     "15:00 - 15:45", "15:45 - 16:30"
                 ]
-                self.table.setRowCount(len(standard_times))
-                self.table.setVerticalHeaderLabels(standard_times)
-                for i in range(len(standard_times)):
-                    self.table.setRowHeight(i, 60)
+                all_rows = [{"label": label, "is_pause": False, "height": 60}
+                            for label in standard_times]
+            
+            self.model.set_time_rows(all_rows)
+            for row, data in enumerate(all_rows):
+                self.table.setRowHeight(row, data["height"])
+            self.apply_spans()
                 
         except Exception as e:
             print(f"Fehler beim Aktualisieren der Zeitslots: {str(e)}")
 
+    def apply_spans(self):
+        """Verbindet Pausenzeilen über alle Spalten und Doppelstunden über zwei Zeilen"""
+        self.table.clearSpans()
+        for row, data in enumerate(self.model.rows()):
+            if data["is_pause"]:
+                self.table.setSpan(row, 0, 1, self.model.columnCount())
+        for row, column, row_count in self.model.spans():
+            self.table.setSpan(row, column, row_count, 1)
+
     def setup_context_menu(self):
         """Richtet das Kontextmenü ein"""
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -135,20 +147,18 @@ class WeekView(QWidget):
 
     def show_context_menu(self, pos):
         """Zeigt das Kontextmenü an der Mausposition"""
-        item = self.table.itemAt(pos)
+        index = self.table.indexAt(pos)
         menu = QMenu()
         
-        row = self.table.rowAt(pos.y())
-        col = self.table.columnAt(pos.x())
+        row = index.row()
+        col = index.column()
         
         # Prüfe ob es eine Pausenzeile ist
-        if row >= 0:
-            header_text = self.table.verticalHeaderItem(row).text()
-            if header_text.startswith("Pause"):
-                return  # Kein Menü für Pausenzeilen
+        if self.model.is_pause_row(row):
+            return  # Kein Menü für Pausenzeilen
         
-        if item and item.data(Qt.ItemDataRole.UserRole):  # Wenn Stunde existiert
-            lesson_id = item.data(Qt.ItemDataRole.UserRole)
+        lesson_id = self.model.lesson_id(index) if index.isValid() else None
+        if lesson_id:  # Wenn Stunde existiert
             edit_action = menu.addAction("Bearbeiten")
             delete_action = menu.addAction("Löschen")
             
@@ -158,8 +168,8 @@ class WeekView(QWidget):
                 
             if action == edit_action:
                 if hasattr(self.parent, 'list_manager'):
+                    # Der ListManager aktualisiert die geänderten Stunden
                     self.parent.list_manager.edit_lesson(lesson_id)
-                    self.update_view(self.week_navigator.current_week_start)
             elif action == delete_action:
                 if hasattr(self.parent, 'list_manager'):
                     self.parent.list_manager.delete_lesson(lesson_id)
@@ -179,9 +189,10 @@ class WeekView(QWidget):
             # Datum bestimmen: Montag + Anzahl Tage der Spalte
             date = self.week_navigator.current_week_start.addDays(col)
             
-            # Zeit aus der Zeilenbeschriftung extrahieren
-            time_label = self.table.verticalHeaderItem(row).text()
-            time = time_label.split(" - ")[0]  # Nehme nur die Startzeit
+            # Startzeit der Zeile aus dem Modell
+            time = self.model.start_time(row)
+            if time is None:
+                return
             
             # Delegation an ListManager
             if hasattr(self.parent, 'list_manager'):
@@ -193,164 +204,109 @@ class WeekView(QWidget):
 
     def update_view(self, week_start: QDate):
         """Aktualisiert die Ansicht für die gewählte Woche"""
+        schedule = self.load_week(week_start)
+        self.model.set_week(week_start, schedule)
+        self.apply_spans()
         
-        self.table.clearContents()
+        # Nachbarwochen im ReadWorker vorladen
+        self.prefetch_adjacent_weeks(week_start)
+
+    def load_week(self, week_start: QDate) -> dict:
+        """Holt Stunden und freie Tage einer Woche (Mo-Fr), bevorzugt aus dem Cache"""
+        key = week_start.toString("yyyy-MM-dd")
+        schedule = self._week_cache.get(key)
+        if schedule is not None:
+            self._week_cache.move_to_end(key)
+            return schedule
         
-        # Hole die Feiertage für diese Woche
-        holidays = self.parent.holiday_manager.get_holidays_for_week(
-            week_start.toPyDate()
+        # Stunden und freie Tage der Woche in einem Aufruf holen
+        schedule = self.parent.controllers.lesson.get_week_schedule(
+            key,
+            week_start.addDays(4).toString("yyyy-MM-dd")
         )
+        self._cache_week(key, schedule)
+        return schedule
+
+    def prefetch_adjacent_weeks(self, week_start: QDate):
+        """Lädt die vorherige und die nächste Woche im Hintergrund in den Cache"""
+        loader = getattr(self.parent, 'loader', None)
+        if loader is None:
+            return  # Ohne ReadWorker wird nur bei Bedarf geladen
         
-        # Erstelle ein Dict für schnellen Zugriff auf Feiertage
-        holiday_dict = {h['date']: h for h in holidays}
-        
-        # Hole die Daten für jeden Tag der Woche
-        current_date = week_start
-        for day in range(5):  # Mo-Fr
-            date_str = current_date.toString("yyyy-MM-dd")
-            lessons = self.parent.controllers.lesson.get_lessons_by_date(date_str)
-            
-            # Prüfe ob der Tag ein Feiertag/Ferientag ist
-            is_holiday = date_str in holiday_dict
-            if is_holiday:
-                holiday = holiday_dict[date_str]
-                self.mark_holiday(day, holiday)
-                
-                # Markiere die Stunden als entfallen
-                for lesson in lessons:
-                    time = lesson['time']
-                    row = self.get_row_for_time(time)
-                    if row >= 0:
-                        lesson['status'] = 'cancelled'  # Status auf cancelled setzen
-                        # Grund für das Entfallen hinzufügen
-                        reason = "Feiertag" if holiday['type'] == 'holiday' else "Ferien"
-                        lesson['status_note'] = f"Entfällt wegen {reason}: {holiday['name']}"
-                        item = self.create_lesson_item(lesson)
-                        self.table.setItem(row, day, item)
-                        
-                        if lesson.get('duration', 1) == 2 and row < self.table.rowCount() - 1:
-                            self.table.setSpan(row, day, 2, 1)
-                            if self.table.item(row + 1, day):
-                                self.table.takeItem(row + 1, day)
-            else:
-                # Normale Stunden anzeigen
-                for lesson in lessons:
-                    time = lesson['time']
-                    row = self.get_row_for_time(time)
-                    if row >= 0:
-                        item = self.create_lesson_item(lesson)
-                        self.table.setItem(row, day, item)
-                        
-                        if lesson.get('duration', 1) == 2 and row < self.table.rowCount() - 1:
-                            self.table.setSpan(row, day, 2, 1)
-                            if self.table.item(row + 1, day):
-                                self.table.takeItem(row + 1, day)
-            
-            current_date = current_date.addDays(1)
+        generation = self._cache_generation
+        for offset in (7, -7):
+            neighbour = week_start.addDays(offset)
+            key = neighbour.toString("yyyy-MM-dd")
+            if key in self._week_cache:
+                continue
+            loader.load(
+                f"week_prefetch:{key}",
+                lambda controllers, start, end: controllers.lesson.get_week_schedule(start, end),
+                key, neighbour.addDays(4).toString("yyyy-MM-dd"),
+                on_done=lambda schedule, key=key: self._store_prefetched(key, schedule, generation),
+                # Vorladen ist optional, Fehler zeigen sich spätestens beim Anzeigen
+                on_error=lambda e: self.logger.warning(
+                    f"Fehler beim Vorladen der Nachbarwochen: {str(e)}")
+            )
 
-    def get_row_for_time(self, time: str) -> int:
-        """Ermittelt die Tabellenzeile für eine bestimmte Uhrzeit"""
-        for row in range(self.table.rowCount()):
-            header_text = self.table.verticalHeaderItem(row).text()
-            if not header_text.startswith("Pause"):  # Pausenzeilen ignorieren
-                start_time = header_text.split(" - ")[0]
-                if start_time == time:
-                    return row
-        return -1
+    def _store_prefetched(self, key: str, schedule: dict, generation: int):
+        """Übernimmt eine vorgeladene Woche (im GUI-Thread)"""
+        if generation != self._cache_generation or key in self._week_cache:
+            return  # Inzwischen geändert oder bereits geladen
+        self._cache_week(key, schedule)
 
-    def create_lesson_item(self, lesson):
-        """Erstellt ein TableWidgetItem für eine Unterrichtsstunde"""
-        item = QTableWidgetItem()
-        
-        # Basis-Text formatieren
-        text = f"<b>{lesson['subject']} {lesson['course_name']}</b>"
-        if lesson.get('topic'):
-            text += f"<br>{lesson['topic']}"
+    def _cache_week(self, key: str, schedule: dict):
+        """Legt eine Woche im Cache ab und verdrängt die älteste"""
+        self._week_cache[key] = schedule
+        # Die angezeigte Woche nicht als erste verdrängen
+        current_key = self.week_navigator.current_week_start.toString("yyyy-MM-dd")
+        if current_key in self._week_cache:
+            self._week_cache.move_to_end(current_key)
+        if len(self._week_cache) > self.WEEK_CACHE_SIZE:
+            self._week_cache.popitem(last=False)
 
-        # Status-spezifische Formatierung
-        status = lesson.get('status', 'normal')
-        if status == 'cancelled':
-            # Deutlichere Markierung für entfallene Stunden
-            text = (f"<div style='color: #999999;'>"  # Grauer Text
-                f"<s>{text}</s>"          # Durchgestrichen
-                f"<br>⛔ <small>{lesson.get('status_note', 'Entfällt')}</small>"  # Entfallen-Symbol und Grund
-                f"</div>")
-            # Sehr heller Hintergrund mit rötlichem Ton
-            color = QColor(255, 240, 240)
-            if lesson.get('course_color'):
-                base_color = QColor(lesson['course_color'])
-                color = QColor(
-                    min(255, base_color.red() + 200),
-                    min(255, base_color.green() + 180),
-                    min(255, base_color.blue() + 180),
-                40  # Sehr transparent
-                )
-        elif status == 'moved':
-            # Kursiv mit Pfeil
-            text = f"<i>{text} →</i>"
-            if lesson.get('status_note'):
-                text += f"<br><small>{lesson['status_note']}</small>"
-            color = QColor('#FFFFD0')  # Hellgelb
-        elif status == 'substituted':
-            # Symbol für Vertretung
-            text = f"🔄 {text}"
-            if lesson.get('status_note'):
-                text += f"<br><small>{lesson['status_note']}</small>"
-            color = self.get_background_color(lesson)
-        else:
-            # Normale Stunde
-            color = self.get_background_color(lesson)
-                
-        item.setText(text)
-        item.setData(Qt.ItemDataRole.UserRole, lesson['id'])
-        
-        # Zentrieren und Mehrzeiligkeit erlauben
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
+    def on_data_changed(self, table: str, start_date, end_date):
+        """Verwirft zwischengespeicherte Wochen, die von einer Änderung betroffen sind"""
+        if table not in self.CACHED_TABLES:
+            return
+        self._cache_generation += 1
+        for key in list(self._week_cache):
+            week_end = QDate.fromString(key, "yyyy-MM-dd").addDays(4).toString("yyyy-MM-dd")
+            if (start_date is None or start_date <= week_end) and \
+               (end_date is None or end_date >= key):
+                del self._week_cache[key]
+
+    def refresh_lessons(self, lesson_ids):
+        """Aktualisiert einzelne geänderte Stunden, ohne die Woche neu zu laden"""
+        if len(lesson_ids) > self.MAX_SINGLE_REFRESH:
+            self.update_view(self.week_navigator.current_week_start)
+            return
         
-        # Hintergrundfarbe setzen
-        item.setBackground(QBrush(color))
+        spans_changed = False
+        for lesson_id in lesson_ids:
+            lesson = self.parent.controllers.lesson.get_lesson(lesson_id)
+            if lesson:
+                spans_changed |= self.model.update_lesson(lesson)
+            else:
+                spans_changed |= self.model.remove_lesson(lesson_id)
         
-        return item
+        if spans_changed:
+            self.apply_spans()
 
-    def get_subject_color(self, subject):
-        """Gibt eine Farbe für ein Fach zurück"""
-        # Farbzuordnung für Fächer
-        colors = {
-            'Mathematik': QColor('#FFE5E5'),  # Hellrot
-            'Deutsch': QColor('#E5FFE5'),     # Hellgrün
-            'Englisch': QColor('#E5E5FF'),    # Hellblau
-            'Geschichte': QColor('#FFE5FF'),   # Helllila
-            'Biologie': QColor('#FFFFE5'),    # Hellgelb
-            'Physik': QColor('#E5FFFF'),      # Helltürkis
-            'Chemie': QColor('#FFE5E5'),      # Hellrot
-            'Kunst': QColor('#FFE5FF'),       # Helllila
-            'Musik': QColor('#E5FFE5'),       # Hellgrün
-        }
-        return colors.get(subject, QColor('#FFFFFF'))  # Weiß als Standard
-
-    def get_background_color(self, lesson):
-        """Ermittelt die Hintergrundfarbe für eine Stunde"""
-        if lesson.get('course_color'):
-            color = QColor(lesson['course_color'])
-        else:
-            color = self.get_subject_color(lesson['subject'])
-        
-        # Standard-Alpha für normale Stunden
-        color.setAlpha(40)
-        return color
+    def get_row_for_time(self, time: str) -> int:
+        """Ermittelt die Tabellenzeile für eine bestimmte Uhrzeit"""
+        return self.model.row_for_time(time)
 
     def on_cell_double_clicked(self, index):
         """Handler für Doppelklick auf eine Zelle"""
         try:
-            item = self.table.item(index.row(), index.column())
-            if item and item.data(Qt.ItemDataRole.UserRole):
-                lesson_id = item.data(Qt.ItemDataRole.UserRole)
-                
+            lesson_id = self.model.lesson_id(index)
+            if lesson_id:
                 from src.views.dialogs.lesson_details_dialog import LessonDetailsDialog
                 dialog = LessonDetailsDialog(self.parent, lesson_id)
                 if dialog.exec():
-                    # Nach Schließen des Dialogs View aktualisieren
-                    self.update_view(self.week_navigator.current_week_start)
+                    # Nach Schließen des Dialogs nur diese Stunde aktualisieren
+                    self.refresh_lessons([lesson_id])
                     
         except Exception as e:
             QMessageBox.critical(
@@ -359,58 +315,57 @@ class WeekView(QWidget):
                 f"Fehler beim Öffnen der Stundendetails: {str(e)}"
             )
 
-    def mark_holiday(self, column: int, holiday: dict):
-        """Markiert eine Spalte als Feiertag/Ferientag"""
-        # Farben für verschiedene Arten von freien Tagen
-        colors = {
-            'holiday': QColor(255, 230, 230, 100),     # Hellrot mit Transparenz
-            'vacation_day': QColor(230, 255, 230, 100), # Hellgrün mit Transparenz
-            'school': QColor(230, 230, 255, 100)       # Hellblau mit Transparenz
-        }
-        
-        # Icons für verschiedene Typen
-        icons = {
-            'holiday': "★",    # Stern für Feiertag
-            'vacation_day': "☼", # Sonne für Ferien
-            'school': "✎"      # Stift für Schulfrei
-        }
-        
-        color = colors.get(holiday['type'], QColor("#FFFFFF"))
-        icon = icons.get(holiday['type'], "")
-        
-        # Färbe die ganze Spalte ein
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, column)
-            if not item:
-                item = QTableWidgetItem()
-                self.table.setItem(row, column, item)
-            
-            # Setze Hintergrundfarbe
-            item.setBackground(color)
-            
-            # In der ersten Zeile den Namen anzeigen
-            if row == 0:
-                item.setText(f"{icon} {holiday['name']}")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Fett für Feiertage
-                if holiday['type'] == 'holiday':
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                
-                tooltip = (f"{'Feiertag' if holiday['type'] == 'holiday' else 'Ferien' if holiday['type'] == 'vacation_day' else 'Schulfrei'}\n"
-                        f"{holiday['name']}")
-                item.setToolTip(tooltip)
-                
-                # Zellen verbinden für bessere Lesbarkeit des Namens
-                self.table.setSpan(0, column, 1, 1)
-
 
 
 class HTMLDelegate(QStyledItemDelegate):
+    """Zeichnet Zellen mit HTML-Inhalt.
+    
+    Geparste und gelayoutete QTextDocuments werden in einem LRU-Cache
+    gehalten, damit beim Neuzeichnen nicht jede Zelle erneut geparst und
+    gelayoutet wird. Da der Text nicht umgebrochen wird, hängt das Layout
+    nicht von der Zellbreite ab; Schlüssel sind HTML und Device-Pixel-Ratio.
+    Ändert sich der Zellinhalt, ergibt das einen neuen Schlüssel, veraltete
+    Einträge fallen nach LRU heraus.
+    """
+    
+    CACHE_SIZE = 256
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.doc = QTextDocument(self)
+        self._doc_cache = OrderedDict()
+
+    def clear_cache(self):
+        """Verwirft alle zwischengespeicherten Dokumente."""
+        for doc in self._doc_cache.values():
+            doc.deleteLater()
+        self._doc_cache.clear()
+
+    def _document(self, html: str, pixel_ratio: float) -> QTextDocument:
+        """Liefert ein gelayoutetes Dokument aus dem Cache oder legt es an.
+        
+        Args:
+            html: HTML-Inhalt der Zelle
+            pixel_ratio: Device-Pixel-Ratio des Zielgeräts
+            
+        Returns:
+            QTextDocument mit fertigem Layout
+        """
+        key = (html, pixel_ratio)
+        doc = self._doc_cache.get(key)
+        if doc is not None:
+            self._doc_cache.move_to_end(key)
+            return doc
+        
+        doc = QTextDocument(self)
+        doc.setHtml(html)
+        # Layout einmalig berechnen, danach liefert size() den gespeicherten Wert
+        doc.size()
+        
+        self._doc_cache[key] = doc
+        if len(self._doc_cache) > self.CACHE_SIZE:
+            _, old_doc = self._doc_cache.popitem(last=False)
+            old_doc.deleteLater()
+        return doc
 
     def paint(self, painter, option, index):
         painter.save()
@@ -420,8 +375,8 @@ class HTMLDelegate(QStyledItemDelegate):
         if background:
             painter.fillRect(option.rect, background)
                 
-        # Setze den HTML-Content
-        self.doc.setHtml(index.data())
+        # Gelayoutetes Dokument für den HTML-Content holen
+        doc = self._document(index.data() or "", painter.device().devicePixelRatioF())
         
         # Text-Ränder
         margin = 5
@@ -429,7 +384,7 @@ class HTMLDelegate(QStyledItemDelegate):
         
         # Zentriere den Text vertikal
         clip_rect = text_rect
-        text_height = self.doc.size().height()
+        text_height = doc.size().height()
         if text_height < text_rect.height():
             y_offset = int((text_rect.height() - text_height) // 2)
             text_rect.moveTop(text_rect.top() + y_offset)
@@ -437,10 +392,11 @@ class HTMLDelegate(QStyledItemDelegate):
         # Zeichne den Text
         painter.translate(text_rect.topLeft())
         painter.setClipRect(clip_rect.translated(-text_rect.topLeft()))
-        self.doc.documentLayout().draw(painter, QAbstractTextDocumentLayout.PaintContext())
+        doc.documentLayout().draw(painter, QAbstractTextDocumentLayout.PaintContext())
         
         painter.restore()
 
     def sizeHint(self, option, index):
-        self.doc.setHtml(index.data())
-        return QSize(self.doc.idealWidth(), self.doc.size().height())
\ No newline at end of file
+        pixel_ratio = option.widget.devicePixelRatioF() if option.widget else 1.0
+        doc = self._document(index.data() or "", pixel_ratio)
+        return QSize(int(doc.idealWidth()), int(doc.size().height()))
@@ -0,0 +1,95 @@
+# tests/conftest.py
+
+import json
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Projektwurzel importierbar machen; Qt ohne Bildschirm
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Frische Datenbank, deren Schema über die Migrationen angelegt wird."""
+    manager = DatabaseManager(str(tmp_path / 'test.db'))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """Eine QApplication für alle Widget-Tests."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+class _JsonServer:
+    """Lokaler HTTP-Server mit einer JSON-Antwort samt ETag.
+
+    Die Antwort lässt sich in den Tests ändern; jede Anfrage wird mit
+    ihren Headern und dem gesendeten Status in `requests` festgehalten.
+    """
+
+    def __init__(self):
+        self.body = []
+        self.etag = '"v1"'
+        self.cache_control = 'max-age=0'
+        self.requests = []  # (Pfad, Header, Status)
+        self.url = None
+
+    def handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.headers.get('If-None-Match') == server.etag:
+                    status, payload = 304, b''
+                else:
+                    status, payload = 200, json.dumps(server.body).encode()
+                server.requests.append((self.path, dict(self.headers), status))
+                self.send_response(status)
+                self.send_header('ETag', server.etag)
+                self.send_header('Cache-Control', server.cache_control)
+                if status == 200:
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def http_server():
+    """Startet einen _JsonServer auf einem freien Port."""
+    server = _JsonServer()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), server.handler())
+    server.url = f"http://127.0.0.1:{httpd.server_port}/"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def silent_server():
+    """Nimmt Verbindungen an, antwortet aber nie (provoziert Timeouts)."""
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(8)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}/"
+    sock.close()
@@ -0,0 +1,35 @@
+# tests/test_analysis_widget.py
+
+import time
+
+from PyQt6.QtWidgets import QMessageBox, QWidget
+
+from src.controllers.read_worker import ReadWorker
+from src.views.async_loader import AsyncLoader
+from src.views.student.analysis_widget import AnalysisWidget
+
+
+def test_load_error_is_shown(qapp, db, monkeypatch):
+    window = QWidget()
+    worker = ReadWorker(db.db_file)
+    window.loader = AsyncLoader(worker, window)
+    shown = []
+    monkeypatch.setattr(QMessageBox, 'critical', lambda *args: shown.append(args[2]))
+    monkeypatch.setattr(
+        AnalysisWidget, '_fetch_analysis',
+        staticmethod(lambda controllers, student_id: 1 / 0)
+    )
+    try:
+        tab = QWidget(window)
+        tab.main_window = window
+        widget = AnalysisWidget(tab)
+        widget.load_analysis(1)
+
+        deadline = time.monotonic() + 5
+        while not shown and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        assert shown and shown[0].startswith("Fehler beim Laden der Auswertung")
+    finally:
+        worker.shutdown()
+        window.deleteLater()
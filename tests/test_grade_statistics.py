@@ -0,0 +1,138 @@
+# tests/test_grade_statistics.py
+
+"""
+Prüft GradeStatistics gegen von Hand gerechnete Werte.
+
+Noten 1, 2, 3, 4 mit Gewichten 1, 2, 1, 1:
+    Mittelwert          (1+2+3+4) / 4                 = 2.5
+    gewichtet           (1 + 4 + 3 + 4) / 5           = 2.4
+    Std. (gewichtet)    sqrt((1.96 + 2*0.16 + 0.36 + 2.56) / 5)
+                        = sqrt(1.04)                  = 1.02
+    Perzentile (linear) 10: 1.3, 25: 1.75, 50: 2.5, 75: 3.25, 90: 3.7
+"""
+
+import pytest
+
+from src.controllers import AssessmentController, StudentController
+from src.models.grade_statistics import GradeStatistics
+
+# (grade, weight, assessment_type_id, student_id, course_id)
+ROWS = [
+    (1.0, 1.0, 10, 1, 100),
+    (2.0, 2.0, 10, 2, 100),
+    (3.0, 1.0, 20, 1, 200),
+    (4.0, 1.0, 20, 2, 200),
+]
+
+
+def test_summary():
+    summary = GradeStatistics(ROWS).summary()
+    assert summary['count'] == 4
+    assert summary['mean'] == 2.5
+    assert summary['weighted_mean'] == 2.4
+    assert summary['median'] == 2.5
+    assert summary['std'] == 1.02
+    assert summary['best'] == 1.0
+    assert summary['worst'] == 4.0
+    assert summary['percentiles'] == {10: 1.3, 25: 1.75, 50: 2.5, 75: 3.25, 90: 3.7}
+
+
+def test_grouped():
+    by_type = GradeStatistics(ROWS).by_type()
+    # Typ 10: (1*1 + 2*2) / 3 = 1.67, Typ 20: (3 + 4) / 2 = 3.5
+    assert by_type[10]['weighted_mean'] == 1.67
+    assert by_type[10]['mean'] == 1.5
+    assert by_type[20]['weighted_mean'] == 3.5
+    assert by_type[20]['median'] == 3.5
+    assert GradeStatistics(ROWS).by(['a', 'b', 'a', 'b'])['a']['mean'] == 2.0
+
+
+def test_student_means_and_distribution():
+    stats = GradeStatistics(ROWS)
+    # Schüler 1: (1 + 3) / 2 = 2.0, Schüler 2: (2*2 + 4) / 3 = 2.67
+    assert stats.student_means() == {1: 2.0, 2: 2.67}
+    assert stats.distribution([1, 2, 3, 4, 5, 6]) == {
+        1.0: 1, 2.0: 1, 3.0: 1, 4.0: 1, 5.0: 0, 6.0: 0
+    }
+
+
+def test_missing_weight_counts_as_one():
+    stats = GradeStatistics([(2.0, None, 1, 1, 1), (4.0, 3.0, 1, 1, 1)])
+    # (2*1 + 4*3) / 4 = 3.5
+    assert stats.summary()['weighted_mean'] == 3.5
+
+
+def test_empty():
+    summary = GradeStatistics([]).summary()
+    assert summary['count'] == 0
+    assert summary['mean'] is None
+    assert GradeStatistics([]).by_type() == {}
+
+
+@pytest.fixture
+def course(db):
+    course_id = db.courses.add("Mathe 5a")
+    type_ids = [
+        db.execute(
+            "INSERT INTO assessment_types (course_id, name, weight) VALUES (?, ?, 1.0)",
+            (course_id, name)
+        ).lastrowid
+        for name in ("Mündlich", "Schriftlich")
+    ]
+    student_ids = [
+        db.execute(
+            "INSERT INTO students (first_name, last_name) VALUES (?, ?)", (name, "Muster")
+        ).lastrowid
+        for name in ("Anna", "Ben")
+    ]
+    for grade, weight, type_index, student_index in [
+            (1.0, 1.0, 0, 0), (2.0, 2.0, 0, 1), (3.0, 1.0, 1, 0), (4.0, 1.0, 1, 1)]:
+        db.execute(
+            """INSERT INTO assessments
+            (student_id, course_id, assessment_type_id, grade, weight, date)
+            VALUES (?, ?, ?, ?, ?, ?)""",
+            (student_ids[student_index], course_id, type_ids[type_index],
+             grade, weight, "2026-03-02")
+        )
+    return course_id
+
+
+def test_controller_statistics(db, course):
+    statistics = AssessmentController(db).get_assessment_statistics(course)
+    assert statistics['total']['total_count'] == 4
+    assert statistics['total']['average_grade'] == 2.5
+    assert statistics['total']['weighted_average'] == 2.4
+    assert statistics['by_type']['Mündlich']['weighted_average'] == 1.67
+    assert statistics['by_type']['Schriftlich']['best_grade'] == 3.0
+
+
+def test_area_averages():
+    grades = [
+        {'course_id': 1, 'competencies': {'Algebra': 1.5, 'Geometrie': 3.0}},
+        {'course_id': 2, 'competencies': {'Algebra': 2.5}},
+    ]
+    assert StudentController._area_averages(7, grades) == {'Algebra': 2.0, 'Geometrie': 3.0}
+
+
+def test_points_scale_reverses_best_and_worst():
+    stats = GradeStatistics(ROWS, higher_is_better=True)
+    assert (stats.summary()['best'], stats.summary()['worst']) == (4.0, 1.0)
+    assert (stats.by_type()[10]['best'], stats.by_type()[10]['worst']) == (2.0, 1.0)
+
+
+def test_controller_statistics_on_points_scale(db, course):
+    system_id = db.execute(
+        "SELECT id FROM grading_systems WHERE name = 'Oberstufe (0-15)'"
+    ).fetchone()['id']
+    template_id = db.execute(
+        """INSERT INTO assessment_type_templates (name, subject, grading_system_id)
+        VALUES ('Oberstufe', 'Mathe', ?)""",
+        (system_id,)
+    ).lastrowid
+    db.courses.update(course, "Mathe Q1", template_id=template_id)
+
+    controller = AssessmentController(db)
+    total = controller.get_assessment_statistics(course)['total']
+    assert (total['best_grade'], total['worst_grade']) == (4.0, 1.0)
+    summary = controller.get_grade_statistics([course])['summary']
+    assert (summary['best'], summary['worst']) == (4.0, 1.0)
@@ -0,0 +1,57 @@
+# tests/test_gradebook.py
+
+"""
+Beste und schlechteste Note im Notenbuch je nach Richtung der Notenskala.
+"""
+
+import pytest
+
+
+def _course(db, system_name):
+    system_id = db.execute(
+        "SELECT id FROM grading_systems WHERE name = ?", (system_name,)
+    ).fetchone()['id']
+    template_id = db.execute(
+        """INSERT INTO assessment_type_templates (name, subject, grading_system_id)
+        VALUES (?, ?, ?)""",
+        (system_name, "Mathe", system_id)
+    ).lastrowid
+    course_id = db.courses.add("Mathe", template_id=template_id)
+    type_id = db.execute(
+        "INSERT INTO assessment_types (course_id, name, weight) VALUES (?, 'Klausur', 1.0)",
+        (course_id,)
+    ).lastrowid
+    return course_id, type_id
+
+
+def _grade(db, course_id, type_id, grades):
+    for first_name, grade in grades:
+        student_id = db.execute(
+            "INSERT INTO students (first_name, last_name) VALUES (?, 'Muster')",
+            (first_name,)
+        ).lastrowid
+        db.execute(
+            "INSERT INTO student_courses (student_id, course_id) VALUES (?, ?)",
+            (student_id, course_id)
+        )
+        db.execute(
+            """INSERT INTO assessments
+            (student_id, course_id, assessment_type_id, grade, weight, date, topic)
+            VALUES (?, ?, ?, ?, 1.0, '2026-03-02', 'Klausur 1')""",
+            (student_id, course_id, type_id, grade)
+        )
+
+
+@pytest.mark.parametrize('system_name, grades, best, worst', [
+    ('Oberstufe (0-15)', [("Anna", 14.0), ("Ben", 5.0), ("Cem", 9.0)], 14.0, 5.0),
+    ('Unterstufe (1-6)', [("Anna", 2.0), ("Ben", 5.0), ("Cem", 3.0)], 2.0, 5.0),
+])
+def test_best_and_worst_follow_scale(db, system_name, grades, best, worst):
+    course_id, type_id = _course(db, system_name)
+    _grade(db, course_id, type_id, grades)
+
+    gradebook = db.assessments.get_gradebook(course_id)
+
+    (column,) = gradebook['columns']
+    assert (column['best'], column['worst']) == (best, worst)
+    assert (gradebook['final_stats']['best'], gradebook['final_stats']['worst']) == (best, worst)
@@ -0,0 +1,57 @@
+# tests/test_grading_scale_cache.py
+
+import pytest
+
+from src.controllers.read_worker import ReadWorker
+
+
+@pytest.fixture
+def course_id(db):
+    """Kurs mit Vorlage und Notensystem 1-6 in ganzen Noten."""
+    system_id = db.grading_systems.add("Noten 1-6", 1.0, 6.0, 1.0)
+    template_id = db.assessment_templates.add("Mathe", "Mathe", system_id)
+    return db.courses.add("Mathe 5a", template_id=template_id)
+
+
+@pytest.fixture
+def worker(db):
+    worker = ReadWorker(db.db_file)
+    yield worker
+    worker.shutdown()
+
+
+def _worker_grades(worker, course_id):
+    return worker.submit(
+        lambda controllers: controllers.assessment.get_grading_scale_for_course(course_id).grades
+    ).result(timeout=5)
+
+
+def test_scale_for_course_is_memoized(db, course_id, monkeypatch):
+    first = db.grading_systems.get_scale_for_course(course_id)
+
+    queries = []
+    original = db.execute
+    monkeypatch.setattr(db, 'execute', lambda *args: queries.append(args) or original(*args))
+
+    assert db.grading_systems.get_scale_for_course(course_id) is first
+    assert queries == []
+
+
+def test_update_invalidates_other_connections(db, course_id, worker):
+    assert _worker_grades(worker, course_id) == ['1', '2', '3', '4', '5', '6']
+
+    system_id = db.grading_systems.get_scale_for_course(course_id).system_id
+    db.grading_systems.update(system_id, "Noten 1-4", 1.0, 4.0, 1.0)
+
+    assert db.grading_systems.get_scale_for_course(course_id).grades == ['1', '2', '3', '4']
+    assert _worker_grades(worker, course_id) == ['1', '2', '3', '4']
+
+
+def test_template_change_invalidates_course_system(db, course_id):
+    assert db.grading_systems.get_scale_for_course(course_id).max_grade == 6.0
+
+    points_id = db.grading_systems.add("Punkte", 0.0, 15.0, 1.0)
+    template_id = db.courses.get_by_id(course_id)['template_id']
+    db.assessment_templates.update(template_id, "Mathe", "Mathe", points_id)
+
+    assert db.grading_systems.get_scale_for_course(course_id).max_grade == 15.0
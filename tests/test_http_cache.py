@@ -0,0 +1,93 @@
+# tests/test_http_cache.py
+
+"""
+HttpCache und Hintergrund-Synchronisierung gegen einen lokalen HTTP-Server.
+"""
+
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from src.models.holiday_manager import HolidayManager
+from src.models.http_cache import HttpCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(str(tmp_path / 'http_cache'))
+
+
+def test_revalidates_with_etag(cache, http_server):
+    http_server.body = [{'name': 'Osterferien'}]
+
+    assert cache.get_json(http_server.url) == [{'name': 'Osterferien'}]
+    # max-age=0: abgelaufen, also bedingter Request mit dem ETag
+    assert cache.get_json(http_server.url) == [{'name': 'Osterferien'}]
+
+    (_, first, first_status), (_, second, second_status) = http_server.requests
+    assert first_status == 200 and 'If-None-Match' not in first
+    assert second_status == 304 and second['If-None-Match'] == '"v1"'
+
+
+def test_changed_etag_replaces_entry(cache, http_server):
+    http_server.body = ['alt']
+    cache.get_json(http_server.url)
+
+    http_server.body, http_server.etag = ['neu'], '"v2"'
+    assert cache.get_json(http_server.url) == ['neu']
+    assert http_server.requests[-1][2] == 200
+
+
+def test_fresh_entry_sends_no_request(cache, http_server):
+    http_server.body = ['Sommerferien']
+    http_server.cache_control = 'max-age=60'
+
+    assert cache.get_json(http_server.url, params={'year': 2026}) == ['Sommerferien']
+    assert cache.get_json(http_server.url, params={'year': 2026}) == ['Sommerferien']
+    assert len(http_server.requests) == 1
+
+    # Andere Parameter sind ein eigener Eintrag
+    cache.get_json(http_server.url, params={'year': 2027})
+    assert len(http_server.requests) == 2
+
+
+def test_unreachable_host_fails_fast(cache, silent_server):
+    # Veralteten Eintrag für die Adresse des stummen Servers anlegen
+    path = cache._path(silent_server, None)
+    cache._save(path, {'etag': None, 'last_modified': None,
+                       'expires': 0, 'body': ['veraltet']})
+
+    # Erster Request läuft in den Timeout und liefert den alten Eintrag
+    started = time.monotonic()
+    assert cache.get_json(silent_server, timeout=0.5) == ['veraltet']
+    assert 0.4 < time.monotonic() - started < 3
+
+    # Danach wird der Host nicht mehr angefragt
+    started = time.monotonic()
+    assert cache.get_json(silent_server, timeout=5) == ['veraltet']
+    with pytest.raises(ConnectionError):
+        cache.get_json(silent_server + 'anderer-pfad', timeout=5)
+    assert time.monotonic() - started < 0.5
+
+
+def test_background_sync_reports_errors(db, cache):
+    manager = HolidayManager(db, cache=cache)
+
+    def fail(year):
+        raise RuntimeError("kaputt")
+
+    manager.fetch_year = fail
+    future = manager.start_background_sync(2026)
+    assert isinstance(future.exception(timeout=5), RuntimeError)
+
+
+def test_background_sync_loads_missing_years(db, cache, http_server):
+    http_server.body = [{'start': '2026-04-01', 'end': '2026-04-02', 'name': 'Osterferien'}]
+    manager = HolidayManager(db, cache=cache)
+    manager.FERIEN_API_URL = http_server.url
+
+    results = manager.start_background_sync(2026).result(timeout=5)
+    assert sorted(results) == [2026, 2027]
+    assert ('2026-04-01', 'Osterferien', 'vacation_day') in results[2026]['days']
+    assert results[2026]['errors'] == []
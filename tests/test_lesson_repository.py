@@ -0,0 +1,28 @@
+# tests/test_lesson_repository.py
+
+"""
+Hausaufgaben der vorherigen Stunde (einzeln und gesammelt).
+"""
+
+
+def test_previous_homework_skips_blank(db):
+    course_id = db.courses.add("Mathe 5a")
+    lesson_ids = [
+        db.execute(
+            """INSERT INTO lessons (course_id, date, time, subject, topic, homework)
+            VALUES (?, ?, '08:00', 'Mathe', 'Brüche', ?)""",
+            (course_id, date, homework)
+        ).lastrowid
+        for date, homework in [("2026-03-02", "S. 12 Nr. 3"),
+                               ("2026-03-04", ""),
+                               ("2026-03-05", "   "),
+                               ("2026-03-09", None)]
+    ]
+
+    assert db.lessons.get_previous_homework(course_id, "2026-03-09", "08:00") == "S. 12 Nr. 3"
+    assert db.lessons.get_previous_homework_batch(date="2026-03-09") == {
+        lesson_ids[-1]: "S. 12 Nr. 3"
+    }
+    assert db.lessons.get_previous_homework_batch(lesson_ids=lesson_ids[:1]) == {
+        lesson_ids[0]: None
+    }
@@ -0,0 +1,105 @@
+# tests/test_query_plans.py
+
+"""
+Prüft per EXPLAIN QUERY PLAN, dass die indizierten Zugriffspfade der
+Repositories keinen vollständigen Tabellen-Scan ausführen.
+
+Die Abfragen werden nicht nachgebaut, sondern beim Aufruf der
+Repository-Methoden mitgeschnitten.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def recorded(db, monkeypatch):
+    """Schneidet alle über db.execute() ausgeführten Statements mit."""
+    statements = []
+    original = db.execute
+
+    def execute(query, params=None):
+        statements.append((query, params))
+        return original(query, params)
+
+    monkeypatch.setattr(db, 'execute', execute)
+    return statements
+
+
+@pytest.fixture
+def lesson(db):
+    """Kurs mit einer wiederkehrenden Stunde und einer Note."""
+    course_id = db.courses.add("Mathe 5a", color="#ff0000")
+    type_id = db.execute(
+        "INSERT INTO assessment_types (course_id, name, weight) VALUES (?, ?, ?)",
+        (course_id, "Mündlich", 1.0)
+    ).lastrowid
+    student_id = db.execute(
+        "INSERT INTO students (first_name, last_name) VALUES (?, ?)",
+        ("Anna", "Muster")
+    ).lastrowid
+    lesson_id = db.execute(
+        """INSERT INTO lessons
+        (course_id, date, time, subject, topic, homework, recurring_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        (course_id, "2026-03-02", "08:00", "Mathe", "Brüche", "S. 12", "hash-1")
+    ).lastrowid
+    db.execute(
+        """INSERT INTO assessments
+        (student_id, course_id, assessment_type_id, lesson_id, grade, date)
+        VALUES (?, ?, ?, ?, ?, ?)""",
+        (student_id, course_id, type_id, lesson_id, 2.0, "2026-03-02")
+    )
+    return {'course_id': course_id, 'student_id': student_id, 'lesson_id': lesson_id}
+
+
+def _scans(db, statements, table_filter=None):
+    """Liefert alle 'SCAN <Tabelle>'-Zeilen der Query-Pläne."""
+    scans = []
+    for query, params in statements:
+        if not query.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'WITH')):
+            continue
+        plan = db.conn.execute(f"EXPLAIN QUERY PLAN {query}", params or ()).fetchall()
+        for row in plan:
+            detail = row['detail']
+            if detail.startswith('SCAN ') and (
+                    table_filter is None or detail.split()[1] in table_filter):
+                scans.append((detail, ' '.join(query.split())))
+    return scans
+
+
+def test_lessons_by_date(db, lesson, recorded):
+    db.lessons.get_by_date("2026-03-02")
+    assert recorded
+    assert _scans(db, recorded) == []
+
+
+def test_previous_homework(db, lesson, recorded):
+    db.lessons.get_previous_homework(lesson['course_id'], "2026-03-09", "08:00")
+    assert _scans(db, recorded) == []
+
+
+def test_recurring_update(db, lesson, recorded):
+    db.lessons.update(lesson['lesson_id'], {'topic': "Brüche"}, update_all_following=True)
+    assert any('recurring_hash' in query for query, _ in recorded)
+    assert _scans(db, recorded) == []
+
+
+def test_recurring_delete(db, lesson, recorded):
+    db.lessons.delete(lesson['lesson_id'], delete_all_following=True)
+    assert any('recurring_hash' in query for query, _ in recorded)
+    assert _scans(db, recorded) == []
+
+
+def test_assessment_by_student_and_lesson(db, lesson, recorded):
+    db.assessments.get_by_lesson(lesson['student_id'], lesson['lesson_id'])
+    assert _scans(db, recorded) == []
+
+
+def test_assessment_by_student_and_course(db, lesson, recorded):
+    db.assessments.get_by_student_and_course(lesson['student_id'], lesson['course_id'])
+    assert _scans(db, recorded) == []
+
+
+def test_public_holidays_by_date(db, recorded):
+    db.holidays.get_by_date_range("2026-03-01", "2026-03-31")
+    assert _scans(db, recorded, table_filter={'public_holidays', 'school_holidays'}) == []
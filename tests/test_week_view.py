@@ -0,0 +1,136 @@
+# tests/test_week_view.py
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtWidgets import QWidget
+
+from src.controllers import LessonController
+from src.controllers.read_worker import ReadWorker
+from src.models.course.course import Course
+from src.views.async_loader import AsyncLoader
+from src.views.week_view import WeekView
+
+
+class _Window(QWidget):
+    """Minimales Hauptfenster mit db und controllers wie SchoolManagement."""
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.controllers = SimpleNamespace(lesson=LessonController(db))
+
+
+@pytest.fixture
+def week_view(qapp, db):
+    view = WeekView(_Window(db))
+    yield view
+    view.parent.deleteLater()
+
+
+@pytest.fixture
+def course_id(db, week_view):
+    """Kurs mit einer Stunde in der angezeigten Woche, Woche zwischengespeichert."""
+    course_id = db.courses.add("Mathe 5a", color="#ff0000")
+    monday = week_view.week_navigator.current_week_start.toString("yyyy-MM-dd")
+    db.execute(
+        """INSERT INTO lessons (course_id, date, time, subject, topic)
+        VALUES (?, ?, ?, ?, ?)""",
+        (course_id, monday, "08:00", "Mathe", "Brüche")
+    )
+    week_view._week_cache.clear()
+    week_view.load_week(week_view.week_navigator.current_week_start)
+    return course_id
+
+
+def _cached_lessons(week_view):
+    key = week_view.week_navigator.current_week_start.toString("yyyy-MM-dd")
+    schedule = week_view._week_cache.get(key)
+    if schedule is None:
+        return None
+    return [
+        lesson
+        for by_time in schedule['lessons'].values()
+        for lessons in by_time.values()
+        for lesson in lessons
+    ]
+
+
+def test_course_update_drops_cached_week(db, week_view, course_id):
+    assert _cached_lessons(week_view)[0]['course_name'] == "Mathe 5a"
+
+    db.courses.update(course_id, "Mathe 5b", color="#00ff00")
+
+    assert _cached_lessons(week_view) is None
+    week_view.load_week(week_view.week_navigator.current_week_start)
+    assert _cached_lessons(week_view)[0]['course_name'] == "Mathe 5b"
+    assert _cached_lessons(week_view)[0]['course_color'] == "#00ff00"
+
+
+def test_course_model_update_drops_cached_week(db, week_view, course_id):
+    course = Course.get_by_id(db, course_id)
+    course.name = "Mathe 5c"
+    course.update(db)
+
+    assert _cached_lessons(week_view) is None
+
+
+def test_course_delete_drops_cached_week(db, week_view, course_id):
+    db.courses.delete(course_id)
+
+    assert _cached_lessons(week_view) is None
+    week_view.load_week(week_view.week_navigator.current_week_start)
+    assert _cached_lessons(week_view) == []
+
+
+@pytest.fixture
+def loading_view(qapp, db):
+    """WeekView, deren Hauptfenster einen ReadWorker samt AsyncLoader hat."""
+    window = _Window(db)
+    window.db_worker = ReadWorker(db.db_file)
+    window.loader = AsyncLoader(window.db_worker, window)
+    view = WeekView(window)
+    yield view
+    window.db_worker.shutdown()
+    window.deleteLater()
+
+
+def _wait_for(qapp, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_adjacent_weeks_prefetched_in_background(qapp, db, loading_view, monkeypatch):
+    monday = loading_view.week_navigator.current_week_start
+    keys = [monday.addDays(offset).toString("yyyy-MM-dd") for offset in (-7, 0, 7)]
+    gui_calls = []
+    original = loading_view.parent.controllers.lesson.get_week_schedule
+    monkeypatch.setattr(
+        loading_view.parent.controllers.lesson, 'get_week_schedule',
+        lambda start, end: gui_calls.append(start) or original(start, end)
+    )
+
+    loading_view._week_cache.clear()
+    loading_view.update_view(monday)
+
+    assert _wait_for(qapp, lambda: all(key in loading_view._week_cache for key in keys))
+    # Im GUI-Thread wird nur die angezeigte Woche abgefragt
+    assert gui_calls == [keys[1]]
+
+
+def test_prefetch_dropped_after_change(qapp, db, loading_view):
+    monday = loading_view.week_navigator.current_week_start
+    next_key = monday.addDays(7).toString("yyyy-MM-dd")
+    loading_view._week_cache.clear()
+
+    loading_view.prefetch_adjacent_weeks(monday)
+    # Änderung, bevor das Ergebnis im GUI-Thread ankommt
+    loading_view.on_data_changed('lessons', None, None)
+
+    loading_view.parent.db_worker.submit(lambda controllers: None).result(timeout=5)
+    _wait_for(qapp, lambda: not loading_view.parent.loader._pending, timeout=2)
+    assert next_key not in loading_view._week_cache